@@ -28,3 +28,54 @@ FRONTEND_ORIGINS = _get_list(
         "http://127.0.0.1:3000",
     ],
 )
+
+# Per-process read-through cache in front of the Postgres course repository.
+# Hits are revalidated against the course version; TTL bounds how long an
+# entry is kept before a full reload, and 0 disables expiry.
+COURSE_CACHE_ENABLED = _get_bool("COURSE_CACHE_ENABLED", True)
+COURSE_CACHE_MAX_ENTRIES = int(os.getenv("COURSE_CACHE_MAX_ENTRIES", "512"))
+COURSE_CACHE_TTL_SECONDS = float(os.getenv("COURSE_CACHE_TTL_SECONDS", "30"))
+
+# Embedded persistence for the non-Postgres repositories: an append-only log
+# plus snapshots in this directory. Unset keeps the plain in-memory repos.
+EMBEDDED_STORE_PATH = os.getenv("EMBEDDED_STORE_PATH", "").strip() or None
+EMBEDDED_STORE_SNAPSHOT_EVERY = int(os.getenv("EMBEDDED_STORE_SNAPSHOT_EVERY", "10000"))
+# How long a group-commit leader waits for more writers before syncing; 0 syncs at once.
+EMBEDDED_STORE_COMMIT_DELAY_MS = float(os.getenv("EMBEDDED_STORE_COMMIT_DELAY_MS", "0"))
+
+# Background extraction jobs (POST /extraction/jobs), per API process.
+EXTRACTION_JOB_WORKERS = int(os.getenv("EXTRACTION_JOB_WORKERS", "2"))
+EXTRACTION_JOB_MAX_QUEUED = int(os.getenv("EXTRACTION_JOB_MAX_QUEUED", "32"))
+EXTRACTION_JOB_MAX_PER_USER = int(os.getenv("EXTRACTION_JOB_MAX_PER_USER", "3"))
+EXTRACTION_JOB_RETENTION_SECONDS = float(os.getenv("EXTRACTION_JOB_RETENTION_SECONDS", "900"))
+
+# Extraction executors: text extraction/OCR runs in worker processes (0 = a
+# thread pool in the API process), the LLM stage on threads. The parse pool
+# is the only process pool: long PDFs are split into page tasks on it, and
+# workers never start pools of their own, so each API worker process runs at
+# most EXTRACTION_PARSE_PROCESSES extraction processes.
+EXTRACTION_PARSE_PROCESSES = int(os.getenv("EXTRACTION_PARSE_PROCESSES", str(min(4, os.cpu_count() or 1))))
+EXTRACTION_LLM_THREADS = int(os.getenv("EXTRACTION_LLM_THREADS", "8"))
+EXTRACTION_PARSE_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_PARSE_TIMEOUT_SECONDS", "60"))
+EXTRACTION_LLM_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_LLM_TIMEOUT_SECONDS", "180"))
+
+# Disk cache of finished extraction results, keyed on the uploaded bytes and
+# shared by every worker that points at the same directory. Unset disables it.
+EXTRACTION_CACHE_PATH = os.getenv("EXTRACTION_CACHE_PATH", "").strip()
+EXTRACTION_CACHE_MAX_MB = int(os.getenv("EXTRACTION_CACHE_MAX_MB", "256"))
+
+# PDF text extraction: documents with at least PDF_PARALLEL_MIN_PAGES pages
+# are split into page chunks across the parse pool; shorter ones are one task.
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "12"))
+
+# Lazy PDF ingestion: stop reading once the grading and schedule sections
+# have been found, plus this many pages. The full-text retry re-reads the rest.
+PDF_EARLY_STOP_ENABLED = _get_bool("PDF_EARLY_STOP_ENABLED", True)
+PDF_EARLY_STOP_MARGIN_PAGES = int(os.getenv("PDF_EARLY_STOP_MARGIN_PAGES", "2"))
+
+# OCR of scanned PDFs: one page per task on the parse pool, rendered at
+# OCR_BASE_DPI and redone at OCR_RETRY_DPI when the mean word confidence
+# (0-100) is below OCR_MIN_CONFIDENCE.
+OCR_BASE_DPI = int(os.getenv("OCR_BASE_DPI", "150"))
+OCR_RETRY_DPI = int(os.getenv("OCR_RETRY_DPI", "300"))
+OCR_MIN_CONFIDENCE = float(os.getenv("OCR_MIN_CONFIDENCE", "70"))
@@ -0,0 +1,90 @@
+"""Async engine plus the bridge that runs the Postgres repositories on it.
+
+The services and repositories are synchronous and shared with the in-memory
+backend. Rather than keeping a second coroutine copy of every query, async
+routes call ``run_in_async_session``: the synchronous code runs inside
+SQLAlchemy's greenlet bridge, and each statement executes on the async
+engine (psycopg async driver). While a query waits on Postgres, the worker's
+event loop keeps serving other requests, and no threadpool thread is held.
+
+The async engine has its own pool, sized by ``POSTGRES_ASYNC_POOL_SIZE`` and
+``POSTGRES_ASYNC_MAX_OVERFLOW``. The sync pool (``POSTGRES_POOL_SIZE``)
+still serves startup, scripts and sync routes, so with async I/O on it can
+be kept small.
+"""
+
+import contextvars
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db import DATABASE_URL, SessionLocal, _engine_kwargs
+from app.db_pool import InstrumentedAsyncAdaptedQueuePool
+
+T = TypeVar("T")
+
+_in_async_bridge: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "evalio_in_async_bridge",
+    default=False,
+)
+_init_lock = threading.Lock()
+_async_engine: AsyncEngine | None = None
+_async_sessions: async_sessionmaker | None = None
+_bridged_sessions: sessionmaker | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_sessions, _bridged_sessions
+    if _async_engine is None:
+        with _init_lock:
+            if _async_engine is None:
+                async_engine = create_async_engine(
+                    DATABASE_URL,
+                    **_engine_kwargs(
+                        InstrumentedAsyncAdaptedQueuePool,
+                        pool_env_prefix="POSTGRES_ASYNC",
+                    ),
+                )
+                _async_sessions = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+                _bridged_sessions = sessionmaker(
+                    bind=async_engine.sync_engine,
+                    autocommit=False,
+                    autoflush=False,
+                )
+                _async_engine = async_engine
+    return _async_engine
+
+
+def bridged_session_factory() -> Session:
+    """Session factory for Postgres repositories used from async routes.
+
+    Inside ``run_in_async_session`` it returns a session on the async engine.
+    Everywhere else (startup, scripts, sync routes) it returns a regular
+    ``SessionLocal()`` session.
+    """
+    if _in_async_bridge.get():
+        get_async_engine()
+        return _bridged_sessions()
+    return SessionLocal()
+
+
+async def run_in_async_session(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    get_async_engine()
+    token = _in_async_bridge.set(True)
+    try:
+        async with _async_sessions() as session:
+            return await session.run_sync(lambda _sync_session: fn(*args, **kwargs))
+    finally:
+        _in_async_bridge.reset(token)
+
+
+def async_pool_stats() -> dict[str, float | int] | None:
+    if _async_engine is None:
+        return None
+    pool = _async_engine.pool
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return None
+    return pool.stats()
@@ -0,0 +1,94 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """Process-wide counters for connection pool checkouts."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkout_wait_seconds_total = 0.0
+            self.checkout_wait_seconds_max = 0.0
+            self.checkout_timeouts = 0
+            self.overflow_events = 0
+
+    def record_checkout(self, wait_seconds: float, *, overflowed: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_seconds_total += wait_seconds
+            if wait_seconds > self.checkout_wait_seconds_max:
+                self.checkout_wait_seconds_max = wait_seconds
+            if overflowed:
+                self.overflow_events += 1
+
+    def record_timeout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+            self.checkout_wait_seconds_total += wait_seconds
+            if wait_seconds > self.checkout_wait_seconds_max:
+                self.checkout_wait_seconds_max = wait_seconds
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            average = (
+                self.checkout_wait_seconds_total / self.checkouts if self.checkouts else 0.0
+            )
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "checkout_wait_ms_avg": round(average * 1000, 3),
+                "checkout_wait_ms_max": round(self.checkout_wait_seconds_max * 1000, 3),
+                "checkout_wait_ms_total": round(self.checkout_wait_seconds_total * 1000, 3),
+                "overflow_events": self.overflow_events,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection.
+
+    Wait time covers queueing for a free slot as well as opening a new
+    connection. A checkout counts as an overflow event when it leaves the pool
+    with more connections open than ``pool_size``.
+    """
+
+    def __init__(self, *args, metrics: PoolMetrics | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics if metrics is not None else PoolMetrics()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        recreated = super().recreate()
+        recreated.metrics = self.metrics
+        return recreated
+
+    def _do_get(self):
+        overflow_before = self.overflow()
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+        overflowed = self.overflow() > max(overflow_before, 0)
+        self.metrics.record_checkout(time.perf_counter() - started, overflowed=overflowed)
+        return connection
+
+    def stats(self) -> dict[str, float | int]:
+        return {
+            "pool_size": self.size(),
+            "in_use": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            **self.metrics.snapshot(),
+        }
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Same instrumentation for the pool behind the async engine."""
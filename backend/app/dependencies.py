@@ -1,10 +1,38 @@
+import functools
 import os
 import warnings
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from fastapi import Depends, HTTPException, Request, status
-
-from app.config import AUTH_COOKIE_NAME
+from starlette.concurrency import run_in_threadpool
+
+from app.config import (
+    AUTH_COOKIE_NAME,
+    COURSE_CACHE_ENABLED,
+    COURSE_CACHE_MAX_ENTRIES,
+    COURSE_CACHE_TTL_SECONDS,
+    EMBEDDED_STORE_COMMIT_DELAY_MS,
+    EMBEDDED_STORE_PATH,
+    EMBEDDED_STORE_SNAPSHOT_EVERY,
+    EXTRACTION_CACHE_MAX_MB,
+    EXTRACTION_CACHE_PATH,
+    EXTRACTION_JOB_MAX_PER_USER,
+    EXTRACTION_JOB_MAX_QUEUED,
+    EXTRACTION_JOB_RETENTION_SECONDS,
+    EXTRACTION_JOB_WORKERS,
+    EXTRACTION_LLM_THREADS,
+    EXTRACTION_LLM_TIMEOUT_SECONDS,
+    EXTRACTION_PARSE_PROCESSES,
+    EXTRACTION_PARSE_TIMEOUT_SECONDS,
+)
+from app.repositories.async_adapter import AsyncRepositoryAdapter
 from app.repositories.base import (
+    AsyncCourseRepository,
+    AsyncDeadlineRepository,
+    AsyncGradeTargetRepository,
+    AsyncScenarioRepository,
+    AsyncUserRepository,
     CalendarConnectionRepository,
     CourseRepository,
     DeadlineRepository,
@@ -12,6 +40,16 @@ from app.repositories.base import (
     ScenarioRepository,
     UserRepository,
 )
+from app.repositories.caching_course_repo import CachingCourseRepository
+from app.repositories.embedded_repos import (
+    EmbeddedCalendarRepository,
+    EmbeddedCourseRepository,
+    EmbeddedDeadlineRepository,
+    EmbeddedGradeTargetRepository,
+    EmbeddedScenarioRepository,
+    EmbeddedUserRepository,
+)
+from app.repositories.embedded_store import EmbeddedStore
 from app.repositories.inmemory_calendar_repo import InMemoryCalendarRepository
 from app.repositories.inmemory_course_repo import InMemoryCourseRepository
 from app.repositories.inmemory_deadline_repo import InMemoryDeadlineRepository
@@ -21,6 +59,9 @@ from app.repositories.inmemory_user_repo import InMemoryUserRepository
 from app.services.auth_service import AuthService, AuthenticatedUser, AuthenticationError
 from app.services.course_service import CourseService
 from app.services.deadline_service import DeadlineService
+from app.services.extraction.executors import ExtractionExecutors
+from app.services.extraction.result_cache import ExtractionResultCache
+from app.services.extraction_jobs import ExtractionJobQueue
 from app.services.extraction_service import ExtractionService
 from app.services.planning_service import PlanningService
 from app.services.scenario_service import ScenarioService
@@ -39,12 +80,56 @@ def _allow_postgres_fallback() -> bool:
     return _is_truthy_env(raw)
 
 
+def _use_postgres_async_io() -> bool:
+    raw = os.getenv("POSTGRES_ASYNC_IO")
+    if raw is None:
+        return True
+    return _is_truthy_env(raw)
+
+
+def _postgres_session_factory():
+    if _use_postgres_async_io():
+        from app.db_async import bridged_session_factory
+
+        return bridged_session_factory
+    from app.db import SessionLocal
+
+    return SessionLocal
+
+
+_embedded_store = (
+    EmbeddedStore(
+        EMBEDDED_STORE_PATH,
+        snapshot_every=EMBEDDED_STORE_SNAPSHOT_EVERY,
+        commit_delay_seconds=EMBEDDED_STORE_COMMIT_DELAY_MS / 1000,
+    )
+    if EMBEDDED_STORE_PATH
+    else None
+)
+
+R = TypeVar("R")
+
+
+def _memory_repo(in_memory: Callable[[], R], embedded: Callable[[EmbeddedStore], R]) -> R:
+    """Repository used when Postgres is off or unavailable."""
+    if _embedded_store is None:
+        return in_memory()
+    return embedded(_embedded_store)
+
+
 def _build_course_repo() -> CourseRepository:
     if _is_truthy_env(os.getenv("USE_POSTGRES")):
         try:
             from app.repositories.postgres_course_repo import PostgresCourseRepository
 
-            return PostgresCourseRepository()
+            repository = PostgresCourseRepository(session_factory=_postgres_session_factory())
+            if COURSE_CACHE_ENABLED:
+                return CachingCourseRepository(
+                    repository,
+                    max_entries=COURSE_CACHE_MAX_ENTRIES,
+                    ttl_seconds=COURSE_CACHE_TTL_SECONDS,
+                )
+            return repository
         except Exception as exc:
             if not _allow_postgres_fallback():
                 raise
@@ -53,8 +138,8 @@ def _build_course_repo() -> CourseRepository:
                 f"Falling back to InMemoryCourseRepository. Reason: {exc}",
                 RuntimeWarning,
             )
-            return InMemoryCourseRepository()
-    return InMemoryCourseRepository()
+            return _memory_repo(InMemoryCourseRepository, EmbeddedCourseRepository)
+    return _memory_repo(InMemoryCourseRepository, EmbeddedCourseRepository)
 
 
 def _build_deadline_repo() -> DeadlineRepository:
@@ -62,7 +147,7 @@ def _build_deadline_repo() -> DeadlineRepository:
         try:
             from app.repositories.postgres_deadline_repo import PostgresDeadlineRepository
 
-            return PostgresDeadlineRepository()
+            return PostgresDeadlineRepository(session_factory=_postgres_session_factory())
         except Exception as exc:
             if not _allow_postgres_fallback():
                 raise
@@ -71,8 +156,8 @@ def _build_deadline_repo() -> DeadlineRepository:
                 f"Falling back to InMemoryDeadlineRepository. Reason: {exc}",
                 RuntimeWarning,
             )
-            return InMemoryDeadlineRepository()
-    return InMemoryDeadlineRepository()
+            return _memory_repo(InMemoryDeadlineRepository, EmbeddedDeadlineRepository)
+    return _memory_repo(InMemoryDeadlineRepository, EmbeddedDeadlineRepository)
 
 
 def _build_user_repo() -> UserRepository:
@@ -80,7 +165,7 @@ def _build_user_repo() -> UserRepository:
         try:
             from app.repositories.postgres_user_repo import PostgresUserRepository
 
-            return PostgresUserRepository()
+            return PostgresUserRepository(session_factory=_postgres_session_factory())
         except Exception as exc:
             if not _allow_postgres_fallback():
                 raise
@@ -89,8 +174,8 @@ def _build_user_repo() -> UserRepository:
                 f"Falling back to InMemoryUserRepository. Reason: {exc}",
                 RuntimeWarning,
             )
-            return InMemoryUserRepository()
-    return InMemoryUserRepository()
+            return _memory_repo(InMemoryUserRepository, EmbeddedUserRepository)
+    return _memory_repo(InMemoryUserRepository, EmbeddedUserRepository)
 
 
 def _build_scenario_repo() -> ScenarioRepository:
@@ -98,7 +183,7 @@ def _build_scenario_repo() -> ScenarioRepository:
         try:
             from app.repositories.postgres_scenario_repo import PostgresScenarioRepository
 
-            return PostgresScenarioRepository()
+            return PostgresScenarioRepository(session_factory=_postgres_session_factory())
         except Exception as exc:
             if not _allow_postgres_fallback():
                 raise
@@ -107,8 +192,8 @@ def _build_scenario_repo() -> ScenarioRepository:
                 f"Falling back to InMemoryScenarioRepository. Reason: {exc}",
                 RuntimeWarning,
             )
-            return InMemoryScenarioRepository()
-    return InMemoryScenarioRepository()
+            return _memory_repo(InMemoryScenarioRepository, EmbeddedScenarioRepository)
+    return _memory_repo(InMemoryScenarioRepository, EmbeddedScenarioRepository)
 
 
 def _build_calendar_repo() -> CalendarConnectionRepository:
@@ -116,7 +201,7 @@ def _build_calendar_repo() -> CalendarConnectionRepository:
         try:
             from app.repositories.postgres_calendar_repo import PostgresCalendarRepository
 
-            return PostgresCalendarRepository()
+            return PostgresCalendarRepository(session_factory=_postgres_session_factory())
         except Exception as exc:
             if not _allow_postgres_fallback():
                 raise
@@ -125,8 +210,8 @@ def _build_calendar_repo() -> CalendarConnectionRepository:
                 f"Falling back to InMemoryCalendarRepository. Reason: {exc}",
                 RuntimeWarning,
             )
-            return InMemoryCalendarRepository()
-    return InMemoryCalendarRepository()
+            return _memory_repo(InMemoryCalendarRepository, EmbeddedCalendarRepository)
+    return _memory_repo(InMemoryCalendarRepository, EmbeddedCalendarRepository)
 
 
 def _build_grade_target_repo() -> GradeTargetRepository:
@@ -134,7 +219,7 @@ def _build_grade_target_repo() -> GradeTargetRepository:
         try:
             from app.repositories.postgres_grade_target_repo import PostgresGradeTargetRepository
 
-            return PostgresGradeTargetRepository()
+            return PostgresGradeTargetRepository(session_factory=_postgres_session_factory())
         except Exception as exc:
             if not _allow_postgres_fallback():
                 raise
@@ -143,8 +228,8 @@ def _build_grade_target_repo() -> GradeTargetRepository:
                 f"Falling back to InMemoryGradeTargetRepository. Reason: {exc}",
                 RuntimeWarning,
             )
-            return InMemoryGradeTargetRepository()
-    return InMemoryGradeTargetRepository()
+            return _memory_repo(InMemoryGradeTargetRepository, EmbeddedGradeTargetRepository)
+    return _memory_repo(InMemoryGradeTargetRepository, EmbeddedGradeTargetRepository)
 
 
 _course_repo = _build_course_repo()
@@ -153,9 +238,67 @@ _deadline_repo = _build_deadline_repo()
 _scenario_repo = _build_scenario_repo()
 _calendar_repo = _build_calendar_repo()
 _grade_target_repo = _build_grade_target_repo()
+_postgres_active = not (
+    isinstance(_course_repo, InMemoryCourseRepository)
+    and isinstance(_user_repo, InMemoryUserRepository)
+    and isinstance(_deadline_repo, InMemoryDeadlineRepository)
+    and isinstance(_scenario_repo, InMemoryScenarioRepository)
+    and isinstance(_calendar_repo, InMemoryCalendarRepository)
+    and isinstance(_grade_target_repo, InMemoryGradeTargetRepository)
+)
+_postgres_async_io = _postgres_active and _use_postgres_async_io()
+if _embedded_store is not None:
+    _embedded_store.open()
+
+T = TypeVar("T")
+
+
+async def run_db(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous service/repository call from an ``async def`` route.
+
+    - In-memory storage: runs inline, since nothing blocks.
+    - Embedded store: runs on the threadpool, since writes wait for fsync.
+    - Postgres: runs on the async engine (see ``app.db_async``).
+    - Postgres with ``POSTGRES_ASYNC_IO=false``: runs on the threadpool.
+    """
+    if not _postgres_active:
+        if _embedded_store is not None:
+            return await run_in_threadpool(functools.partial(fn, *args, **kwargs))
+        return fn(*args, **kwargs)
+    if _postgres_async_io:
+        from app.db_async import run_in_async_session
+
+        return await run_in_async_session(fn, *args, **kwargs)
+    return await run_in_threadpool(functools.partial(fn, *args, **kwargs))
+
+
+_async_course_repo = AsyncRepositoryAdapter(_course_repo, run_db)
+_async_user_repo = AsyncRepositoryAdapter(_user_repo, run_db)
+_async_deadline_repo = AsyncRepositoryAdapter(_deadline_repo, run_db)
+_async_scenario_repo = AsyncRepositoryAdapter(_scenario_repo, run_db)
+_async_grade_target_repo = AsyncRepositoryAdapter(_grade_target_repo, run_db)
 _course_service = CourseService(_course_repo)
 _auth_service = AuthService(_user_repo)
 _extraction_service = ExtractionService()
+_extraction_result_cache = (
+    ExtractionResultCache(EXTRACTION_CACHE_PATH, max_bytes=EXTRACTION_CACHE_MAX_MB * 1024 * 1024)
+    if EXTRACTION_CACHE_PATH
+    else None
+)
+_extraction_executors = ExtractionExecutors(
+    parse_processes=EXTRACTION_PARSE_PROCESSES,
+    llm_threads=EXTRACTION_LLM_THREADS,
+    parse_timeout_seconds=EXTRACTION_PARSE_TIMEOUT_SECONDS,
+    llm_timeout_seconds=EXTRACTION_LLM_TIMEOUT_SECONDS,
+    result_cache=_extraction_result_cache,
+)
+_extraction_jobs = ExtractionJobQueue(
+    functools.partial(_extraction_executors.extract_blocking, _extraction_service),
+    workers=EXTRACTION_JOB_WORKERS,
+    max_queued=EXTRACTION_JOB_MAX_QUEUED,
+    max_active_per_user=EXTRACTION_JOB_MAX_PER_USER,
+    retention_seconds=EXTRACTION_JOB_RETENTION_SECONDS,
+)
 _deadline_service = DeadlineService(_deadline_repo, _calendar_repo, _course_service)
 _scenario_service = ScenarioService(_scenario_repo, _course_service)
 _planning_service = PlanningService(
@@ -165,6 +308,12 @@ _planning_service = PlanningService(
 )
 
 
+def close_storage() -> None:
+    """Flush and snapshot the embedded store; called on app shutdown."""
+    if _embedded_store is not None:
+        _embedded_store.close()
+
+
 def get_course_repo() -> CourseRepository:
     return _course_repo
 
@@ -185,6 +334,18 @@ def get_extraction_service() -> ExtractionService:
     return _extraction_service
 
 
+def get_extraction_executors() -> ExtractionExecutors:
+    return _extraction_executors
+
+
+def get_extraction_result_cache() -> ExtractionResultCache | None:
+    return _extraction_result_cache
+
+
+def get_extraction_job_queue() -> ExtractionJobQueue:
+    return _extraction_jobs
+
+
 def get_deadline_service() -> DeadlineService:
     return _deadline_service
 
@@ -213,7 +374,27 @@ def get_grade_target_repo() -> GradeTargetRepository:
     return _grade_target_repo
 
 
-def get_current_user(
+def get_async_course_repo() -> AsyncCourseRepository:
+    return _async_course_repo
+
+
+def get_async_user_repo() -> AsyncUserRepository:
+    return _async_user_repo
+
+
+def get_async_deadline_repo() -> AsyncDeadlineRepository:
+    return _async_deadline_repo
+
+
+def get_async_scenario_repo() -> AsyncScenarioRepository:
+    return _async_scenario_repo
+
+
+def get_async_grade_target_repo() -> AsyncGradeTargetRepository:
+    return _async_grade_target_repo
+
+
+async def get_current_user(
     request: Request,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> AuthenticatedUser:
@@ -225,7 +406,7 @@ def get_current_user(
         )
 
     try:
-        return auth_service.get_current_user(token)
+        return await run_db(auth_service.get_current_user, token)
     except AuthenticationError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
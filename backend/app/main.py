@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -6,6 +7,14 @@ load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.dependencies import (
+    close_storage,
+    get_extraction_executors,
+    get_extraction_job_queue,
+    get_extraction_result_cache,
+    get_extraction_service,
+)
+from app.pagination import NEXT_CURSOR_HEADER
 from app.routes.auth import router as auth_router
 from app.routes.courses import router as courses_router
 from app.routes.extraction import router as extraction_router
@@ -15,7 +24,17 @@ from app.routes.deadlines import router as deadlines_router
 from app.routes.planning import router as planning_router
 from app.routes.scenarios import router as scenarios_router
 
-app = FastAPI(title="Evalio API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    get_extraction_job_queue().shutdown()
+    # After the job queue: its workers submit to these pools.
+    get_extraction_executors().shutdown()
+    close_storage()
+
+
+app = FastAPI(title="Evalio API", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +51,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # register routes
@@ -47,3 +67,36 @@ app.include_router(scenarios_router)
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@app.get("/health/db-pool")
+def db_pool_health():
+    # Pool occupancy and checkout wait counters; pool stays empty when the
+    # app runs on in-memory repositories.
+    from app.db import pool_stats
+    from app.db_async import async_pool_stats
+
+    stats = pool_stats()
+    return {
+        "enabled": stats is not None,
+        **(stats or {}),
+        "async": async_pool_stats(),
+    }
+
+
+@app.get("/health/extraction-jobs")
+def extraction_jobs_health():
+    # Queue depth, in-flight jobs and rejection counts for this API process.
+    return get_extraction_job_queue().stats()
+
+
+@app.get("/health/extraction-cache")
+def extraction_cache_health():
+    # Result-cache entries and bytes are shared by every worker; hit/miss
+    # counters and the LLM payload cache are per process.
+    cache = get_extraction_result_cache()
+    return {
+        "enabled": cache is not None,
+        **(cache.stats() if cache is not None else {}),
+        "llm_payloads": get_extraction_service().llm_cache_stats(),
+    }
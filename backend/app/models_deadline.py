@@ -131,6 +131,7 @@ class DeadlineExportRequest(BaseModel):
 class DeadlineListResponse(BaseModel):
     deadlines: list[Deadline]
     count: int
+    next_cursor: Optional[str] = None
 
 
 class DeadlineExportResponse(BaseModel):
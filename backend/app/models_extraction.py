@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -55,4 +57,15 @@ class ExtractionResponse(BaseModel):
     message: str
 
 
+class ExtractionJobResponse(BaseModel):
+    job_id: UUID
+    status: Literal["queued", "running", "succeeded", "failed"]
+    filename: str
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[ExtractionResponse] = None
+    error: Optional[str] = None
+
+
 ExtractionAssessment.model_rebuild()
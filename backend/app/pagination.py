@@ -0,0 +1,41 @@
+"""Opaque keyset cursors for the paginated list endpoints.
+
+A cursor is the sort key of the last item on a page, so the next page is a
+plain ``WHERE (key) > (cursor) ORDER BY key LIMIT n`` rather than an OFFSET
+scan. Clients must treat the token as opaque.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Carries the next cursor for endpoints whose body is a bare list.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(*values: object) -> str:
+    raw = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> list[str]:
+    """Return the ``size`` string parts of ``token``, or raise ``InvalidCursorError``."""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(isinstance(value, str) for value in values)
+    ):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return values
@@ -0,0 +1,33 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+DbRunner = Callable[..., Awaitable[Any]]
+
+
+class AsyncRepositoryAdapter:
+    """Awaitable view of a synchronous repository.
+
+    Every method call is handed to ``runner`` (see ``app.dependencies.run_db``),
+    which decides where it executes. Postgres repositories run on the async
+    engine; in-memory repositories run inline. Use this from ``async def`` routes
+    instead of calling the repository directly, which would block the loop.
+    """
+
+    def __init__(self, repository: Any, runner: DbRunner) -> None:
+        self._repository = repository
+        self._runner = runner
+
+    @property
+    def repository(self) -> Any:
+        return self._repository
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if not callable(attribute):
+            return attribute
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return await self._runner(attribute, *args, **kwargs)
+
+        _call.__name__ = name
+        return _call
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Protocol
 from uuid import UUID
 
@@ -7,10 +7,35 @@ from app.models import CourseCreate
 from app.models_deadline import Deadline, DeadlineCreate, DeadlineUpdate
 
 
+# Keyset positions for paginated listings: the sort key of the last row seen.
+CourseCursor = tuple[datetime, UUID]
+DeadlineCursor = tuple[date, datetime, UUID]
+
+
 @dataclass(frozen=True)
 class StoredCourse:
     course_id: UUID
     course: CourseCreate
+    version: int = 1
+    created_at: datetime | None = None
+
+
+@dataclass(frozen=True)
+class StoredCourseSummary:
+    course_id: UUID
+    name: str
+    term: str | None
+    assessment_count: int
+    created_at: datetime | None = None
+
+
+class CourseVersionConflictError(Exception):
+    """Raised when a course update's expected version is no longer current."""
+
+    def __init__(self, course_id: UUID, expected_version: int) -> None:
+        super().__init__(f"Course {course_id} changed since version {expected_version}")
+        self.course_id = course_id
+        self.expected_version = expected_version
 
 
 @dataclass(frozen=True)
@@ -60,10 +85,44 @@ class CourseRepository(Protocol):
     def list_all(self, user_id: UUID) -> list[StoredCourse]:
         ...
 
+    def list_page(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourse]:
+        """Up to ``limit`` courses ordered by ``(created_at, course_id)``, strictly after ``after``."""
+        ...
+
+    def list_summaries(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None = None,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourseSummary]:
+        """Name, term and top-level assessment count per course, in ``list_page`` order."""
+        ...
+
     def get_by_id(self, user_id: UUID, course_id: UUID) -> StoredCourse | None:
         ...
 
-    def update(self, user_id: UUID, course_id: UUID, course: CourseCreate) -> StoredCourse:
+    def update(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        course: CourseCreate,
+        expected_version: int | None = None,
+    ) -> StoredCourse:
+        """Replace the aggregate and bump its version.
+
+        With ``expected_version``, raises ``CourseVersionConflictError`` when the
+        stored version differs (compare-and-set).
+        """
+        ...
+
+    def get_version(self, user_id: UUID, course_id: UUID) -> int | None:
         ...
 
     def delete(self, user_id: UUID, course_id: UUID) -> None:
@@ -94,9 +153,32 @@ class DeadlineRepository(Protocol):
     def create(self, user_id: UUID, course_id: UUID, data: DeadlineCreate) -> Deadline:
         ...
 
+    def create_many(self, user_id: UUID, course_id: UUID, items: list[DeadlineCreate]) -> list[Deadline]:
+        """Create all ``items`` atomically, returning them in input order."""
+        ...
+
     def list_all(self, user_id: UUID, course_id: UUID) -> list[Deadline]:
         ...
 
+    def list_page(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        *,
+        limit: int,
+        after: DeadlineCursor | None = None,
+    ) -> list[Deadline]:
+        """Up to ``limit`` deadlines ordered by ``(due_date, created_at, deadline_id)``, after ``after``."""
+        ...
+
+    def list_in_range(self, user_id: UUID, start_date: date, end_date: date) -> list[Deadline]:
+        """All of the user's deadlines, across courses, due within ``[start_date, end_date]``."""
+        ...
+
+    def list_for_user(self, user_id: UUID) -> list[Deadline]:
+        """All of the user's deadlines, across courses."""
+        ...
+
     def get_by_id(self, user_id: UUID, course_id: UUID, deadline_id: UUID) -> Deadline | None:
         ...
 
@@ -205,8 +287,157 @@ class GradeTargetRepository(Protocol):
     def get_target(self, user_id: UUID, course_id: UUID) -> StoredGradeTarget | None:
         ...
 
+    def list_targets(self, user_id: UUID) -> list[StoredGradeTarget]:
+        """Targets for every course the user owns."""
+        ...
+
     def delete_target(self, user_id: UUID, course_id: UUID) -> bool:
         ...
 
     def clear(self) -> None:
         ...
+
+
+# Async views of the repositories above, awaited from ``async def`` routes.
+# See ``app.repositories.async_adapter.AsyncRepositoryAdapter``.
+
+
+class AsyncCourseRepository(Protocol):
+    async def create(self, user_id: UUID, course: CourseCreate) -> StoredCourse:
+        ...
+
+    async def list_all(self, user_id: UUID) -> list[StoredCourse]:
+        ...
+
+    async def list_page(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourse]:
+        ...
+
+    async def list_summaries(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None = None,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourseSummary]:
+        ...
+
+    async def get_by_id(self, user_id: UUID, course_id: UUID) -> StoredCourse | None:
+        ...
+
+    async def update(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        course: CourseCreate,
+        expected_version: int | None = None,
+    ) -> StoredCourse:
+        ...
+
+    async def get_version(self, user_id: UUID, course_id: UUID) -> int | None:
+        ...
+
+    async def delete(self, user_id: UUID, course_id: UUID) -> None:
+        ...
+
+    async def get_index(self, user_id: UUID, course_id: UUID) -> int | None:
+        ...
+
+
+class AsyncUserRepository(Protocol):
+    async def create_user(self, email: str, password_hash: str) -> StoredUser:
+        ...
+
+    async def get_by_email(self, email: str) -> StoredUser | None:
+        ...
+
+    async def get_by_id(self, user_id: UUID) -> StoredUser | None:
+        ...
+
+
+class AsyncDeadlineRepository(Protocol):
+    async def create(self, user_id: UUID, course_id: UUID, data: DeadlineCreate) -> Deadline:
+        ...
+
+    async def create_many(
+        self, user_id: UUID, course_id: UUID, items: list[DeadlineCreate]
+    ) -> list[Deadline]:
+        ...
+
+    async def list_all(self, user_id: UUID, course_id: UUID) -> list[Deadline]:
+        ...
+
+    async def list_page(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        *,
+        limit: int,
+        after: DeadlineCursor | None = None,
+    ) -> list[Deadline]:
+        ...
+
+    async def list_in_range(self, user_id: UUID, start_date: date, end_date: date) -> list[Deadline]:
+        ...
+
+    async def list_for_user(self, user_id: UUID) -> list[Deadline]:
+        ...
+
+    async def get_by_id(self, user_id: UUID, course_id: UUID, deadline_id: UUID) -> Deadline | None:
+        ...
+
+    async def update(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        deadline_id: UUID,
+        data: DeadlineUpdate,
+    ) -> Deadline | None:
+        ...
+
+    async def delete(self, user_id: UUID, course_id: UUID, deadline_id: UUID) -> bool:
+        ...
+
+
+class AsyncScenarioRepository(Protocol):
+    async def create(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        name: str,
+        entries: list[StoredScenarioEntry],
+    ) -> StoredScenario:
+        ...
+
+    async def list_all(self, user_id: UUID, course_id: UUID) -> list[StoredScenario]:
+        ...
+
+    async def get_by_id(self, user_id: UUID, course_id: UUID, scenario_id: UUID) -> StoredScenario | None:
+        ...
+
+    async def delete(self, user_id: UUID, course_id: UUID, scenario_id: UUID) -> bool:
+        ...
+
+
+class AsyncGradeTargetRepository(Protocol):
+    async def set_target(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        target_percentage: float,
+    ) -> StoredGradeTarget:
+        ...
+
+    async def get_target(self, user_id: UUID, course_id: UUID) -> StoredGradeTarget | None:
+        ...
+
+    async def list_targets(self, user_id: UUID) -> list[StoredGradeTarget]:
+        ...
+
+    async def delete_target(self, user_id: UUID, course_id: UUID) -> bool:
+        ...
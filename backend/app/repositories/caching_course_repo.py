@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import replace
+from uuid import UUID
+
+from app.models import CourseCreate
+from app.repositories.base import (
+    CourseCursor,
+    CourseRepository,
+    StoredCourse,
+    StoredCourseSummary,
+)
+
+CacheKey = tuple[UUID, UUID]
+
+
+class CachingCourseRepository:
+    """Read-through LRU of hydrated course aggregates in front of another repository.
+
+    Entries are keyed by ``(user_id, course_id)``. Writes through this
+    repository invalidate the affected entry. Every hit is revalidated
+    against the stored course version, one primary-key lookup instead of a
+    full aggregate load, so a write made by another worker is seen on the
+    next read. Without that, a user's second edit landing on a worker with a
+    stale copy would save against the old version and fail with a spurious
+    ``CourseVersionConflictError``. ``ttl_seconds`` only bounds how long an
+    entry is kept; an expired entry is reloaded in full.
+
+    Services mutate ``stored.course`` in place before saving, so every hit
+    returns a deep copy. Otherwise a failed update could leave a half-edited
+    aggregate in the cache.
+    """
+
+    def __init__(
+        self,
+        repository: CourseRepository,
+        *,
+        max_entries: int = 512,
+        ttl_seconds: float | None = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._repository = repository
+        self._max_entries = max(1, int(max_entries))
+        self._ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, tuple[float | None, StoredCourse]] = OrderedDict()
+        # Bumped on every invalidation. A read that overlapped a write must not
+        # cache what it fetched, since that may be the pre-write state.
+        self._write_seq = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def repository(self) -> CourseRepository:
+        return self._repository
+
+    def create(self, user_id: UUID, course: CourseCreate) -> StoredCourse:
+        stored = self._repository.create(user_id=user_id, course=course)
+        self._invalidate((user_id, stored.course_id))
+        return stored
+
+    def list_all(self, user_id: UUID) -> list[StoredCourse]:
+        write_seq = self._write_seq
+        stored_courses = self._repository.list_all(user_id=user_id)
+        for stored in stored_courses:
+            self._store((user_id, stored.course_id), stored, write_seq)
+        return stored_courses
+
+    def list_page(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourse]:
+        write_seq = self._write_seq
+        stored_courses = self._repository.list_page(user_id=user_id, limit=limit, after=after)
+        for stored in stored_courses:
+            self._store((user_id, stored.course_id), stored, write_seq)
+        return stored_courses
+
+    def list_summaries(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None = None,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourseSummary]:
+        return self._repository.list_summaries(user_id=user_id, limit=limit, after=after)
+
+    def get_by_id(self, user_id: UUID, course_id: UUID) -> StoredCourse | None:
+        key = (user_id, course_id)
+        write_seq = self._write_seq
+        cached = self._lookup(key)
+        if cached is not None:
+            current_version = self._repository.get_version(user_id=user_id, course_id=course_id)
+            if current_version == cached.version:
+                return cached
+
+        stored = self._repository.get_by_id(user_id=user_id, course_id=course_id)
+        if stored is not None:
+            self._store(key, stored, write_seq)
+        return stored
+
+    def update(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        course: CourseCreate,
+        expected_version: int | None = None,
+    ) -> StoredCourse:
+        key = (user_id, course_id)
+        self._invalidate(key)
+        try:
+            return self._repository.update(
+                user_id=user_id,
+                course_id=course_id,
+                course=course,
+                expected_version=expected_version,
+            )
+        finally:
+            self._invalidate(key)
+
+    def get_version(self, user_id: UUID, course_id: UUID) -> int | None:
+        return self._repository.get_version(user_id=user_id, course_id=course_id)
+
+    def delete(self, user_id: UUID, course_id: UUID) -> None:
+        key = (user_id, course_id)
+        self._invalidate(key)
+        try:
+            self._repository.delete(user_id=user_id, course_id=course_id)
+        finally:
+            self._invalidate(key)
+
+    def clear(self) -> None:
+        self._repository.clear()
+        self.invalidate_all()
+
+    def get_index(self, user_id: UUID, course_id: UUID) -> int | None:
+        return self._repository.get_index(user_id=user_id, course_id=course_id)
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._write_seq += 1
+            self._entries.clear()
+
+    def _lookup(self, key: CacheKey) -> StoredCourse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, cached = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return replace(cached, course=cached.course.model_copy(deep=True))
+
+    def _store(self, key: CacheKey, stored: StoredCourse, write_seq: int) -> None:
+        snapshot = replace(stored, course=stored.course.model_copy(deep=True))
+        expires_at = self._clock() + self._ttl_seconds if self._ttl_seconds is not None else None
+        with self._lock:
+            if write_seq != self._write_seq:
+                return
+            self._entries[key] = (expires_at, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _invalidate(self, key: CacheKey) -> None:
+        with self._lock:
+            self._write_seq += 1
+            self._entries.pop(key, None)
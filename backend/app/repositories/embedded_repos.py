@@ -0,0 +1,389 @@
+"""Repositories persisted by an ``EmbeddedStore``.
+
+Each one is its in-memory counterpart with the ``_put``/``_remove`` write
+hooks routed through ``EmbeddedStore.commit``, plus a replay handler that
+rebuilds state from stored records and a capture for snapshots. Reads are
+inherited unchanged.
+"""
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from app.models import CourseCreate
+from app.models_deadline import Deadline
+from app.repositories.base import (
+    StoredCourse,
+    StoredScenario,
+    StoredScenarioEntry,
+    StoredUser,
+)
+from app.repositories.embedded_store import EmbeddedStore, Records
+from app.repositories.inmemory_calendar_repo import InMemoryCalendarRepository
+from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+from app.repositories.inmemory_deadline_repo import InMemoryDeadlineRepository
+from app.repositories.inmemory_grade_target_repo import InMemoryGradeTargetRepository
+from app.repositories.inmemory_locks import DEFAULT_LOCK_STRIPES
+from app.repositories.inmemory_scenario_repo import InMemoryScenarioRepository
+from app.repositories.inmemory_user_repo import InMemoryUserRepository
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _from_iso(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _uuid(value: str | None) -> UUID | None:
+    return UUID(value) if value is not None else None
+
+
+class EmbeddedCourseRepository(InMemoryCourseRepository):
+    namespace = "course"
+
+    def __init__(self, store: EmbeddedStore, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        super().__init__(lock_stripes)
+        self._log = store
+        store.register(self.namespace, self._replay, self._capture)
+
+    def _put(self, user_id: UUID, stored: StoredCourse) -> None:
+        self._log.commit(
+            self.namespace,
+            "put",
+            self._encode(user_id, stored),
+            functools.partial(super()._put, user_id, stored),
+        )
+
+    def _remove(self, user_id: UUID, course_id: UUID) -> None:
+        self._log.commit(
+            self.namespace,
+            "delete",
+            {"user_id": str(user_id), "course_id": str(course_id)},
+            functools.partial(super()._remove, user_id, course_id),
+        )
+
+    def clear(self) -> None:
+        self._log.commit(self.namespace, "clear", {}, super().clear)
+
+    def _replay(self, op: str, data: dict[str, Any]) -> None:
+        if op == "put":
+            stored = StoredCourse(
+                course_id=UUID(data["course_id"]),
+                course=CourseCreate.model_validate(data["course"]),
+                version=data["version"],
+                created_at=_from_iso(data["created_at"]),
+            )
+            super()._put(UUID(data["user_id"]), stored)
+            if stored.created_at is not None and (
+                self._last_created_at is None or stored.created_at > self._last_created_at
+            ):
+                self._last_created_at = stored.created_at
+        elif op == "delete":
+            super()._remove(UUID(data["user_id"]), UUID(data["course_id"]))
+        elif op == "clear":
+            super().clear()
+
+    def _capture(self) -> Records:
+        return self._records(dict(self._courses_by_user))
+
+    @classmethod
+    def _records(cls, view: dict[UUID, dict[UUID, StoredCourse]]) -> Iterator[tuple[str, dict[str, Any]]]:
+        for user_id, user_courses in view.items():
+            for stored in user_courses.values():
+                yield "put", cls._encode(user_id, stored)
+
+    @staticmethod
+    def _encode(user_id: UUID, stored: StoredCourse) -> dict[str, Any]:
+        return {
+            "user_id": str(user_id),
+            "course_id": str(stored.course_id),
+            "version": stored.version,
+            "created_at": _iso(stored.created_at),
+            "course": stored.course.model_dump(mode="json"),
+        }
+
+
+class EmbeddedDeadlineRepository(InMemoryDeadlineRepository):
+    namespace = "deadline"
+
+    def __init__(self, store: EmbeddedStore, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        super().__init__(lock_stripes)
+        self._log = store
+        store.register(self.namespace, self._replay, self._capture)
+
+    def _put(self, user_id: UUID, course_id: UUID, deadlines: list[Deadline]) -> None:
+        self._log.commit(
+            self.namespace,
+            "put",
+            self._encode(user_id, course_id, deadlines),
+            functools.partial(super()._put, user_id, course_id, deadlines),
+        )
+
+    def _remove(self, user_id: UUID, course_id: UUID, deadline_id: UUID) -> None:
+        self._log.commit(
+            self.namespace,
+            "delete",
+            {"user_id": str(user_id), "course_id": str(course_id), "deadline_id": str(deadline_id)},
+            functools.partial(super()._remove, user_id, course_id, deadline_id),
+        )
+
+    def clear(self) -> None:
+        self._log.commit(self.namespace, "clear", {}, super().clear)
+
+    def _replay(self, op: str, data: dict[str, Any]) -> None:
+        if op == "put":
+            deadlines = [Deadline.model_validate(item) for item in data["deadlines"]]
+            super()._put(UUID(data["user_id"]), UUID(data["course_id"]), deadlines)
+        elif op == "delete":
+            super()._remove(UUID(data["user_id"]), UUID(data["course_id"]), UUID(data["deadline_id"]))
+        elif op == "clear":
+            super().clear()
+
+    def _capture(self) -> Records:
+        return self._records(dict(self._store))
+
+    @classmethod
+    def _records(
+        cls, view: dict[UUID, dict[UUID, dict[UUID, Deadline]]]
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        for user_id, buckets in view.items():
+            for course_id, bucket in buckets.items():
+                if bucket:
+                    yield "put", cls._encode(user_id, course_id, list(bucket.values()))
+
+    @staticmethod
+    def _encode(user_id: UUID, course_id: UUID, deadlines: list[Deadline]) -> dict[str, Any]:
+        return {
+            "user_id": str(user_id),
+            "course_id": str(course_id),
+            "deadlines": [deadline.model_dump(mode="json") for deadline in deadlines],
+        }
+
+
+class EmbeddedScenarioRepository(InMemoryScenarioRepository):
+    namespace = "scenario"
+
+    def __init__(self, store: EmbeddedStore, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        super().__init__(lock_stripes)
+        self._log = store
+        store.register(self.namespace, self._replay, self._capture)
+
+    def _put(self, user_id: UUID, course_id: UUID, scenario: StoredScenario) -> None:
+        self._log.commit(
+            self.namespace,
+            "put",
+            self._encode(user_id, course_id, scenario),
+            functools.partial(super()._put, user_id, course_id, scenario),
+        )
+
+    def _remove(self, user_id: UUID, course_id: UUID, scenario_id: UUID) -> None:
+        self._log.commit(
+            self.namespace,
+            "delete",
+            {"user_id": str(user_id), "course_id": str(course_id), "scenario_id": str(scenario_id)},
+            functools.partial(super()._remove, user_id, course_id, scenario_id),
+        )
+
+    def clear(self) -> None:
+        self._log.commit(self.namespace, "clear", {}, super().clear)
+
+    def _replay(self, op: str, data: dict[str, Any]) -> None:
+        if op == "put":
+            scenario = StoredScenario(
+                scenario_id=UUID(data["scenario_id"]),
+                name=data["name"],
+                entries=[
+                    StoredScenarioEntry(
+                        assessment_id=UUID(entry["assessment_id"]),
+                        assessment_name=entry["assessment_name"],
+                        score=entry["score"],
+                    )
+                    for entry in data["entries"]
+                ],
+                created_at=data["created_at"],
+            )
+            super()._put(UUID(data["user_id"]), UUID(data["course_id"]), scenario)
+        elif op == "delete":
+            super()._remove(UUID(data["user_id"]), UUID(data["course_id"]), UUID(data["scenario_id"]))
+        elif op == "clear":
+            super().clear()
+
+    def _capture(self) -> Records:
+        return self._records(dict(self._store))
+
+    @classmethod
+    def _records(
+        cls, view: dict[UUID, dict[UUID, dict[UUID, StoredScenario]]]
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        for user_id, buckets in view.items():
+            for course_id, bucket in buckets.items():
+                for scenario in bucket.values():
+                    yield "put", cls._encode(user_id, course_id, scenario)
+
+    @staticmethod
+    def _encode(user_id: UUID, course_id: UUID, scenario: StoredScenario) -> dict[str, Any]:
+        return {
+            "user_id": str(user_id),
+            "course_id": str(course_id),
+            "scenario_id": str(scenario.scenario_id),
+            "name": scenario.name,
+            "entries": [
+                {
+                    "assessment_id": str(entry.assessment_id),
+                    "assessment_name": entry.assessment_name,
+                    "score": entry.score,
+                }
+                for entry in scenario.entries
+            ],
+            "created_at": scenario.created_at,
+        }
+
+
+class EmbeddedUserRepository(InMemoryUserRepository):
+    namespace = "user"
+
+    def __init__(self, store: EmbeddedStore, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        super().__init__(lock_stripes)
+        self._log = store
+        store.register(self.namespace, self._replay, self._capture)
+
+    def _put(self, stored: StoredUser) -> None:
+        self._log.commit(self.namespace, "put", self._encode(stored), functools.partial(super()._put, stored))
+
+    def clear(self) -> None:
+        self._log.commit(self.namespace, "clear", {}, super().clear)
+
+    def _replay(self, op: str, data: dict[str, Any]) -> None:
+        if op == "put":
+            super()._put(
+                StoredUser(
+                    user_id=UUID(data["user_id"]),
+                    email=data["email"],
+                    password_hash=data["password_hash"],
+                )
+            )
+        elif op == "clear":
+            super().clear()
+
+    def _capture(self) -> Records:
+        return (("put", self._encode(stored)) for stored in list(self._users_by_id.values()))
+
+    @staticmethod
+    def _encode(stored: StoredUser) -> dict[str, Any]:
+        return {
+            "user_id": str(stored.user_id),
+            "email": stored.email,
+            "password_hash": stored.password_hash,
+        }
+
+
+class EmbeddedGradeTargetRepository(InMemoryGradeTargetRepository):
+    namespace = "grade_target"
+
+    def __init__(self, store: EmbeddedStore, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        super().__init__(lock_stripes)
+        self._log = store
+        store.register(self.namespace, self._replay, self._capture)
+
+    def _put(self, data: dict) -> None:
+        self._log.commit(self.namespace, "put", self._encode(data), functools.partial(super()._put, data))
+
+    def _remove(self, course_id: UUID) -> None:
+        self._log.commit(
+            self.namespace,
+            "delete",
+            {"course_id": str(course_id)},
+            functools.partial(super()._remove, course_id),
+        )
+
+    def clear(self) -> None:
+        self._log.commit(self.namespace, "clear", {}, super().clear)
+
+    def _replay(self, op: str, data: dict[str, Any]) -> None:
+        if op == "put":
+            super()._put(
+                {
+                    "target_id": UUID(data["target_id"]),
+                    "course_id": UUID(data["course_id"]),
+                    "user_id": _uuid(data["user_id"]),
+                    "target_percentage": data["target_percentage"],
+                    "created_at": _from_iso(data["created_at"]),
+                }
+            )
+        elif op == "delete":
+            super()._remove(UUID(data["course_id"]))
+        elif op == "clear":
+            super().clear()
+
+    def _capture(self) -> Records:
+        return (("put", self._encode(data)) for data in list(self._targets.values()))
+
+    @staticmethod
+    def _encode(data: dict) -> dict[str, Any]:
+        return {
+            "target_id": str(data["target_id"]),
+            "course_id": str(data["course_id"]),
+            "user_id": str(data["user_id"]) if data.get("user_id") is not None else None,
+            "target_percentage": data["target_percentage"],
+            "created_at": _iso(data["created_at"]),
+        }
+
+
+class EmbeddedCalendarRepository(InMemoryCalendarRepository):
+    namespace = "calendar"
+
+    def __init__(self, store: EmbeddedStore, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        super().__init__(lock_stripes)
+        self._log = store
+        store.register(self.namespace, self._replay, self._capture)
+
+    def _publish(self, user_id: UUID, provider: str, data: dict | None) -> None:
+        publish = functools.partial(super()._publish, user_id, provider, data)
+        if data is None:
+            self._log.commit(
+                self.namespace, "delete", {"user_id": str(user_id), "provider": provider}, publish
+            )
+        else:
+            self._log.commit(self.namespace, "put", self._encode(data), publish)
+
+    def clear(self) -> None:
+        self._log.commit(self.namespace, "clear", {}, super().clear)
+
+    def _replay(self, op: str, data: dict[str, Any]) -> None:
+        if op == "put":
+            record = {
+                **data,
+                "connection_id": UUID(data["connection_id"]),
+                "user_id": UUID(data["user_id"]),
+                "token_expiry": _from_iso(data["token_expiry"]),
+                "created_at": _from_iso(data["created_at"]),
+            }
+            super()._publish(record["user_id"], record["provider"], record)
+        elif op == "delete":
+            super()._publish(UUID(data["user_id"]), data["provider"], None)
+        elif op == "clear":
+            super().clear()
+
+    def _capture(self) -> Records:
+        return self._records(dict(self._connections))
+
+    @classmethod
+    def _records(cls, view: dict[UUID, dict[str, dict]]) -> Iterator[tuple[str, dict[str, Any]]]:
+        for user_connections in view.values():
+            for data in user_connections.values():
+                yield "put", cls._encode(data)
+
+    @staticmethod
+    def _encode(data: dict) -> dict[str, Any]:
+        return {
+            **data,
+            "connection_id": str(data["connection_id"]),
+            "user_id": str(data["user_id"]),
+            "token_expiry": _iso(data["token_expiry"]),
+            "created_at": _iso(data["created_at"]),
+        }
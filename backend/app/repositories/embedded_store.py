@@ -0,0 +1,386 @@
+"""Single-node persistence for the in-memory repositories.
+
+Live state stays in the in-memory repositories, so reads cost what they
+cost there. Each write also becomes one record in an append-only log:
+
+- A record is a JSON line ``{"seq", "ns", "op", "data"}``. A ``put``
+  carries the full new value of a key, so replaying a record that is
+  already reflected in the state is harmless.
+- Concurrent writers share an fsync (group commit): the first writer to
+  find no flush running writes every queued record and syncs once, the
+  others wait for it.
+- Every ``snapshot_every`` records, the live state is written to a
+  compacted snapshot and the log segments it covers are deleted.
+- On open, the newest snapshot and the log segments after it are
+  memory-mapped and replayed line by line.
+
+Files in the store directory: ``snapshot-<seq>.jsonl`` holds the state as of
+record ``seq``; ``wal-<seq>.log`` holds records from ``seq`` on;
+``store.lock`` is held while the store is open.
+
+One process per directory: the live state is in that process's memory, so a
+second process would neither see its writes nor keep the log consistent.
+``open`` takes an exclusive ``flock`` on ``store.lock`` and raises
+``EmbeddedStoreError`` if another process holds it, so run a single API
+worker (e.g. one uvicorn worker) against a store. Within the process,
+writers apply their in-memory change one at a time under the store lock;
+only that step is serialized, the fsync is shared as described above.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import threading
+import time
+import warnings
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, the one-process rule is unchecked.
+    fcntl = None
+
+DEFAULT_SNAPSHOT_EVERY = 10_000
+
+# (op, data) pairs
+Records = Iterable[tuple[str, dict[str, Any]]]
+ReplayHandler = Callable[[str, dict[str, Any]], None]
+# Called with the store lock held; must return quickly and must not read
+# live state after returning (capture references, serialize later).
+SnapshotCapture = Callable[[], Records]
+
+_SNAPSHOT_PREFIX = "snapshot-"
+_SNAPSHOT_SUFFIX = ".jsonl"
+_SEGMENT_PREFIX = "wal-"
+_SEGMENT_SUFFIX = ".log"
+_LOCK_NAME = "store.lock"
+
+
+class EmbeddedStoreError(RuntimeError):
+    """Raised when the log cannot be written (the store refuses writes after),
+    or when another process already has the store open."""
+
+
+def _encode(record: dict[str, Any]) -> bytes:
+    return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+
+def _seq_of(path: Path, prefix: str, suffix: str) -> int:
+    return int(path.name[len(prefix) : -len(suffix)])
+
+
+def _mapped_lines(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for each line of ``path`` via mmap."""
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            offset = 0
+            while line := mapped.readline():
+                yield offset, line
+                offset += len(line)
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # Directories cannot be opened on every platform.
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class EmbeddedStore:
+    """Append-only log plus snapshots, shared by the embedded repositories.
+
+    Repositories ``register`` a namespace before ``open``; ``open`` replays
+    stored records into them. Writers call ``commit`` with the record and
+    the in-memory change; the change is applied under the store lock (so a
+    snapshot never sees half the writers) and ``commit`` returns once the
+    record is on disk.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+        commit_delay_seconds: float = 0.0,
+    ) -> None:
+        self.path = Path(path)
+        self.snapshot_every = snapshot_every
+        self.commit_delay_seconds = commit_delay_seconds
+        self._replay: dict[str, ReplayHandler] = {}
+        self._capture: dict[str, SnapshotCapture] = {}
+        # Records for namespaces nobody registered this run; kept so a
+        # snapshot does not drop them.
+        self._orphans: list[dict[str, Any]] = []
+
+        self._cond = threading.Condition()
+        self._segment: Any = None
+        self._lock_fd: int | None = None
+        self._seq = 0
+        self._durable_seq = 0
+        self._pending: list[bytes] = []
+        self._flushing = False
+        self._compacting = False
+        self._since_snapshot = 0
+        self._failure: BaseException | None = None
+
+        self.commits = 0
+        self.flushes = 0
+        self.snapshots = 0
+
+    # ── setup ──
+
+    def register(self, namespace: str, replay: ReplayHandler, capture: SnapshotCapture) -> None:
+        if self._segment is not None:
+            raise RuntimeError("register namespaces before opening the store")
+        self._replay[namespace] = replay
+        self._capture[namespace] = capture
+
+    def open(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._acquire_lock()
+        try:
+            self._load()
+        except BaseException:
+            self._release_lock()
+            raise
+
+    def _load(self) -> None:
+        for leftover in self.path.glob("*.tmp"):
+            leftover.unlink()
+
+        base = 0
+        snapshots = self._files(_SNAPSHOT_PREFIX, _SNAPSHOT_SUFFIX)
+        if snapshots:
+            base = _seq_of(snapshots[-1], _SNAPSHOT_PREFIX, _SNAPSHOT_SUFFIX)
+            for _, line in _mapped_lines(snapshots[-1]):
+                self._dispatch(json.loads(line))
+
+        last = base
+        for segment in self._files(_SEGMENT_PREFIX, _SEGMENT_SUFFIX):
+            last = max(last, self._replay_segment(segment, after=base))
+
+        self._seq = self._durable_seq = last
+        self._since_snapshot = last - base
+        self._segment = self._open_segment(last + 1)
+
+    def close(self) -> None:
+        """Flush, write a snapshot so the next start replays nothing, and close."""
+        if self._segment is None:
+            return
+        with self._cond:
+            while self._compacting:
+                self._cond.wait()
+        if self._failure is None:
+            self.compact()
+        with self._cond:
+            self._segment.close()
+            self._segment = None
+        self._release_lock()
+
+    def _acquire_lock(self) -> None:
+        if fcntl is None:
+            return
+        fd = os.open(self.path / _LOCK_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise EmbeddedStoreError(
+                f"{self.path} is already open in another process; "
+                "the embedded store supports one process per directory"
+            ) from None
+        self._lock_fd = fd
+
+    def _release_lock(self) -> None:
+        # Closing the descriptor drops the flock; so does the process exiting.
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    # ── writes ──
+
+    def commit(
+        self,
+        namespace: str,
+        op: str,
+        data: dict[str, Any],
+        apply: Callable[[], None],
+    ) -> None:
+        """Apply ``apply`` and log the record; return once it is durable."""
+        with self._cond:
+            self._check_writable()
+            apply()
+            self._seq += 1
+            seq = self._seq
+            self._pending.append(_encode({"seq": seq, "ns": namespace, "op": op, "data": data}))
+            self._since_snapshot += 1
+            self.commits += 1
+        self._wait_durable(seq)
+        if self._since_snapshot >= self.snapshot_every and not self._compacting:
+            threading.Thread(target=self._compact_quietly, name="embedded-store-compact", daemon=True).start()
+
+    def _wait_durable(self, seq: int) -> None:
+        with self._cond:
+            while self._durable_seq < seq:
+                if self._failure is not None:
+                    raise EmbeddedStoreError("log write failed") from self._failure
+                if self._flushing:
+                    self._cond.wait()
+                    continue
+                self._flushing = True
+                if self.commit_delay_seconds:
+                    # Give concurrent writers a moment to join this flush.
+                    self._cond.release()
+                    time.sleep(self.commit_delay_seconds)
+                    self._cond.acquire()
+                batch, self._pending = self._pending, []
+                upto = self._seq
+                self._cond.release()
+                try:
+                    self._write(batch)
+                except BaseException as exc:
+                    self._cond.acquire()
+                    self._failure = exc
+                    self._flushing = False
+                    self._cond.notify_all()
+                    raise EmbeddedStoreError("log write failed") from exc
+                self._cond.acquire()
+                self._durable_seq = upto
+                self._flushing = False
+                self._cond.notify_all()
+
+    def _write(self, batch: list[bytes]) -> None:
+        self._segment.write(b"".join(batch))
+        self._segment.flush()
+        os.fsync(self._segment.fileno())
+        self.flushes += 1
+
+    def _check_writable(self) -> None:
+        if self._segment is None:
+            raise RuntimeError("embedded store is not open")
+        if self._failure is not None:
+            # The in-memory state may be ahead of the disk; restart to reload.
+            raise EmbeddedStoreError("log write failed") from self._failure
+
+    # ── compaction ──
+
+    def compact(self) -> None:
+        """Write a snapshot of the current state and drop the log before it."""
+        with self._cond:
+            if self._compacting:
+                return
+            self._check_writable()
+            self._compacting = True
+            try:
+                while self._flushing:
+                    self._cond.wait()
+                if self._pending:
+                    batch, self._pending = self._pending, []
+                    try:
+                        self._write(batch)
+                    except BaseException as exc:
+                        self._failure = exc
+                        self._cond.notify_all()
+                        raise EmbeddedStoreError("log write failed") from exc
+                self._durable_seq = self._seq
+                self._cond.notify_all()
+
+                upto = self._seq
+                records = [(namespace, capture()) for namespace, capture in self._capture.items()]
+                orphans = list(self._orphans)
+                self._segment.close()
+                self._segment = self._open_segment(upto + 1)
+                self._since_snapshot = 0
+            except BaseException:
+                self._compacting = False
+                self._cond.notify_all()
+                raise
+
+        try:
+            self._write_snapshot(upto, records, orphans)
+            self._drop_before(upto)
+            self.snapshots += 1
+        finally:
+            with self._cond:
+                self._compacting = False
+                self._cond.notify_all()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except Exception as exc:  # The log is still intact; retry next threshold.
+            warnings.warn(f"Embedded store compaction failed: {exc}", RuntimeWarning)
+
+    def _write_snapshot(
+        self,
+        upto: int,
+        records: list[tuple[str, Records]],
+        orphans: list[dict[str, Any]],
+    ) -> None:
+        final = self.path / f"{_SNAPSHOT_PREFIX}{upto:016d}{_SNAPSHOT_SUFFIX}"
+        tmp = final.with_name(final.name + ".tmp")
+        with open(tmp, "wb") as fh:
+            for namespace, items in records:
+                for op, data in items:
+                    fh.write(_encode({"ns": namespace, "op": op, "data": data}))
+            for record in orphans:
+                fh.write(_encode(record))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, final)
+        _fsync_dir(self.path)
+
+    def _drop_before(self, upto: int) -> None:
+        for snapshot in self._files(_SNAPSHOT_PREFIX, _SNAPSHOT_SUFFIX):
+            if _seq_of(snapshot, _SNAPSHOT_PREFIX, _SNAPSHOT_SUFFIX) < upto:
+                snapshot.unlink()
+        for segment in self._files(_SEGMENT_PREFIX, _SEGMENT_SUFFIX):
+            if _seq_of(segment, _SEGMENT_PREFIX, _SEGMENT_SUFFIX) <= upto:
+                segment.unlink()
+
+    # ── loading ──
+
+    def _replay_segment(self, segment: Path, *, after: int) -> int:
+        last = after
+        torn_at = None
+        for offset, line in _mapped_lines(segment):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("unterminated record")
+                record = json.loads(line)
+            except ValueError:
+                torn_at = offset
+                break
+            if record["seq"] <= after:
+                continue
+            self._dispatch(record)
+            last = record["seq"]
+        if torn_at is not None:
+            # A crash mid-append; the record was never acknowledged.
+            with open(segment, "r+b") as fh:
+                fh.truncate(torn_at)
+        return last
+
+    def _dispatch(self, record: dict[str, Any]) -> None:
+        handler = self._replay.get(record["ns"])
+        if handler is None:
+            self._orphans.append({"ns": record["ns"], "op": record["op"], "data": record["data"]})
+            return
+        handler(record["op"], record["data"])
+
+    def _open_segment(self, first_seq: int):
+        segment = open(self.path / f"{_SEGMENT_PREFIX}{first_seq:016d}{_SEGMENT_SUFFIX}", "ab")
+        _fsync_dir(self.path)
+        return segment
+
+    def _files(self, prefix: str, suffix: str) -> list[Path]:
+        return sorted(self.path.glob(f"{prefix}*{suffix}"))
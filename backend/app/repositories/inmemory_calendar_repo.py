@@ -9,11 +9,42 @@ from typing import Any
 from uuid import UUID, uuid4
 
 from app.repositories.base import StoredCalendarConnection
+from app.repositories.inmemory_locks import DEFAULT_LOCK_STRIPES, LockStripes
 
 
 class InMemoryCalendarRepository:
-    def __init__(self) -> None:
-        self._connections: dict[tuple[UUID, str], dict] = {}
+    """Copy-on-write per user; see ``app.repositories.inmemory_locks``.
+
+    Connection records are replaced wholesale, never edited in place.
+    """
+
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        # {user_id: {provider: connection record}}
+        self._connections: dict[UUID, dict[str, dict]] = {}
+        self._locks = LockStripes(lock_stripes)
+
+    def _publish(self, user_id: UUID, provider: str, data: dict | None) -> None:
+        # Caller holds the user's stripe lock; ``None`` removes the record.
+        user_connections = dict(self._connections.get(user_id, {}))
+        if data is None:
+            user_connections.pop(provider, None)
+        else:
+            user_connections[provider] = data
+        self._connections[user_id] = user_connections
+
+    def _get(self, user_id: UUID, provider: str) -> dict | None:
+        return self._connections.get(user_id, {}).get(provider)
+
+    @staticmethod
+    def _to_stored(data: dict) -> StoredCalendarConnection:
+        return StoredCalendarConnection(
+            connection_id=data["connection_id"],
+            user_id=data["user_id"],
+            provider=data["provider"],
+            calendar_id=data["calendar_id"],
+            is_connected=data["is_connected"],
+            created_at=data["created_at"],
+        )
 
     def create(
         self,
@@ -24,61 +55,33 @@ class InMemoryCalendarRepository:
         token_expiry: datetime | None = None,
         calendar_id: str | None = None,
     ) -> StoredCalendarConnection:
-        key = (user_id, provider)
-        if key in self._connections:
-            raise ValueError(f"Calendar connection already exists for provider {provider}")
-
-        connection_id = uuid4()
-        created_at = datetime.now(UTC)
-        self._connections[key] = {
-            "connection_id": connection_id,
-            "user_id": user_id,
-            "provider": provider,
-            "calendar_id": calendar_id,
-            "access_token": access_token,
-            "refresh_token": refresh_token,
-            "token_expiry": token_expiry,
-            "is_connected": True,
-            "created_at": created_at,
-        }
-        return StoredCalendarConnection(
-            connection_id=connection_id,
-            user_id=user_id,
-            provider=provider,
-            calendar_id=calendar_id,
-            is_connected=True,
-            created_at=created_at,
-        )
+        with self._locks(user_id):
+            if self._get(user_id, provider) is not None:
+                raise ValueError(f"Calendar connection already exists for provider {provider}")
+
+            data = {
+                "connection_id": uuid4(),
+                "user_id": user_id,
+                "provider": provider,
+                "calendar_id": calendar_id,
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "token_expiry": token_expiry,
+                "is_connected": True,
+                "created_at": datetime.now(UTC),
+            }
+            self._publish(user_id, provider, data)
+        return self._to_stored(data)
 
     def get_by_user(self, user_id: UUID) -> list[StoredCalendarConnection]:
-        results = []
-        for (uid, _), data in self._connections.items():
-            if uid == user_id:
-                results.append(
-                    StoredCalendarConnection(
-                        connection_id=data["connection_id"],
-                        user_id=data["user_id"],
-                        provider=data["provider"],
-                        calendar_id=data["calendar_id"],
-                        is_connected=data["is_connected"],
-                        created_at=data["created_at"],
-                    )
-                )
+        results = [self._to_stored(data) for data in self._connections.get(user_id, {}).values()]
         return sorted(results, key=lambda c: c.created_at)
 
     def get_by_user_and_provider(self, user_id: UUID, provider: str) -> StoredCalendarConnection | None:
-        key = (user_id, provider)
-        data = self._connections.get(key)
+        data = self._get(user_id, provider)
         if data is None:
             return None
-        return StoredCalendarConnection(
-            connection_id=data["connection_id"],
-            user_id=data["user_id"],
-            provider=data["provider"],
-            calendar_id=data["calendar_id"],
-            is_connected=data["is_connected"],
-            created_at=data["created_at"],
-        )
+        return self._to_stored(data)
 
     def update_tokens(
         self,
@@ -88,27 +91,23 @@ class InMemoryCalendarRepository:
         refresh_token: str | None,
         token_expiry: datetime | None = None,
     ) -> StoredCalendarConnection | None:
-        key = (user_id, provider)
-        data = self._connections.get(key)
-        if data is None:
-            return None
+        with self._locks(user_id):
+            data = self._get(user_id, provider)
+            if data is None:
+                return None
 
-        data["access_token"] = access_token
-        data["refresh_token"] = refresh_token
-        data["token_expiry"] = token_expiry
-        data["is_connected"] = True
-        return StoredCalendarConnection(
-            connection_id=data["connection_id"],
-            user_id=data["user_id"],
-            provider=data["provider"],
-            calendar_id=data["calendar_id"],
-            is_connected=data["is_connected"],
-            created_at=data["created_at"],
-        )
+            data = {
+                **data,
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "token_expiry": token_expiry,
+                "is_connected": True,
+            }
+            self._publish(user_id, provider, data)
+        return self._to_stored(data)
 
     def get_tokens(self, user_id: UUID, provider: str) -> dict[str, Any] | None:
-        key = (user_id, provider)
-        data = self._connections.get(key)
+        data = self._get(user_id, provider)
         if data is None or not data.get("is_connected"):
             return None
         return {
@@ -118,23 +117,30 @@ class InMemoryCalendarRepository:
         }
 
     def disconnect(self, user_id: UUID, provider: str) -> bool:
-        key = (user_id, provider)
-        data = self._connections.get(key)
-        if data is None:
-            return False
+        with self._locks(user_id):
+            data = self._get(user_id, provider)
+            if data is None:
+                return False
 
-        data["is_connected"] = False
-        data["access_token"] = None
-        data["refresh_token"] = None
-        data["token_expiry"] = None
+            self._publish(
+                user_id,
+                provider,
+                {
+                    **data,
+                    "is_connected": False,
+                    "access_token": None,
+                    "refresh_token": None,
+                    "token_expiry": None,
+                },
+            )
         return True
 
     def delete(self, user_id: UUID, provider: str) -> bool:
-        key = (user_id, provider)
-        if key not in self._connections:
-            return False
-        del self._connections[key]
+        with self._locks(user_id):
+            if self._get(user_id, provider) is None:
+                return False
+            self._publish(user_id, provider, None)
         return True
 
     def clear(self) -> None:
-        self._connections.clear()
+        self._connections = {}
@@ -1,48 +1,114 @@
+import threading
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
 from app.models import CourseCreate
-from app.repositories.base import StoredCourse
+from app.repositories.base import (
+    CourseCursor,
+    CourseVersionConflictError,
+    StoredCourse,
+    StoredCourseSummary,
+)
+from app.repositories.inmemory_locks import DEFAULT_LOCK_STRIPES, LockStripes
 
 
 class InMemoryCourseRepository:
-    def __init__(self) -> None:
-        self._courses_by_user: dict[UUID, dict[UUID, CourseCreate]] = {}
+    """Courses per user in copy-on-write dicts; see ``app.repositories.inmemory_locks``.
+
+    Aggregates are copied on the way in and on the way out: services edit
+    ``stored.course`` in place before saving, so no caller may hold the
+    stored object itself.
+    """
+
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        self._courses_by_user: dict[UUID, dict[UUID, StoredCourse]] = {}
+        self._locks = LockStripes(lock_stripes)
+        self._clock_lock = threading.Lock()
+        self._last_created_at: datetime | None = None
 
     def create(self, user_id: UUID, course: CourseCreate) -> StoredCourse:
-        course_id = uuid4()
-        user_courses = self._courses_by_user.setdefault(user_id, {})
-        user_courses[course_id] = course
-        return StoredCourse(course_id=course_id, course=course)
+        snapshot = course.model_copy(deep=True)
+        with self._locks(user_id):
+            # Stamped under the lock so dict order matches (created_at, id) order.
+            stored = StoredCourse(
+                course_id=uuid4(),
+                course=snapshot,
+                version=1,
+                created_at=self._next_created_at(),
+            )
+            self._put(user_id, stored)
+        return self._copy(stored)
 
     def list_all(self, user_id: UUID) -> list[StoredCourse]:
         user_courses = self._courses_by_user.get(user_id, {})
+        return [self._copy(stored) for stored in user_courses.values()]
+
+    def list_page(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourse]:
+        return [self._copy(stored) for stored in self._page(user_id, limit=limit, after=after)]
+
+    def list_summaries(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None = None,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourseSummary]:
         return [
-            StoredCourse(course_id=course_id, course=course)
-            for course_id, course in user_courses.items()
+            StoredCourseSummary(
+                course_id=stored.course_id,
+                name=stored.course.name,
+                term=stored.course.term,
+                assessment_count=len(stored.course.assessments),
+                created_at=stored.created_at,
+            )
+            for stored in self._page(user_id, limit=limit, after=after)
         ]
 
     def get_by_id(self, user_id: UUID, course_id: UUID) -> StoredCourse | None:
-        user_courses = self._courses_by_user.get(user_id, {})
-        course = user_courses.get(course_id)
-        if course is None:
+        stored = self._courses_by_user.get(user_id, {}).get(course_id)
+        if stored is None:
             return None
-        return StoredCourse(course_id=course_id, course=course)
+        return self._copy(stored)
+
+    def update(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        course: CourseCreate,
+        expected_version: int | None = None,
+    ) -> StoredCourse:
+        snapshot = course.model_copy(deep=True)
+        with self._locks(user_id):
+            user_courses = self._courses_by_user.get(user_id, {})
+            current = user_courses.get(course_id)
+            if current is None:
+                raise KeyError(course_id)
+            if expected_version is not None and expected_version != current.version:
+                raise CourseVersionConflictError(course_id, expected_version)
+            stored = replace(current, course=snapshot, version=current.version + 1)
+            self._put(user_id, stored)
+        return self._copy(stored)
 
-    def update(self, user_id: UUID, course_id: UUID, course: CourseCreate) -> StoredCourse:
-        user_courses = self._courses_by_user.get(user_id)
-        if user_courses is None or course_id not in user_courses:
-            raise KeyError(course_id)
-        user_courses[course_id] = course
-        return StoredCourse(course_id=course_id, course=course)
+    def get_version(self, user_id: UUID, course_id: UUID) -> int | None:
+        stored = self._courses_by_user.get(user_id, {}).get(course_id)
+        return stored.version if stored is not None else None
 
     def delete(self, user_id: UUID, course_id: UUID) -> None:
-        user_courses = self._courses_by_user.get(user_id)
-        if user_courses is None or course_id not in user_courses:
-            raise KeyError(course_id)
-        del user_courses[course_id]
+        with self._locks(user_id):
+            user_courses = self._courses_by_user.get(user_id, {})
+            if course_id not in user_courses:
+                raise KeyError(course_id)
+            self._remove(user_id, course_id)
 
     def clear(self) -> None:
-        self._courses_by_user.clear()
+        self._courses_by_user = {}
 
     def get_index(self, user_id: UUID, course_id: UUID) -> int | None:
         user_courses = self._courses_by_user.get(user_id, {})
@@ -50,3 +116,40 @@ class InMemoryCourseRepository:
             if key == course_id:
                 return index
         return None
+
+    # Every write publishes through _put/_remove, with the user's stripe lock held.
+
+    def _put(self, user_id: UUID, stored: StoredCourse) -> None:
+        user_courses = dict(self._courses_by_user.get(user_id, {}))
+        user_courses[stored.course_id] = stored
+        self._courses_by_user[user_id] = user_courses
+
+    def _remove(self, user_id: UUID, course_id: UUID) -> None:
+        user_courses = dict(self._courses_by_user.get(user_id, {}))
+        user_courses.pop(course_id, None)
+        self._courses_by_user[user_id] = user_courses
+
+    def _next_created_at(self) -> datetime:
+        # Strictly increasing, so no two courses share a created_at.
+        with self._clock_lock:
+            created_at = datetime.now(UTC)
+            if self._last_created_at is not None and created_at <= self._last_created_at:
+                created_at = self._last_created_at + timedelta(microseconds=1)
+            self._last_created_at = created_at
+            return created_at
+
+    def _page(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None,
+        after: CourseCursor | None,
+    ) -> list[StoredCourse]:
+        items = list(self._courses_by_user.get(user_id, {}).values())
+        if after is not None:
+            items = [stored for stored in items if (stored.created_at, stored.course_id) > after]
+        return items if limit is None else items[:limit]
+
+    @staticmethod
+    def _copy(stored: StoredCourse) -> StoredCourse:
+        return replace(stored, course=stored.course.model_copy(deep=True))
@@ -9,35 +9,54 @@ is completed.
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from uuid import UUID, uuid4
 
 from app.models_deadline import Deadline, DeadlineCreate, DeadlineUpdate
+from app.repositories.base import DeadlineCursor
+from app.repositories.inmemory_locks import DEFAULT_LOCK_STRIPES, LockStripes
 
 
 class InMemoryDeadlineRepository:
-    """Thread-safe-enough for single-process dev; production uses DB."""
+    """Copy-on-write per user; see ``app.repositories.inmemory_locks``.
 
-    def __init__(self) -> None:
+    ``Deadline`` values are never modified once stored (updates store a
+    ``model_copy``), so they are handed out without copying.
+    """
+
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
         # {user_id: {course_id: {deadline_id: Deadline}}}
         self._store: dict[UUID, dict[UUID, dict[UUID, Deadline]]] = {}
+        self._locks = LockStripes(lock_stripes)
 
     # ── helpers ──
 
     def _user_course(self, user_id: UUID, course_id: UUID) -> dict[UUID, Deadline]:
-        return self._store.setdefault(user_id, {}).setdefault(course_id, {})
-
-    # ── CRUD ──
-
-    def create(
-        self,
-        user_id: UUID,
-        course_id: UUID,
-        data: DeadlineCreate,
-    ) -> Deadline:
-        deadline_id = uuid4()
-        deadline = Deadline(
-            deadline_id=deadline_id,
+        """The published bucket; read-only, copy it before changing anything."""
+        return self._store.get(user_id, {}).get(course_id, {})
+
+    # Every write publishes through _put/_remove, with the user's stripe lock held.
+
+    def _put(self, user_id: UUID, course_id: UUID, deadlines: list[Deadline]) -> None:
+        bucket = dict(self._user_course(user_id, course_id))
+        for deadline in deadlines:
+            bucket[deadline.deadline_id] = deadline
+        self._publish(user_id, course_id, bucket)
+
+    def _remove(self, user_id: UUID, course_id: UUID, deadline_id: UUID) -> None:
+        bucket = dict(self._user_course(user_id, course_id))
+        bucket.pop(deadline_id, None)
+        self._publish(user_id, course_id, bucket)
+
+    def _publish(self, user_id: UUID, course_id: UUID, bucket: dict[UUID, Deadline]) -> None:
+        user_buckets = dict(self._store.get(user_id, {}))
+        user_buckets[course_id] = bucket
+        self._store[user_id] = user_buckets
+
+    @staticmethod
+    def _new_deadline(course_id: UUID, data: DeadlineCreate) -> Deadline:
+        return Deadline(
+            deadline_id=uuid4(),
             course_id=course_id,
             assessment_id=data.assessment_id,
             title=data.title,
@@ -51,12 +70,70 @@ class InMemoryDeadlineRepository:
             gcal_event_id=None,
             created_at=datetime.now(UTC).isoformat(),
         )
-        self._user_course(user_id, course_id)[deadline_id] = deadline
-        return deadline
+
+    # ── CRUD ──
+
+    def create(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        data: DeadlineCreate,
+    ) -> Deadline:
+        return self.create_many(user_id, course_id, [data])[0]
+
+    def create_many(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        items: list[DeadlineCreate],
+    ) -> list[Deadline]:
+        created = [self._new_deadline(course_id, data) for data in items]
+        with self._locks(user_id):
+            self._put(user_id, course_id, created)
+        return created
 
     def list_all(self, user_id: UUID, course_id: UUID) -> list[Deadline]:
         return list(self._user_course(user_id, course_id).values())
 
+    def list_page(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        *,
+        limit: int,
+        after: DeadlineCursor | None = None,
+    ) -> list[Deadline]:
+        keyed = sorted(
+            (
+                (
+                    date.fromisoformat(deadline.due_date),
+                    datetime.fromisoformat(deadline.created_at),
+                    deadline.deadline_id,
+                ),
+                deadline,
+            )
+            for deadline in self._user_course(user_id, course_id).values()
+        )
+        return [deadline for key, deadline in keyed if after is None or key > after][:limit]
+
+    def list_in_range(
+        self, user_id: UUID, start_date: date, end_date: date
+    ) -> list[Deadline]:
+        start, end = start_date.isoformat(), end_date.isoformat()
+        return [
+            deadline
+            for bucket in self._store.get(user_id, {}).values()
+            for deadline in bucket.values()
+            if start <= deadline.due_date <= end
+        ]
+
+    def list_for_user(self, user_id: UUID) -> list[Deadline]:
+        return [
+            deadline
+            for bucket in self._store.get(user_id, {}).values()
+            for deadline in bucket.values()
+        ]
+
     def get_by_id(
         self, user_id: UUID, course_id: UUID, deadline_id: UUID
     ) -> Deadline | None:
@@ -69,27 +146,19 @@ class InMemoryDeadlineRepository:
         deadline_id: UUID,
         data: DeadlineUpdate,
     ) -> Deadline | None:
-        bucket = self._user_course(user_id, course_id)
-        existing = bucket.get(deadline_id)
-        if existing is None:
-            return None
-
-        updated = existing.model_copy(
-            update={
-                k: v
-                for k, v in data.model_dump(exclude_unset=True).items()
-                if v is not None
-            }
-        )
-        bucket[deadline_id] = updated
-        return updated
+        changes = {
+            k: v
+            for k, v in data.model_dump(exclude_unset=True).items()
+            if v is not None
+        }
+        return self._replace(user_id, course_id, deadline_id, changes)
 
     def delete(self, user_id: UUID, course_id: UUID, deadline_id: UUID) -> bool:
-        bucket = self._user_course(user_id, course_id)
-        if deadline_id in bucket:
-            del bucket[deadline_id]
+        with self._locks(user_id):
+            if deadline_id not in self._user_course(user_id, course_id):
+                return False
+            self._remove(user_id, course_id, deadline_id)
             return True
-        return False
 
     def mark_exported(
         self,
@@ -98,15 +167,27 @@ class InMemoryDeadlineRepository:
         deadline_id: UUID,
         gcal_event_id: str,
     ) -> Deadline | None:
-        bucket = self._user_course(user_id, course_id)
-        existing = bucket.get(deadline_id)
-        if existing is None:
-            return None
-        updated = existing.model_copy(
-            update={"exported_to_gcal": True, "gcal_event_id": gcal_event_id}
+        return self._replace(
+            user_id,
+            course_id,
+            deadline_id,
+            {"exported_to_gcal": True, "gcal_event_id": gcal_event_id},
         )
-        bucket[deadline_id] = updated
-        return updated
+
+    def _replace(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        deadline_id: UUID,
+        changes: dict,
+    ) -> Deadline | None:
+        with self._locks(user_id):
+            existing = self._user_course(user_id, course_id).get(deadline_id)
+            if existing is None:
+                return None
+            updated = existing.model_copy(update=changes)
+            self._put(user_id, course_id, [updated])
+            return updated
 
     def clear(self) -> None:
-        self._store.clear()
+        self._store = {}
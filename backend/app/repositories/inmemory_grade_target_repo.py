@@ -8,10 +8,17 @@ from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from app.repositories.base import StoredGradeTarget
+from app.repositories.inmemory_locks import DEFAULT_LOCK_STRIPES, LockStripes
 
 
 class InMemoryGradeTargetRepository:
-    def __init__(self) -> None:
+    """Writes are striped by course; records are replaced, never edited.
+
+    See ``app.repositories.inmemory_locks``.
+    """
+
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        self._locks = LockStripes(lock_stripes)
         # Maps course_id -> target data
         self._targets: dict[UUID, dict] = {}
         # Reference to course repo needed to verify ownership
@@ -23,8 +30,10 @@ class InMemoryGradeTargetRepository:
 
     def unregister_course(self, course_id: UUID) -> None:
         """Call this when a course is deleted."""
-        self._course_ownership.pop(course_id, None)
-        self._targets.pop(course_id, None)
+        with self._locks(course_id):
+            self._course_ownership.pop(course_id, None)
+            if course_id in self._targets:
+                self._remove(course_id)
 
     def _verify_ownership(self, user_id: UUID, course_id: UUID) -> bool:
         owner = self._course_ownership.get(course_id)
@@ -38,15 +47,20 @@ class InMemoryGradeTargetRepository:
     ) -> StoredGradeTarget:
         # In practice, the service layer should verify course ownership
         # For in-memory testing, we trust the caller or skip verification
-        target_id = self._targets.get(course_id, {}).get("target_id") or uuid4()
-        created_at = self._targets.get(course_id, {}).get("created_at") or datetime.now(UTC)
-
-        self._targets[course_id] = {
-            "target_id": target_id,
-            "course_id": course_id,
-            "target_percentage": target_percentage,
-            "created_at": created_at,
-        }
+        with self._locks(course_id):
+            existing = self._targets.get(course_id, {})
+            target_id = existing.get("target_id") or uuid4()
+            created_at = existing.get("created_at") or datetime.now(UTC)
+
+            self._put(
+                {
+                    "target_id": target_id,
+                    "course_id": course_id,
+                    "user_id": user_id,
+                    "target_percentage": target_percentage,
+                    "created_at": created_at,
+                }
+            )
         return StoredGradeTarget(
             target_id=target_id,
             course_id=course_id,
@@ -65,12 +79,34 @@ class InMemoryGradeTargetRepository:
             created_at=data["created_at"],
         )
 
+    def list_targets(self, user_id: UUID) -> list[StoredGradeTarget]:
+        return [
+            StoredGradeTarget(
+                target_id=data["target_id"],
+                course_id=data["course_id"],
+                target_percentage=data["target_percentage"],
+                created_at=data["created_at"],
+            )
+            # list() snapshots the dict so concurrent writers cannot resize it mid-loop.
+            for data in list(self._targets.values())
+            if data.get("user_id") == user_id
+        ]
+
     def delete_target(self, user_id: UUID, course_id: UUID) -> bool:
-        if course_id not in self._targets:
-            return False
-        del self._targets[course_id]
-        return True
+        with self._locks(course_id):
+            if course_id not in self._targets:
+                return False
+            self._remove(course_id)
+            return True
+
+    # Every write goes through _put/_remove, with the course's stripe lock held.
+
+    def _put(self, data: dict) -> None:
+        self._targets[data["course_id"]] = data
+
+    def _remove(self, course_id: UUID) -> None:
+        self._targets.pop(course_id, None)
 
     def clear(self) -> None:
-        self._targets.clear()
-        self._course_ownership.clear()
+        self._targets = {}
+        self._course_ownership = {}
@@ -0,0 +1,31 @@
+"""Write locking shared by the in-memory repositories.
+
+Sync routes run on a thread pool, so the in-memory repositories are used
+concurrently. They all follow the same scheme:
+
+- Writers take the lock of the stripe their key hashes to, build a new
+  container with the change applied, and publish it with one assignment.
+- Published containers and the values inside them are never mutated again.
+  Readers take no lock; they see either the old version or the new one,
+  never a half-applied write.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable
+
+DEFAULT_LOCK_STRIPES = 64
+
+
+class LockStripes:
+    """A fixed pool of locks indexed by key hash.
+
+    Writes for different users rarely share a stripe, so they do not wait on
+    each other, while the lock count stays bounded however many users exist.
+    """
+
+    def __init__(self, stripes: int = DEFAULT_LOCK_STRIPES) -> None:
+        self._locks = tuple(threading.Lock() for _ in range(max(1, stripes)))
+
+    def __call__(self, key: Hashable) -> threading.Lock:
+        return self._locks[hash(key) % len(self._locks)]
@@ -4,15 +4,37 @@ from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from app.repositories.base import StoredScenario, StoredScenarioEntry
+from app.repositories.inmemory_locks import DEFAULT_LOCK_STRIPES, LockStripes
 
 
 class InMemoryScenarioRepository:
-    def __init__(self) -> None:
+    """Copy-on-write per user; see ``app.repositories.inmemory_locks``."""
+
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
         # {user_id: {course_id: {scenario_id: StoredScenario}}}
         self._store: dict[UUID, dict[UUID, dict[UUID, StoredScenario]]] = {}
+        self._locks = LockStripes(lock_stripes)
 
     def _user_course_bucket(self, user_id: UUID, course_id: UUID) -> dict[UUID, StoredScenario]:
-        return self._store.setdefault(user_id, {}).setdefault(course_id, {})
+        """The published bucket; read-only, copy it before changing anything."""
+        return self._store.get(user_id, {}).get(course_id, {})
+
+    # Every write publishes through _put/_remove, with the user's stripe lock held.
+
+    def _put(self, user_id: UUID, course_id: UUID, scenario: StoredScenario) -> None:
+        bucket = dict(self._user_course_bucket(user_id, course_id))
+        bucket[scenario.scenario_id] = scenario
+        self._publish(user_id, course_id, bucket)
+
+    def _remove(self, user_id: UUID, course_id: UUID, scenario_id: UUID) -> None:
+        bucket = dict(self._user_course_bucket(user_id, course_id))
+        bucket.pop(scenario_id, None)
+        self._publish(user_id, course_id, bucket)
+
+    def _publish(self, user_id: UUID, course_id: UUID, bucket: dict[UUID, StoredScenario]) -> None:
+        user_buckets = dict(self._store.get(user_id, {}))
+        user_buckets[course_id] = bucket
+        self._store[user_id] = user_buckets
 
     def create(
         self,
@@ -28,7 +50,8 @@ class InMemoryScenarioRepository:
             entries=list(entries),
             created_at=datetime.now(UTC).isoformat(),
         )
-        self._user_course_bucket(user_id, course_id)[scenario_id] = stored
+        with self._locks(user_id):
+            self._put(user_id, course_id, stored)
         return stored
 
     def list_all(self, user_id: UUID, course_id: UUID) -> list[StoredScenario]:
@@ -40,11 +63,11 @@ class InMemoryScenarioRepository:
         return bucket.get(scenario_id)
 
     def delete(self, user_id: UUID, course_id: UUID, scenario_id: UUID) -> bool:
-        bucket = self._user_course_bucket(user_id, course_id)
-        if scenario_id not in bucket:
-            return False
-        del bucket[scenario_id]
-        return True
+        with self._locks(user_id):
+            if scenario_id not in self._user_course_bucket(user_id, course_id):
+                return False
+            self._remove(user_id, course_id, scenario_id)
+            return True
 
     def clear(self) -> None:
-        self._store.clear()
+        self._store = {}
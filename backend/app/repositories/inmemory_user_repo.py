@@ -1,28 +1,42 @@
 from uuid import UUID, uuid4
 
 from app.repositories.base import StoredUser
+from app.repositories.inmemory_locks import DEFAULT_LOCK_STRIPES, LockStripes
 
 
 class InMemoryUserRepository:
-    def __init__(self) -> None:
+    """Users are immutable once created, so reads are plain dict lookups.
+
+    Registration is striped by normalized email: the uniqueness check and
+    the insert happen under the same lock.
+    """
+
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
         self._users_by_id: dict[UUID, StoredUser] = {}
         self._user_ids_by_email: dict[str, UUID] = {}
+        self._locks = LockStripes(lock_stripes)
 
     def create_user(self, email: str, password_hash: str) -> StoredUser:
         normalized_email = email.strip().lower()
-        if normalized_email in self._user_ids_by_email:
-            raise ValueError(f"User already exists for email {normalized_email}")
-
-        user_id = uuid4()
-        stored = StoredUser(
-            user_id=user_id,
-            email=normalized_email,
-            password_hash=password_hash,
-        )
-        self._users_by_id[user_id] = stored
-        self._user_ids_by_email[normalized_email] = user_id
+        with self._locks(normalized_email):
+            if normalized_email in self._user_ids_by_email:
+                raise ValueError(f"User already exists for email {normalized_email}")
+
+            user_id = uuid4()
+            stored = StoredUser(
+                user_id=user_id,
+                email=normalized_email,
+                password_hash=password_hash,
+            )
+            self._put(stored)
         return stored
 
+    def _put(self, stored: StoredUser) -> None:
+        # Caller holds the email's stripe lock. By id first: an email hit
+        # must always resolve to a user.
+        self._users_by_id[stored.user_id] = stored
+        self._user_ids_by_email[stored.email] = stored.user_id
+
     def get_by_email(self, email: str) -> StoredUser | None:
         normalized_email = email.strip().lower()
         user_id = self._user_ids_by_email.get(normalized_email)
@@ -34,5 +48,5 @@ class InMemoryUserRepository:
         return self._users_by_id.get(user_id)
 
     def clear(self) -> None:
-        self._users_by_id.clear()
-        self._user_ids_by_email.clear()
+        self._users_by_id = {}
+        self._user_ids_by_email = {}
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import logging
+import threading
+from collections import Counter, defaultdict
 from decimal import Decimal
-from typing import Any
-from uuid import UUID
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
 
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db import AssessmentDB, CourseDB, RuleDB
 from app.models import Assessment, ChildAssessment, CourseCreate
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+_set_attr = object.__setattr__
+
+logger = logging.getLogger(__name__)
+
+
+def _trusted(model_cls: type[ModelT], **values: Any) -> ModelT:
+    """Instantiate ``model_cls`` from already-validated values, skipping validation.
+
+    Same result as ``model_cls.model_construct(**values)`` when every field is
+    passed, without its per-field default handling, which made it slower than
+    plain validation for these small models.
+    """
+    instance = model_cls.__new__(model_cls)
+    _set_attr(instance, "__dict__", values)
+    _set_attr(instance, "__pydantic_fields_set__", set(values))
+    _set_attr(instance, "__pydantic_extra__", None)
+    _set_attr(instance, "__pydantic_private__", None)
+    return instance
+
 
 def _to_float(value: Decimal | float | int | None) -> float | None:
     if value is None:
@@ -76,6 +99,61 @@ def persist_course_assessments(
     session.flush()
 
 
+def build_assessment_rows(
+    course_id: UUID,
+    assessments: list[Assessment],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Insert values for ``assessments`` and their rules, for bulk ``insert()``.
+
+    Ids are assigned here rather than by a flush, so a whole batch of courses
+    can go out in one statement per table. Parents come before their children.
+    """
+    assessment_rows: list[dict[str, Any]] = []
+    rule_rows: list[dict[str, Any]] = []
+    for position, assessment in enumerate(assessments):
+        parent_id = uuid4()
+        assessment_rows.append(
+            {
+                "id": parent_id,
+                "course_id": course_id,
+                "parent_assessment_id": None,
+                "name": assessment.name,
+                "weight": float(assessment.weight),
+                "raw_score": _to_float(assessment.raw_score),
+                "total_score": _to_float(assessment.total_score),
+                "is_bonus": bool(assessment.is_bonus),
+                "position": position,
+            }
+        )
+        if assessment.rule_type:
+            rule_rows.append(
+                {
+                    "id": uuid4(),
+                    "assessment_id": parent_id,
+                    "rule_type": assessment.rule_type,
+                    "rule_config": _normalize_rule_config_for_persistence(
+                        rule_type=assessment.rule_type,
+                        raw=assessment.rule_config,
+                    ),
+                }
+            )
+        for child_position, child in enumerate(assessment.children or []):
+            assessment_rows.append(
+                {
+                    "id": uuid4(),
+                    "course_id": course_id,
+                    "parent_assessment_id": parent_id,
+                    "name": child.name,
+                    "weight": float(child.weight),
+                    "raw_score": _to_float(child.raw_score),
+                    "total_score": _to_float(child.total_score),
+                    "is_bonus": False,
+                    "position": child_position,
+                }
+            )
+    return assessment_rows, rule_rows
+
+
 def sync_course_assessments(
     session: Session,
     course_id: UUID,
@@ -184,6 +262,11 @@ def sync_course_assessments(
 
 
 def hydrate_course_aggregate(session: Session, course_row: CourseDB) -> CourseCreate:
+    """Build the aggregate from its rows without re-running model validation.
+
+    Everything in these tables was validated on the way in, so reads build the
+    models with ``_trusted``. Request bodies still go through full validation.
+    """
     parent_rows = session.scalars(
         select(AssessmentDB)
         .where(
@@ -224,10 +307,11 @@ def hydrate_course_aggregate(session: Session, course_row: CourseDB) -> CourseCr
         if child_row.parent_assessment_id is None:
             continue
         children_by_parent[child_row.parent_assessment_id].append(
-            ChildAssessment(
+            _trusted(
+                ChildAssessment,
                 assessment_id=child_row.id,
                 name=child_row.name,
-                weight=float(child_row.weight),
+                weight=_to_float(child_row.weight),
                 raw_score=_to_float(child_row.raw_score),
                 total_score=_to_float(child_row.total_score),
             )
@@ -236,12 +320,13 @@ def hydrate_course_aggregate(session: Session, course_row: CourseDB) -> CourseCr
     assessments: list[Assessment] = []
     for parent_row in parent_rows:
         rule = rules_by_assessment.get(parent_row.id)
-        children = children_by_parent.get(parent_row.id, [])
+        children = children_by_parent.get(parent_row.id)
         assessments.append(
-            Assessment(
+            _trusted(
+                Assessment,
                 assessment_id=parent_row.id,
                 name=parent_row.name,
-                weight=float(parent_row.weight),
+                weight=_to_float(parent_row.weight),
                 raw_score=_to_float(parent_row.raw_score),
                 total_score=_to_float(parent_row.total_score),
                 children=children or None,
@@ -254,7 +339,8 @@ def hydrate_course_aggregate(session: Session, course_row: CourseDB) -> CourseCr
             )
         )
 
-    return CourseCreate(
+    return _trusted(
+        CourseCreate,
         name=course_row.name,
         term=course_row.term,
         bonus_policy=_normalize_bonus_policy(course_row.bonus_policy),
@@ -263,6 +349,110 @@ def hydrate_course_aggregate(session: Session, course_row: CourseDB) -> CourseCr
     )
 
 
+# Bump when the snapshot layout changes; older snapshots are then ignored and
+# reads fall back to the relational tables until the rebuild script runs.
+COURSE_SNAPSHOT_FORMAT = 1
+
+
+def dump_course_snapshot(course: CourseCreate) -> dict[str, Any]:
+    return {"format": COURSE_SNAPSHOT_FORMAT, "course": course.model_dump(mode="json")}
+
+
+_snapshot_fallbacks: Counter[str] = Counter()
+_snapshot_fallbacks_lock = threading.Lock()
+
+
+def snapshot_fallback_counts() -> dict[str, int]:
+    """Snapshot reads that fell back to relational hydration, by reason."""
+    with _snapshot_fallbacks_lock:
+        return dict(_snapshot_fallbacks)
+
+
+def _count_snapshot_fallback(reason: str) -> None:
+    with _snapshot_fallbacks_lock:
+        _snapshot_fallbacks[reason] += 1
+
+
+def load_course_snapshot(snapshot: Any) -> CourseCreate | None:
+    """Rebuild the aggregate from a stored snapshot, or ``None`` if it is unusable.
+
+    Snapshots are written from validated aggregates, so like
+    ``hydrate_course_aggregate`` this builds the models with ``_trusted``.
+    Missing, outdated and malformed snapshots are counted by reason (see
+    ``snapshot_fallback_counts``); malformed ones are also logged.
+    """
+    if snapshot is None:
+        _count_snapshot_fallback("missing")
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("format") != COURSE_SNAPSHOT_FORMAT:
+        _count_snapshot_fallback("format")
+        return None
+    try:
+        return _course_from_snapshot(snapshot["course"])
+    except (KeyError, TypeError, ValueError, AttributeError) as exc:
+        _count_snapshot_fallback("malformed")
+        logger.warning("Ignoring malformed course snapshot: %r", exc)
+        return None
+
+
+def _course_from_snapshot(data: dict[str, Any]) -> CourseCreate:
+    assessments: list[Assessment] = []
+    for item in data["assessments"]:
+        children = [
+            _trusted(
+                ChildAssessment,
+                assessment_id=_snapshot_uuid(child["assessment_id"]),
+                name=child["name"],
+                weight=_to_float(child["weight"]),
+                raw_score=_to_float(child["raw_score"]),
+                total_score=_to_float(child["total_score"]),
+            )
+            for child in item["children"] or ()
+        ]
+        assessments.append(
+            _trusted(
+                Assessment,
+                assessment_id=_snapshot_uuid(item["assessment_id"]),
+                name=item["name"],
+                weight=_to_float(item["weight"]),
+                raw_score=_to_float(item["raw_score"]),
+                total_score=_to_float(item["total_score"]),
+                children=children or None,
+                rule_type=item["rule_type"],
+                rule_config=item["rule_config"],
+                is_bonus=bool(item["is_bonus"]),
+            )
+        )
+    return _trusted(
+        CourseCreate,
+        name=data["name"],
+        term=data["term"],
+        bonus_policy=data["bonus_policy"],
+        bonus_cap_percentage=_to_float(data["bonus_cap_percentage"]),
+        assessments=assessments,
+    )
+
+
+def _snapshot_uuid(value: str | None) -> UUID | None:
+    return UUID(value) if value is not None else None
+
+
+def load_course_aggregate(session: Session, course_row: CourseDB) -> CourseCreate:
+    """Read the aggregate from the row's snapshot, hydrating relationally if it is unusable."""
+    course = load_course_snapshot(course_row.snapshot)
+    if course is not None:
+        return course
+    return hydrate_course_aggregate(session=session, course_row=course_row)
+
+
+def refresh_course_snapshot(session: Session, course_row: CourseDB) -> CourseCreate:
+    """Rebuild ``course_row.snapshot`` from the relational rows in the current transaction."""
+    session.flush()
+    course = hydrate_course_aggregate(session=session, course_row=course_row)
+    course_row.snapshot = dump_course_snapshot(course)
+    return course
+
+
 def _normalize_rule_config(rule_type: str | None, raw: Any) -> dict[str, Any] | None:
     if raw is None:
         if rule_type == "mandatory_pass":
@@ -1,13 +1,19 @@
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import and_, delete, func, select, tuple_, update
 
-from app.db import CourseDB, SessionLocal, init_db
+from app.db import AssessmentDB, CourseDB, SessionLocal, init_db
 from app.models import CourseCreate
-from app.repositories.base import StoredCourse
+from app.repositories.base import (
+    CourseCursor,
+    CourseVersionConflictError,
+    StoredCourse,
+    StoredCourseSummary,
+)
 from app.repositories.postgres_course_mapper import (
-    hydrate_course_aggregate,
+    load_course_aggregate,
     persist_course_assessments,
+    refresh_course_snapshot,
     sync_course_assessments,
 )
 
@@ -30,11 +36,11 @@ class PostgresCourseRepository:
             session.flush()
 
             persist_course_assessments(session=session, course_id=row.id, assessments=course.assessments)
+            hydrated = refresh_course_snapshot(session=session, course_row=row)
+            stored = StoredCourse(course_id=row.id, course=hydrated, version=row.version)
 
             session.commit()
-            session.refresh(row)
-            hydrated = hydrate_course_aggregate(session=session, course_row=row)
-            return StoredCourse(course_id=row.id, course=hydrated)
+            return stored
 
     def create_course(self, user_id: UUID, course: CourseCreate) -> StoredCourse:
         return self.create(user_id=user_id, course=course)
@@ -46,14 +52,81 @@ class PostgresCourseRepository:
                 .where(CourseDB.user_id == user_id)
                 .order_by(CourseDB.created_at.asc(), CourseDB.id.asc())
             ).all()
+            return [self._to_stored(session, row) for row in rows]
+
+    def list_page(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourse]:
+        with self._session_factory() as session:
+            rows = session.scalars(
+                self._paged(select(CourseDB), user_id=user_id, limit=limit, after=after)
+            ).all()
+            return [self._to_stored(session, row) for row in rows]
+
+    def list_summaries(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None = None,
+        after: CourseCursor | None = None,
+    ) -> list[StoredCourseSummary]:
+        query = (
+            select(
+                CourseDB.id,
+                CourseDB.name,
+                CourseDB.term,
+                func.count(AssessmentDB.id),
+                CourseDB.created_at,
+            )
+            .outerjoin(
+                AssessmentDB,
+                and_(
+                    AssessmentDB.course_id == CourseDB.id,
+                    AssessmentDB.parent_assessment_id.is_(None),
+                ),
+            )
+            .group_by(CourseDB.id)
+        )
+        with self._session_factory() as session:
+            rows = session.execute(
+                self._paged(query, user_id=user_id, limit=limit, after=after)
+            ).all()
             return [
-                StoredCourse(
-                    course_id=row.id,
-                    course=hydrate_course_aggregate(session=session, course_row=row),
+                StoredCourseSummary(
+                    course_id=course_id,
+                    name=name,
+                    term=term,
+                    assessment_count=assessment_count,
+                    created_at=created_at,
                 )
-                for row in rows
+                for course_id, name, term, assessment_count, created_at in rows
             ]
 
+    @staticmethod
+    def _paged(query, *, user_id: UUID, limit: int | None, after: CourseCursor | None):
+        # Keyset over idx_courses_user_created: the row comparison and the
+        # ORDER BY both follow the index, so each page is a bounded range scan.
+        query = query.where(CourseDB.user_id == user_id)
+        if after is not None:
+            query = query.where(tuple_(CourseDB.created_at, CourseDB.id) > after)
+        query = query.order_by(CourseDB.created_at.asc(), CourseDB.id.asc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    @staticmethod
+    def _to_stored(session, row: CourseDB) -> StoredCourse:
+        return StoredCourse(
+            course_id=row.id,
+            course=load_course_aggregate(session=session, course_row=row),
+            version=row.version,
+            created_at=row.created_at,
+        )
+
     def list_courses(self, user_id: UUID) -> list[StoredCourse]:
         return self.list_all(user_id=user_id)
 
@@ -67,29 +140,44 @@ class PostgresCourseRepository:
             )
             if row is None:
                 return None
-            hydrated = hydrate_course_aggregate(session=session, course_row=row)
-            return StoredCourse(course_id=row.id, course=hydrated)
+            return self._to_stored(session, row)
 
     def get_course(self, user_id: UUID, course_id: UUID) -> StoredCourse | None:
         return self.get_by_id(user_id=user_id, course_id=course_id)
 
-    def update(self, user_id: UUID, course_id: UUID, course: CourseCreate) -> StoredCourse:
+    def update(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        course: CourseCreate,
+        expected_version: int | None = None,
+    ) -> StoredCourse:
         with self._session_factory() as session:
-            row = session.scalar(
-                select(CourseDB)
-                .where(
-                    CourseDB.user_id == user_id,
-                    CourseDB.id == course_id,
+            # Compare-and-set on the aggregate version instead of holding a row
+            # lock across the read-modify-write; a concurrent writer that got
+            # there first leaves zero matching rows. Without an expected
+            # version the update is unconditional, and the row lock it takes
+            # orders it after any concurrent writer.
+            conditions = [CourseDB.user_id == user_id, CourseDB.id == course_id]
+            if expected_version is not None:
+                conditions.append(CourseDB.version == expected_version)
+            result = session.execute(
+                update(CourseDB)
+                .where(*conditions)
+                .values(
+                    name=course.name,
+                    term=course.term,
+                    bonus_policy=course.bonus_policy,
+                    bonus_cap_percentage=course.bonus_cap_percentage,
+                    version=CourseDB.version + 1,
                 )
-                .with_for_update()
+                .execution_options(synchronize_session=False)
             )
-            if row is None:
-                raise KeyError(course_id)
-
-            row.name = course.name
-            row.term = course.term
-            row.bonus_policy = course.bonus_policy
-            row.bonus_cap_percentage = course.bonus_cap_percentage
+            if result.rowcount == 0:
+                session.rollback()
+                if expected_version is None or self.get_version(user_id, course_id) is None:
+                    raise KeyError(course_id)
+                raise CourseVersionConflictError(course_id, expected_version)
 
             sync_course_assessments(
                 session=session,
@@ -97,10 +185,21 @@ class PostgresCourseRepository:
                 assessments=course.assessments,
             )
 
+            row = session.get(CourseDB, course_id)
+            hydrated = refresh_course_snapshot(session=session, course_row=row)
+            stored = StoredCourse(course_id=row.id, course=hydrated, version=row.version)
+
             session.commit()
-            session.refresh(row)
-            hydrated = hydrate_course_aggregate(session=session, course_row=row)
-            return StoredCourse(course_id=row.id, course=hydrated)
+            return stored
+
+    def get_version(self, user_id: UUID, course_id: UUID) -> int | None:
+        with self._session_factory() as session:
+            return session.scalar(
+                select(CourseDB.version).where(
+                    CourseDB.user_id == user_id,
+                    CourseDB.id == course_id,
+                )
+            )
 
     def delete(self, user_id: UUID, course_id: UUID) -> None:
         with self._session_factory() as session:
@@ -3,10 +3,11 @@ from __future__ import annotations
 from datetime import UTC, date, datetime, time
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, tuple_
 
 from app.db import AssessmentDB, CourseDB, DeadlineDB, SessionLocal, init_db
 from app.models_deadline import Deadline, DeadlineCreate, DeadlineUpdate
+from app.repositories.base import DeadlineCursor
 
 
 class PostgresDeadlineRepository:
@@ -55,27 +56,42 @@ class PostgresDeadlineRepository:
             if data.assessment_id is not None and self._get_assessment(session, course_id, data.assessment_id) is None:
                 raise KeyError(f"Assessment {data.assessment_id} not found in course {course_id}")
 
-            due_date = date.fromisoformat(data.due_date)
-            due_time = time.fromisoformat(data.due_time) if data.due_time else None
-
-            row = DeadlineDB(
-                course_id=course_id,
-                assessment_id=data.assessment_id,
-                title=data.title,
-                deadline_type=data.deadline_type,
-                due_date=due_date,
-                due_time=due_time,
-                source=data.source,
-                notes=data.notes,
-                assessment_name=data.assessment_name,
-                exported_to_gcal=False,
-                gcal_event_id=None,
-            )
+            row = DeadlineDB(**self._insert_values(course_id, data))
             session.add(row)
             session.commit()
             session.refresh(row)
             return self._to_model(row)
 
+    def create_many(self, user_id: UUID, course_id: UUID, items: list[DeadlineCreate]) -> list[Deadline]:
+        if not items:
+            return []
+        with self._session_factory() as session:
+            if self._get_course(session, user_id, course_id) is None:
+                raise KeyError(course_id)
+
+            assessment_ids = {data.assessment_id for data in items if data.assessment_id is not None}
+            if assessment_ids:
+                found = set(
+                    session.scalars(
+                        select(AssessmentDB.id).where(
+                            AssessmentDB.course_id == course_id,
+                            AssessmentDB.id.in_(assessment_ids),
+                        )
+                    ).all()
+                )
+                missing = assessment_ids - found
+                if missing:
+                    raise KeyError(f"Assessment {sorted(missing, key=str)[0]} not found in course {course_id}")
+
+            # One multi-row INSERT ... RETURNING for the whole batch.
+            rows = session.scalars(
+                insert(DeadlineDB).returning(DeadlineDB, sort_by_parameter_order=True),
+                [self._insert_values(course_id, data) for data in items],
+            ).all()
+            created = [self._to_model(row) for row in rows]
+            session.commit()
+            return created
+
     def list_all(self, user_id: UUID, course_id: UUID) -> list[Deadline]:
         with self._session_factory() as session:
             rows = session.scalars(
@@ -89,6 +105,59 @@ class PostgresDeadlineRepository:
             ).all()
             return [self._to_model(row) for row in rows]
 
+    def list_page(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        *,
+        limit: int,
+        after: DeadlineCursor | None = None,
+    ) -> list[Deadline]:
+        query = (
+            select(DeadlineDB)
+            .join(CourseDB, DeadlineDB.course_id == CourseDB.id)
+            .where(
+                DeadlineDB.course_id == course_id,
+                CourseDB.user_id == user_id,
+            )
+        )
+        if after is not None:
+            # Same column order as idx_deadlines_course_due_order.
+            query = query.where(
+                tuple_(DeadlineDB.due_date, DeadlineDB.created_at, DeadlineDB.id) > after
+            )
+        with self._session_factory() as session:
+            rows = session.scalars(
+                query.order_by(
+                    DeadlineDB.due_date.asc(), DeadlineDB.created_at.asc(), DeadlineDB.id.asc()
+                ).limit(limit)
+            ).all()
+            return [self._to_model(row) for row in rows]
+
+    def list_in_range(self, user_id: UUID, start_date: date, end_date: date) -> list[Deadline]:
+        with self._session_factory() as session:
+            rows = session.scalars(
+                select(DeadlineDB)
+                .join(CourseDB, DeadlineDB.course_id == CourseDB.id)
+                .where(
+                    CourseDB.user_id == user_id,
+                    DeadlineDB.due_date >= start_date,
+                    DeadlineDB.due_date <= end_date,
+                )
+                .order_by(DeadlineDB.due_date.asc(), DeadlineDB.created_at.asc(), DeadlineDB.id.asc())
+            ).all()
+            return [self._to_model(row) for row in rows]
+
+    def list_for_user(self, user_id: UUID) -> list[Deadline]:
+        with self._session_factory() as session:
+            rows = session.scalars(
+                select(DeadlineDB)
+                .join(CourseDB, DeadlineDB.course_id == CourseDB.id)
+                .where(CourseDB.user_id == user_id)
+                .order_by(DeadlineDB.due_date.asc(), DeadlineDB.created_at.asc(), DeadlineDB.id.asc())
+            ).all()
+            return [self._to_model(row) for row in rows]
+
     def get_by_id(self, user_id: UUID, course_id: UUID, deadline_id: UUID) -> Deadline | None:
         with self._session_factory() as session:
             row = self._get_deadline(session, user_id, course_id, deadline_id)
@@ -166,6 +235,22 @@ class PostgresDeadlineRepository:
             session.execute(delete(DeadlineDB))
             session.commit()
 
+    @staticmethod
+    def _insert_values(course_id: UUID, data: DeadlineCreate) -> dict:
+        return {
+            "course_id": course_id,
+            "assessment_id": data.assessment_id,
+            "title": data.title,
+            "deadline_type": data.deadline_type,
+            "due_date": date.fromisoformat(data.due_date),
+            "due_time": time.fromisoformat(data.due_time) if data.due_time else None,
+            "source": data.source,
+            "notes": data.notes,
+            "assessment_name": data.assessment_name,
+            "exported_to_gcal": False,
+            "gcal_event_id": None,
+        }
+
     @staticmethod
     def _to_model(row: DeadlineDB) -> Deadline:
         created_at = row.created_at
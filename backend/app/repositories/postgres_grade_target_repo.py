@@ -87,6 +87,15 @@ class PostgresGradeTargetRepository:
                 return None
             return self._to_stored(row)
 
+    def list_targets(self, user_id: UUID) -> list[StoredGradeTarget]:
+        with self._session_factory() as session:
+            rows = session.scalars(
+                select(GradeTargetDB)
+                .join(CourseDB, GradeTargetDB.course_id == CourseDB.id)
+                .where(CourseDB.user_id == user_id)
+            ).all()
+            return [self._to_stored(row) for row in rows]
+
     def delete_target(self, user_id: UUID, course_id: UUID) -> bool:
         with self._session_factory() as session:
             # Verify course belongs to user
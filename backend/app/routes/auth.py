@@ -6,12 +6,13 @@ from app.config import (
     AUTH_COOKIE_NAME,
 )
 from app.dependencies import (
+    get_async_grade_target_repo,
     get_auth_service,
     get_course_service,
     get_current_user,
-    get_grade_target_repo,
+    run_db,
 )
-from app.repositories.base import GradeTargetRepository
+from app.repositories.base import AsyncGradeTargetRepository
 from app.services.auth_service import (
     AuthConflictError,
     AuthService,
@@ -86,7 +87,7 @@ def logout_user(response: Response):
 
 
 @router.get("/me")
-def get_me(current_user: AuthenticatedUser = Depends(get_current_user)):
+async def get_me(current_user: AuthenticatedUser = Depends(get_current_user)):
     return {
         "user_id": str(current_user.user_id),
         "email": current_user.email,
@@ -94,20 +95,21 @@ def get_me(current_user: AuthenticatedUser = Depends(get_current_user)):
 
 
 @router.get("/me/state")
-def get_user_state(
+async def get_user_state(
     current_user: AuthenticatedUser = Depends(get_current_user),
     service: CourseService = Depends(get_course_service),
-    grade_target_repo: GradeTargetRepository = Depends(get_grade_target_repo),
+    grade_target_repo: AsyncGradeTargetRepository = Depends(get_async_grade_target_repo),
 ):
     # Pragmatic placement for ITR3-1; move to a dedicated users/profile router if this expands.
-    courses = service.list_courses(user_id=current_user.user_id)
+    # First call on every app load: one summary query and one target query, no aggregates.
+    courses = await run_db(service.list_course_summaries, user_id=current_user.user_id)
+    targets_by_course = {
+        target.course_id: target
+        for target in await grade_target_repo.list_targets(user_id=current_user.user_id)
+    }
     course_summaries = []
     for course in courses:
-        course_id = course["course_id"]
-        target_record = grade_target_repo.get_target(
-            user_id=current_user.user_id,
-            course_id=course_id,
-        )
+        target_record = targets_by_course.get(course.course_id)
         target_pct = (
             float(target_record.target_percentage)
             if target_record and target_record.target_percentage is not None
@@ -115,10 +117,10 @@ def get_user_state(
         )
 
         summary = {
-            "course_id": str(course_id),
-            "name": course.get("name", ""),
-            "term": course.get("term"),
-            "assessment_count": len(course.get("assessments", [])),
+            "course_id": str(course.course_id),
+            "name": course.name,
+            "term": course.term,
+            "assessment_count": course.assessment_count,
             "target_percentage": target_pct,
         }
         course_summaries.append(summary)
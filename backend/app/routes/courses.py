@@ -1,16 +1,23 @@
 from decimal import Decimal
-from typing import Any
+from typing import Any, Literal
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
-from app.dependencies import get_course_service, get_current_user, get_grade_target_repo
-from app.repositories.base import GradeTargetRepository
+from app.dependencies import (
+    get_async_grade_target_repo,
+    get_course_service,
+    get_current_user,
+    run_db,
+)
+from app.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from app.repositories.base import AsyncGradeTargetRepository
 from app.models import CourseCreate
 from app.services.auth_service import AuthenticatedUser
 from app.services.course_service import (
+    CourseConflictError,
     CourseNotFoundError,
     CourseService,
     CourseValidationError,
@@ -94,59 +101,81 @@ class WhatIfRequest(BaseModel):
 
 
 @router.post("/")
-def create_course(
+async def create_course(
     course: CourseCreate,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.create_course(user_id=current_user.user_id, course=course)
+        return await run_db(service.create_course, user_id=current_user.user_id, course=course)
     except (CourseValidationError, ValueError) as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get("/")
-def list_courses(
+async def list_courses(
+    response: Response,
+    view: Literal["full", "summary"] = "full",
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    return service.list_courses(user_id=current_user.user_id)
+    try:
+        courses, next_cursor = await run_db(
+            service.list_courses_page,
+            user_id=current_user.user_id,
+            limit=limit,
+            cursor=cursor,
+            view=view,
+        )
+    except CourseValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return courses
 
 
 @router.put("/{course_id}/structure")
-def update_course_structure(
+async def update_course_structure(
     course_id: UUID,
     course: CourseCreate,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.update_course_structure(
+        return await run_db(
+            service.update_course_structure,
             user_id=current_user.user_id,
             course_id=course_id,
             course_update=course,
         )
     except CourseNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except CourseConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
     except (CourseValidationError, ValueError) as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.put("/{course_id}/weights")
-def update_course_weights(
+async def update_course_weights(
     course_id: UUID,
     payload: CourseWeightsUpdateRequest,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.update_course_weights(
+        return await run_db(
+            service.update_course_weights,
             user_id=current_user.user_id,
             course_id=course_id,
             assessments=[assessment.model_dump() for assessment in payload.assessments],
         )
     except CourseNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except CourseConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
     except (CourseValidationError, ValueError) as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ValueError as exc:
@@ -154,20 +183,23 @@ def update_course_weights(
 
 
 @router.put("/{course_id}/grades")
-def update_course_grades(
+async def update_course_grades(
     course_id: UUID,
     payload: CourseGradesUpdateRequest,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.update_course_grades(
+        return await run_db(
+            service.update_course_grades,
             user_id=current_user.user_id,
             course_id=course_id,
             assessments=[assessment.model_dump() for assessment in payload.assessments],
         )
     except CourseNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except CourseConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
     except CourseValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ValueError as exc:
@@ -175,14 +207,15 @@ def update_course_grades(
 
 
 @router.put("/{course_id}")
-def update_course_metadata(
+async def update_course_metadata(
     course_id: UUID,
     payload: CourseMetadataUpdateRequest,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.update_course_metadata(
+        return await run_db(
+            service.update_course_metadata,
             user_id=current_user.user_id,
             course_id=course_id,
             name=payload.name,
@@ -190,18 +223,21 @@ def update_course_metadata(
         )
     except CourseNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except CourseConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
     except CourseValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.delete("/{course_id}")
-def delete_course(
+async def delete_course(
     course_id: UUID,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.delete_course(
+        return await run_db(
+            service.delete_course,
             user_id=current_user.user_id,
             course_id=course_id,
         )
@@ -210,20 +246,21 @@ def delete_course(
 
 
 @router.post("/{course_id}/target")
-def check_target_feasibility(
+async def check_target_feasibility(
     course_id: UUID,
     payload: TargetGradeRequest,
     service: CourseService = Depends(get_course_service),
-    grade_target_repo: GradeTargetRepository = Depends(get_grade_target_repo),
+    grade_target_repo: AsyncGradeTargetRepository = Depends(get_async_grade_target_repo),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        result = service.check_target_feasibility(
+        result = await run_db(
+            service.check_target_feasibility,
             user_id=current_user.user_id,
             course_id=course_id,
             target=payload.target,
         )
-        grade_target_repo.set_target(
+        await grade_target_repo.set_target(
             user_id=current_user.user_id,
             course_id=course_id,
             target_percentage=payload.target,
@@ -234,18 +271,18 @@ def check_target_feasibility(
 
 
 @router.get("/{course_id}/target")
-def get_saved_target(
+async def get_saved_target(
     course_id: UUID,
     service: CourseService = Depends(get_course_service),
-    grade_target_repo: GradeTargetRepository = Depends(get_grade_target_repo),
+    grade_target_repo: AsyncGradeTargetRepository = Depends(get_async_grade_target_repo),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        service.get_course(user_id=current_user.user_id, course_id=course_id)
+        await run_db(service.get_course, user_id=current_user.user_id, course_id=course_id)
     except CourseNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
-    record = grade_target_repo.get_target(
+    record = await grade_target_repo.get_target(
         user_id=current_user.user_id,
         course_id=course_id,
     )
@@ -260,18 +297,18 @@ def get_saved_target(
 
 
 @router.delete("/{course_id}/target", status_code=204)
-def delete_saved_target(
+async def delete_saved_target(
     course_id: UUID,
     service: CourseService = Depends(get_course_service),
-    grade_target_repo: GradeTargetRepository = Depends(get_grade_target_repo),
+    grade_target_repo: AsyncGradeTargetRepository = Depends(get_async_grade_target_repo),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        service.get_course(user_id=current_user.user_id, course_id=course_id)
+        await run_db(service.get_course, user_id=current_user.user_id, course_id=course_id)
     except CourseNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
-    deleted = grade_target_repo.delete_target(
+    deleted = await grade_target_repo.delete_target(
         user_id=current_user.user_id,
         course_id=course_id,
     )
@@ -280,7 +317,7 @@ def delete_saved_target(
 
 
 @router.post("/{course_id}/minimum-required")
-def get_minimum_required_score(
+async def get_minimum_required_score(
     course_id: UUID,
     payload: MinimumRequiredRequest,
     service: CourseService = Depends(get_course_service),
@@ -291,14 +328,15 @@ def get_minimum_required_score(
     Returns the minimum score needed on a specific assessment to achieve target grade.
     """
     try:
-        result = service.get_minimum_required_score(
+        result = await run_db(
+            service.get_minimum_required_score,
             user_id=current_user.user_id,
             course_id=course_id,
             target=payload.target,
             assessment_name=payload.assessment_name,
         )
-        stored_course = service.get_course(
-            user_id=current_user.user_id, course_id=course_id
+        stored_course = (
+            await run_db(service.get_course, user_id=current_user.user_id, course_id=course_id)
         ).course
         target_assessment, _ = resolve_assessment_target(
             stored_course, payload.assessment_name
@@ -326,7 +364,7 @@ def get_minimum_required_score(
 
 
 @router.post("/{course_id}/whatif")
-def run_whatif_scenario(
+async def run_whatif_scenario(
     course_id: UUID,
     payload: WhatIfRequest,
     service: CourseService = Depends(get_course_service),
@@ -337,14 +375,15 @@ def run_whatif_scenario(
     Calculates projected grade based on a hypothetical score. Read-only operation.
     """
     try:
-        result = service.run_whatif_scenario(
+        result = await run_db(
+            service.run_whatif_scenario,
             user_id=current_user.user_id,
             course_id=course_id,
             assessment_name=payload.assessment_name,
             hypothetical_score=payload.hypothetical_score,
         )
-        stored_course = service.get_course(
-            user_id=current_user.user_id, course_id=course_id
+        stored_course = (
+            await run_db(service.get_course, user_id=current_user.user_id, course_id=course_id)
         ).course
         projected_course = stored_course.model_copy(deep=True)
         apply_hypothetical_score(
@@ -14,10 +14,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from app.dependencies import get_course_service, get_current_user, get_grade_target_repo
-from app.repositories.base import GradeTargetRepository
+from app.dependencies import (
+    get_async_grade_target_repo,
+    get_course_service,
+    get_current_user,
+    run_db,
+)
+from app.repositories.base import AsyncGradeTargetRepository
 from app.services.auth_service import AuthenticatedUser
-from app.services.course_service import CourseNotFoundError, CourseService
+from app.services.course_service import CourseContext, CourseNotFoundError, CourseService
 from app.services.grading_service import calculate_uniform_required
 from app.services.strategy_service import (
     compute_grade_boundaries,
@@ -49,22 +54,29 @@ class UniformRequiredRequest(BaseModel):
 
 # ─── Helpers ───────────────────────────────────────────────────────────────────
 
-def _get_course(service: CourseService, user_id, course_id):
+async def _get_course(service: CourseService, user_id, course_id):
     try:
-        return service.get_course(user_id=user_id, course_id=course_id)
+        return await run_db(service.get_course, user_id=user_id, course_id=course_id)
     except CourseNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
-def _load_optional_deadlines(current_user: AuthenticatedUser, course_id: UUID) -> list[dict[str, Any]] | None:
+async def _load_optional_deadlines(
+    current_user: AuthenticatedUser,
+    course_id: UUID,
+    course_context: CourseContext | None = None,
+) -> list[dict[str, Any]] | None:
     try:
         from app.dependencies import get_deadline_service
 
         deadline_service = get_deadline_service()
-        return [
-            deadline.model_dump()
-            for deadline in deadline_service.list_deadlines(current_user.user_id, course_id)
-        ]
+        deadlines = await run_db(
+            deadline_service.list_deadlines,
+            current_user.user_id,
+            course_id,
+            course_context=course_context,
+        )
+        return [deadline.model_dump() for deadline in deadlines]
     except Exception:
         return None
 
@@ -78,7 +90,7 @@ def _resolve_dashboard_current_grade(boundaries: dict[str, Any]) -> float:
 # ─── Endpoints ─────────────────────────────────────────────────────────────────
 
 @router.get("")
-def get_dashboard(
+async def get_dashboard(
     course_id: UUID,
     service: CourseService = Depends(get_course_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
@@ -90,12 +102,12 @@ def get_dashboard(
     - Per-assessment breakdown with "Show Math" data
     - GPA conversions on current + best-case grades
     """
-    stored = _get_course(service, current_user.user_id, course_id)
+    stored = await _get_course(service, current_user.user_id, course_id)
     return compute_grade_boundaries(stored.course)
 
 
 @router.post("/whatif")
-def multi_whatif(
+async def multi_whatif(
     course_id: UUID,
     payload: MultiWhatIfRequest,
     service: CourseService = Depends(get_course_service),
@@ -107,7 +119,7 @@ def multi_whatif(
 
     This is **read-only** — no grades are persisted.
     """
-    stored = _get_course(service, current_user.user_id, course_id)
+    stored = await _get_course(service, current_user.user_id, course_id)
     scenario_dicts = [s.model_dump() for s in payload.scenarios]
     try:
         return compute_multi_whatif(stored.course, scenario_dicts)
@@ -116,10 +128,10 @@ def multi_whatif(
 
 
 @router.get("/strategies")
-def get_strategies(
+async def get_strategies(
     course_id: UUID,
     service: CourseService = Depends(get_course_service),
-    grade_target_repo: GradeTargetRepository = Depends(get_grade_target_repo),
+    grade_target_repo: AsyncGradeTargetRepository = Depends(get_async_grade_target_repo),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
@@ -131,10 +143,12 @@ def get_strategies(
     has deadlines and can include them in a POST body — this GET form works
     without them).
     """
-    stored = _get_course(service, current_user.user_id, course_id)
-    raw_deadlines = _load_optional_deadlines(current_user, course_id)
+    stored = await _get_course(service, current_user.user_id, course_id)
+    course_context = CourseContext(service)
+    course_context.add(current_user.user_id, stored)
+    raw_deadlines = await _load_optional_deadlines(current_user, course_id, course_context)
 
-    target_record = grade_target_repo.get_target(current_user.user_id, course_id)
+    target_record = await grade_target_repo.get_target(current_user.user_id, course_id)
     boundaries = compute_grade_boundaries(stored.course)
     current_grade = _resolve_dashboard_current_grade(boundaries)
 
@@ -150,7 +164,7 @@ def get_strategies(
 
 
 @router.post("/uniform-required")
-def get_uniform_required(
+async def get_uniform_required(
     course_id: UUID,
     payload: UniformRequiredRequest,
     service: CourseService = Depends(get_course_service),
@@ -161,5 +175,5 @@ def get_uniform_required(
     to reach the target. Uses binary search through the real grading engine
     so best_of, drop_lowest, mandatory_pass rules are all respected.
     """
-    stored = _get_course(service, current_user.user_id, course_id)
+    stored = await _get_course(service, current_user.user_id, course_id)
     return calculate_uniform_required(stored.course, payload.target)
@@ -35,8 +35,10 @@ from app.dependencies import (
     get_course_service,
     get_current_user,
     get_deadline_service,
+    get_extraction_executors,
     get_extraction_service,
     get_user_repo,
+    run_db,
 )
 from app.models_deadline import (
     Deadline,
@@ -48,9 +50,10 @@ from app.models_deadline import (
     DeadlineUpdate,
     GoogleAuthUrlResponse,
 )
+from app.pagination import MAX_PAGE_SIZE
 from app.repositories.base import UserRepository
 from app.services.auth_service import AuthService, AuthenticatedUser, AuthenticationError
-from app.services.course_service import CourseNotFoundError, CourseService
+from app.services.course_service import CourseContext, CourseNotFoundError, CourseService
 from app.services.deadline_service import (
     DeadlineValidationError,
     DeadlineService,
@@ -60,6 +63,11 @@ from app.services.deadline_service import (
     exchange_google_code,
     google_calendar_configured,
 )
+from app.services.extraction.executors import (
+    ClientDisconnectedError,
+    ExtractionExecutors,
+    ExtractionStageTimeoutError,
+)
 from app.services.extraction_service import ExtractionService
 
 router = APIRouter(tags=["Deadlines"])
@@ -77,6 +85,17 @@ def _ensure_course_exists(service: CourseService, user_id: UUID, course_id: UUID
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+async def _ensure_course_exists_async(service: CourseService, user_id: UUID, course_id: UUID):
+    return await run_db(_ensure_course_exists, service, user_id, course_id)
+
+
+def _course_context(service: CourseService, user_id: UUID, stored) -> CourseContext:
+    """Seed the request's course context with the course the route already loaded."""
+    context = CourseContext(service)
+    context.add(user_id, stored)
+    return context
+
+
 def _resolve_google_callback_user(
     request: Request,
     state: str,
@@ -141,9 +160,11 @@ def _resolve_google_callback_user(
 @router.post("/courses/{course_id}/deadlines/extract")
 async def extract_deadlines(
     course_id: UUID,
+    request: Request,
     file: UploadFile = File(...),
     course_service: CourseService = Depends(get_course_service),
     extraction_service: ExtractionService = Depends(get_extraction_service),
+    executors: ExtractionExecutors = Depends(get_extraction_executors),
     dl_service: DeadlineService = Depends(get_deadline_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
@@ -156,7 +177,7 @@ async def extract_deadlines(
     3. Save extracted deadlines to the in-memory repo.
     4. Return the deadlines for review / edit before calendar export.
     """
-    stored = _ensure_course_exists(course_service, current_user.user_id, course_id)
+    stored = await _ensure_course_exists_async(course_service, current_user.user_id, course_id)
 
     file_bytes = await file.read()
     if not file_bytes:
@@ -164,13 +185,30 @@ async def extract_deadlines(
     if len(file_bytes) > MAX_UPLOAD_BYTES:
         raise HTTPException(status_code=413, detail="File too large (max 10 MB)")
 
-    # Step 1 — extract text using existing pipeline
+    # Step 1 — extract text using existing pipeline. Text is extracted once
+    # (in a worker process) and shared with the fallback parser below.
+    filename = file.filename or "uploaded_file"
+    content_type = file.content_type or "application/octet-stream"
     try:
-        extraction_result = extraction_service.extract(
-            filename=file.filename or "uploaded_file",
-            content_type=file.content_type or "application/octet-stream",
+        text_result = await executors.ingest(
+            filename=filename,
+            content_type=content_type,
             file_bytes=file_bytes,
+            request=request,
         )
+        extraction_result = await executors.run_io(
+            extraction_service.extract,
+            filename=filename,
+            content_type=content_type,
+            file_bytes=file_bytes,
+            text_result=text_result,
+            read_full_text=executors.full_text_reader(filename, content_type, file_bytes),
+            request=request,
+        )
+    except ExtractionStageTimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+    except ClientDisconnectedError:
+        return Response(status_code=499)
     except Exception as exc:
         raise HTTPException(
             status_code=422, detail=f"Extraction failed: {exc}"
@@ -191,21 +229,16 @@ async def extract_deadlines(
             })
 
     # Step 3 — Additionally run our lightweight parser on raw text.
-    # If the extraction response doesn't expose raw_text, re-run text ingest
-    # directly from uploaded bytes to keep deadline extraction robust.
-    raw_text = getattr(extraction_result, "raw_text", "")
-    if not raw_text:
+    raw_text = text_result.get("text", "")
+    if raw_text:
         try:
-            text_result = extraction_service._extract_text(
-                filename=file.filename or "uploaded_file",
-                content_type=file.content_type or "application/octet-stream",
-                file_bytes=file_bytes,
+            parsed = await executors.run_io(
+                extract_deadlines_from_text, raw_text, stored.course.name, request=request
             )
-            raw_text = text_result.get("text", "")
-        except Exception:
-            raw_text = ""
-    if raw_text:
-        parsed = extract_deadlines_from_text(raw_text, stored.course.name)
+        except ExtractionStageTimeoutError as exc:
+            raise HTTPException(status_code=504, detail=str(exc)) from exc
+        except ClientDisconnectedError:
+            return Response(status_code=499)
         # Merge, avoiding duplicates by (title_lower, due_date)
         existing_keys = {(c["title"].lower(), c["due_date"]) for c in candidates}
         for p in parsed:
@@ -222,7 +255,8 @@ async def extract_deadlines(
             "count": 0,
         }
 
-    created = dl_service.import_extracted_deadlines(
+    created = await run_db(
+        dl_service.import_extracted_deadlines,
         user_id=current_user.user_id,
         course_id=course_id,
         raw_deadlines=candidates,
@@ -241,34 +275,60 @@ async def extract_deadlines(
     "/courses/{course_id}/deadlines",
     response_model=DeadlineListResponse,
 )
-def list_deadlines(
+async def list_deadlines(
     course_id: UUID,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     course_service: CourseService = Depends(get_course_service),
     dl_service: DeadlineService = Depends(get_deadline_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    _ensure_course_exists(course_service, current_user.user_id, course_id)
-    items = dl_service.list_deadlines(current_user.user_id, course_id)
-    return DeadlineListResponse(deadlines=items, count=len(items))
+    stored = await _ensure_course_exists_async(course_service, current_user.user_id, course_id)
+    course_context = _course_context(course_service, current_user.user_id, stored)
+    if limit is None and cursor is None:
+        items = await run_db(
+            dl_service.list_deadlines,
+            current_user.user_id,
+            course_id,
+            course_context=course_context,
+        )
+        return DeadlineListResponse(deadlines=items, count=len(items))
+
+    try:
+        items, next_cursor = await run_db(
+            dl_service.list_deadlines_page,
+            current_user.user_id,
+            course_id,
+            limit=limit,
+            cursor=cursor,
+            course_context=course_context,
+        )
+    except DeadlineValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return DeadlineListResponse(deadlines=items, count=len(items), next_cursor=next_cursor)
 
 
 @router.post("/courses/{course_id}/deadlines")
-def create_deadline(
+async def create_deadline(
     course_id: UUID,
     payload: DeadlineCreate,
     course_service: CourseService = Depends(get_course_service),
     dl_service: DeadlineService = Depends(get_deadline_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    _ensure_course_exists(course_service, current_user.user_id, course_id)
-    deadline = dl_service.create_deadline(
-        current_user.user_id, course_id, payload
+    stored = await _ensure_course_exists_async(course_service, current_user.user_id, course_id)
+    deadline = await run_db(
+        dl_service.create_deadline,
+        current_user.user_id,
+        course_id,
+        payload,
+        course_context=_course_context(course_service, current_user.user_id, stored),
     )
     return {"message": "Deadline created", "deadline": deadline.model_dump()}
 
 
 @router.put("/courses/{course_id}/deadlines/{deadline_id}")
-def update_deadline(
+async def update_deadline(
     course_id: UUID,
     deadline_id: UUID,
     payload: DeadlineUpdate,
@@ -276,9 +336,14 @@ def update_deadline(
     dl_service: DeadlineService = Depends(get_deadline_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    _ensure_course_exists(course_service, current_user.user_id, course_id)
-    updated = dl_service.update_deadline(
-        current_user.user_id, course_id, deadline_id, payload
+    stored = await _ensure_course_exists_async(course_service, current_user.user_id, course_id)
+    updated = await run_db(
+        dl_service.update_deadline,
+        current_user.user_id,
+        course_id,
+        deadline_id,
+        payload,
+        course_context=_course_context(course_service, current_user.user_id, stored),
     )
     if updated is None:
         raise HTTPException(status_code=404, detail="Deadline not found")
@@ -286,17 +351,15 @@ def update_deadline(
 
 
 @router.delete("/courses/{course_id}/deadlines/{deadline_id}")
-def delete_deadline(
+async def delete_deadline(
     course_id: UUID,
     deadline_id: UUID,
     course_service: CourseService = Depends(get_course_service),
     dl_service: DeadlineService = Depends(get_deadline_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    _ensure_course_exists(course_service, current_user.user_id, course_id)
-    removed = dl_service.delete_deadline(
-        current_user.user_id, course_id, deadline_id
-    )
+    await _ensure_course_exists_async(course_service, current_user.user_id, course_id)
+    removed = await run_db(dl_service.delete_deadline, current_user.user_id, course_id, deadline_id)
     if not removed:
         raise HTTPException(status_code=404, detail="Deadline not found")
     return {"message": "Deadline deleted"}
@@ -305,7 +368,7 @@ def delete_deadline(
 # ─── Export: ICS Download ──────────────────────────────────────────────────────
 
 @router.post("/courses/{course_id}/deadlines/export/ics")
-def export_ics(
+async def export_ics(
     course_id: UUID,
     payload: DeadlineExportRequest = DeadlineExportRequest(),
     course_service: CourseService = Depends(get_course_service),
@@ -316,14 +379,16 @@ def export_ics(
     Generate and return an .ics (iCalendar) file for the selected deadlines.
     Works with Google Calendar, Apple Calendar, Outlook, etc.
     """
-    stored = _ensure_course_exists(course_service, current_user.user_id, course_id)
+    stored = await _ensure_course_exists_async(course_service, current_user.user_id, course_id)
     try:
-        ics_content = dl_service.export_ics(
+        ics_content = await run_db(
+            dl_service.export_ics,
             user_id=current_user.user_id,
             course_id=course_id,
             course_name=stored.course.name,
             deadline_ids=payload.deadline_ids,
             min_grade_info=payload.min_grade_info,
+            course_context=_course_context(course_service, current_user.user_id, stored),
         )
     except DeadlineValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -465,6 +530,7 @@ def export_to_google_calendar(
             course_name=stored.course.name,
             deadline_ids=payload.deadline_ids,
             min_grade_info=payload.min_grade_info,
+            course_context=_course_context(course_service, current_user.user_id, stored),
         )
     except GoogleCalendarError as exc:
         raise HTTPException(status_code=401, detail=str(exc)) from exc
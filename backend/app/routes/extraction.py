@@ -1,18 +1,42 @@
+from collections.abc import AsyncIterator
 from typing import Any
+from uuid import UUID
 
 from json import JSONDecodeError
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field, ValidationError
 
-from app.dependencies import get_course_service, get_current_user, get_extraction_service
-from app.models_extraction import ExtractionResponse, OutlineExtractionRequest
+from app.dependencies import (
+    get_course_service,
+    get_current_user,
+    get_extraction_executors,
+    get_extraction_job_queue,
+    get_extraction_service,
+    run_db,
+)
+from app.models_extraction import ExtractionJobResponse, ExtractionResponse, OutlineExtractionRequest
 from app.services.auth_service import AuthenticatedUser
 from app.services.course_service import CourseService, CourseValidationError
+from app.services.extraction.executors import (
+    ClientDisconnectedError,
+    ExtractionExecutors,
+    ExtractionStageTimeoutError,
+)
+from app.services.extraction_jobs import (
+    FINISHED_STATUSES,
+    ExtractionJob,
+    ExtractionJobLimitError,
+    ExtractionJobQueue,
+    ExtractionQueueFullError,
+)
 from app.services.extraction_service import ExtractionService
 
 router = APIRouter(prefix="/extraction", tags=["Extraction"])
 MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+# Comment line sent on idle event streams so proxies keep the connection open.
+EVENT_STREAM_KEEPALIVE_SECONDS = 15.0
 
 
 class ExtractionConfirmRequest(BaseModel):
@@ -25,6 +49,7 @@ class ExtractionConfirmRequest(BaseModel):
 async def extract_outline(
     request: Request,
     service: ExtractionService = Depends(get_extraction_service),
+    executors: ExtractionExecutors = Depends(get_extraction_executors),
     file: UploadFile | None = File(None),
     term: str | None = Form(None),
     current_user: AuthenticatedUser = Depends(get_current_user),
@@ -32,19 +57,20 @@ async def extract_outline(
     _ = current_user
     content_type = request.headers.get("content-type", "").lower()
     if "multipart/form-data" in content_type:
-        if file is None:
-            raise HTTPException(status_code=422, detail="file required")
-        file_bytes = await file.read()
-        if not file_bytes:
-            raise HTTPException(status_code=422, detail="file required")
-        if len(file_bytes) > MAX_UPLOAD_BYTES:
-            raise HTTPException(status_code=413, detail="file too large (max 10MB)")
-        return service.extract(
-            filename=file.filename or "uploaded_file",
-            content_type=file.content_type or "application/octet-stream",
-            file_bytes=file_bytes,
-            term=term,
-        )
+        file_bytes = await _read_upload(file)
+        try:
+            return await executors.extract(
+                service,
+                filename=file.filename or "uploaded_file",
+                content_type=file.content_type or "application/octet-stream",
+                file_bytes=file_bytes,
+                term=term,
+                request=request,
+            )
+        except ExtractionStageTimeoutError as exc:
+            raise HTTPException(status_code=504, detail=str(exc)) from exc
+        except ClientDisconnectedError:
+            return Response(status_code=499)
 
     if "application/json" not in content_type:
         raise HTTPException(status_code=422, detail="file required")
@@ -67,8 +93,80 @@ async def extract_outline(
     return service.extract_legacy(payload)
 
 
+@router.post("/jobs", response_model=ExtractionJobResponse, status_code=202)
+async def submit_extraction_job(
+    file: UploadFile | None = File(None),
+    term: str | None = Form(None),
+    queue: ExtractionJobQueue = Depends(get_extraction_job_queue),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> ExtractionJobResponse:
+    file_bytes = await _read_upload(file)
+    try:
+        job = queue.submit(
+            user_id=current_user.user_id,
+            filename=file.filename or "uploaded_file",
+            content_type=file.content_type or "application/octet-stream",
+            file_bytes=file_bytes,
+            term=term,
+        )
+    except ExtractionJobLimitError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    except ExtractionQueueFullError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "5"}) from exc
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ExtractionJobResponse)
+async def get_extraction_job(
+    job_id: UUID,
+    queue: ExtractionJobQueue = Depends(get_extraction_job_queue),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> ExtractionJobResponse:
+    job = queue.get(job_id, current_user.user_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Extraction job not found")
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_extraction_job(
+    job_id: UUID,
+    request: Request,
+    queue: ExtractionJobQueue = Depends(get_extraction_job_queue),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> StreamingResponse:
+    """Server-Sent Events: one event per status change, named after the status."""
+    if queue.get(job_id, current_user.user_id) is None:
+        raise HTTPException(status_code=404, detail="Extraction job not found")
+
+    async def events() -> AsyncIterator[str]:
+        seen_version: int | None = None
+        while not await request.is_disconnected():
+            job = await queue.wait_for_update(
+                job_id,
+                current_user.user_id,
+                seen_version=seen_version,
+                timeout=EVENT_STREAM_KEEPALIVE_SECONDS,
+            )
+            if job is None:
+                return
+            if job.version == seen_version:
+                yield ": keepalive\n\n"
+                continue
+            seen_version = job.version
+            yield f"event: {job.status}\ndata: {_job_response(job).model_dump_json()}\n\n"
+            if job.status in FINISHED_STATUSES:
+                return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/confirm")
-def confirm_extraction(
+async def confirm_extraction(
     payload: ExtractionConfirmRequest,
     extraction_service: ExtractionService = Depends(get_extraction_service),
     course_service: CourseService = Depends(get_course_service),
@@ -82,7 +180,8 @@ def confirm_extraction(
                 "assessments": payload.extraction_result.get("assessments", []),
             }
         )
-        return course_service.create_course(
+        return await run_db(
+            course_service.create_course,
             user_id=current_user.user_id,
             course=mapped_course,
         )
@@ -90,3 +189,27 @@ def confirm_extraction(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except CourseValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+async def _read_upload(file: UploadFile | None) -> bytes:
+    if file is None:
+        raise HTTPException(status_code=422, detail="file required")
+    file_bytes = await file.read()
+    if not file_bytes:
+        raise HTTPException(status_code=422, detail="file required")
+    if len(file_bytes) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="file too large (max 10MB)")
+    return file_bytes
+
+
+def _job_response(job: ExtractionJob) -> ExtractionJobResponse:
+    return ExtractionJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        filename=job.filename,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=job.result,
+        error=job.error,
+    )
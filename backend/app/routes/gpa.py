@@ -15,7 +15,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from app.dependencies import get_course_service, get_current_user
+from app.dependencies import get_course_service, get_current_user, run_db
 from app.services.auth_service import AuthenticatedUser
 from app.services.course_service import CourseNotFoundError, CourseService
 from app.services.gpa_service import (
@@ -78,7 +78,7 @@ def list_scales(
 
 
 @router.get("/courses/{course_id}/gpa")
-def get_course_gpa(
+async def get_course_gpa(
     course_id: UUID,
     scale: str = Query(default="4.0", description="GPA scale: 4.0, 9.0, or 10.0"),
     service: CourseService = Depends(get_course_service),
@@ -90,7 +90,8 @@ def get_course_gpa(
     through the GPA converter.
     """
     try:
-        stored = service._get_course_or_raise(
+        stored = await run_db(
+            service._get_course_or_raise,
             user_id=current_user.user_id, course_id=course_id
         )
     except CourseNotFoundError as exc:
@@ -118,7 +119,7 @@ def get_course_gpa(
 
 
 @router.post("/courses/{course_id}/gpa/whatif")
-def whatif_gpa(
+async def whatif_gpa(
     course_id: UUID,
     payload: WhatIfGpaRequest,
     service: CourseService = Depends(get_course_service),
@@ -134,7 +135,8 @@ def whatif_gpa(
     from app.services.strategy_service import compute_multi_whatif
 
     try:
-        stored = service._get_course_or_raise(
+        stored = await run_db(
+            service._get_course_or_raise,
             user_id=current_user.user_id, course_id=course_id
         )
     except CourseNotFoundError as exc:
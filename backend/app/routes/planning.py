@@ -2,34 +2,42 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from app.dependencies import get_current_user, get_planning_service
+from app.dependencies import get_current_user, get_planning_service, run_db
 from app.services.auth_service import AuthenticatedUser
-from app.services.planning_service import PlanningService
+from app.services.planning_service import (
+    MAX_PLANNER_WINDOW_DAYS,
+    WEEKLY_WINDOW_DAYS,
+    PlanningService,
+)
 
 router = APIRouter(prefix="/planning", tags=["Planning"])
 
 
 @router.get("/weekly")
-def get_weekly_planner(
+async def get_weekly_planner(
     start_date: date | None = None,
+    days: int = Query(WEEKLY_WINDOW_DAYS, ge=1, le=MAX_PLANNER_WINDOW_DAYS),
     service: PlanningService = Depends(get_planning_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    return service.get_weekly_planner(
+    return await run_db(
+        service.get_weekly_planner,
         user_id=current_user.user_id,
         start_date=start_date,
+        days=days,
     )
 
 
 @router.get("/alerts")
-def get_risk_alerts(
+async def get_risk_alerts(
     reference_at: datetime | None = None,
     service: PlanningService = Depends(get_planning_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
-    return service.get_risk_alerts(
+    return await run_db(
+        service.get_risk_alerts,
         user_id=current_user.user_id,
         reference_at=reference_at,
     )
@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from app.dependencies import get_current_user, get_scenario_service
+from app.dependencies import get_current_user, get_scenario_service, run_db
 from app.services.auth_service import AuthenticatedUser
 from app.services.course_service import CourseNotFoundError
 from app.services.scenario_service import (
@@ -29,14 +29,15 @@ class ScenarioCreateRequest(BaseModel):
 
 
 @router.post("")
-def create_scenario(
+async def create_scenario(
     course_id: UUID,
     payload: ScenarioCreateRequest,
     service: ScenarioService = Depends(get_scenario_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.save_scenario(
+        return await run_db(
+            service.save_scenario,
             user_id=current_user.user_id,
             course_id=course_id,
             name=payload.name,
@@ -49,13 +50,14 @@ def create_scenario(
 
 
 @router.get("")
-def list_scenarios(
+async def list_scenarios(
     course_id: UUID,
     service: ScenarioService = Depends(get_scenario_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.list_scenarios(
+        return await run_db(
+            service.list_scenarios,
             user_id=current_user.user_id,
             course_id=course_id,
         )
@@ -64,14 +66,15 @@ def list_scenarios(
 
 
 @router.get("/{scenario_id}")
-def get_scenario(
+async def get_scenario(
     course_id: UUID,
     scenario_id: UUID,
     service: ScenarioService = Depends(get_scenario_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.get_scenario(
+        return await run_db(
+            service.get_scenario,
             user_id=current_user.user_id,
             course_id=course_id,
             scenario_id=scenario_id,
@@ -83,14 +86,15 @@ def get_scenario(
 
 
 @router.get("/{scenario_id}/run")
-def run_scenario(
+async def run_scenario(
     course_id: UUID,
     scenario_id: UUID,
     service: ScenarioService = Depends(get_scenario_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.run_saved_scenario(
+        return await run_db(
+            service.run_saved_scenario,
             user_id=current_user.user_id,
             course_id=course_id,
             scenario_id=scenario_id,
@@ -104,14 +108,15 @@ def run_scenario(
 
 
 @router.delete("/{scenario_id}")
-def delete_scenario(
+async def delete_scenario(
     course_id: UUID,
     scenario_id: UUID,
     service: ScenarioService = Depends(get_scenario_service),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     try:
-        return service.delete_scenario(
+        return await run_db(
+            service.delete_scenario,
             user_id=current_user.user_id,
             course_id=course_id,
             scenario_id=scenario_id,
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
 from pydantic import ValidationError
-from sqlalchemy import func, select, text
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy.exc import SQLAlchemyError
 
-from app.db import AssessmentDB, CourseDB, SessionLocal
+from app.db import AssessmentDB, CourseDB, RuleDB, SessionLocal
 from app.models import CourseCreate
-from app.repositories.postgres_course_mapper import persist_course_assessments
+from app.repositories.postgres_course_mapper import build_assessment_rows
+
+_UUID_SPACE = 1 << 128
 
 
 @dataclass
@@ -24,6 +33,39 @@ class MigrationStats:
     migrated_assessments: int = 0
     migrated_children: int = 0
     migrated_rules: int = 0
+    failures: list[str] = field(default_factory=list)
+    failed_course_ids: list[UUID] = field(default_factory=list)
+
+    def merge(self, other: MigrationStats) -> None:
+        self.total_rows += other.total_rows
+        self.migrated_courses += other.migrated_courses
+        self.skipped_already_migrated += other.skipped_already_migrated
+        self.skipped_no_payload += other.skipped_no_payload
+        self.failed += other.failed
+        self.migrated_assessments += other.migrated_assessments
+        self.migrated_children += other.migrated_children
+        self.migrated_rules += other.migrated_rules
+        self.failures.extend(other.failures)
+        self.failed_course_ids.extend(other.failed_course_ids)
+
+
+@dataclass(frozen=True)
+class MigrationOptions:
+    course_id: UUID | None = None
+    user_id: UUID | None = None
+    dry_run: bool = False
+    force_replace: bool = False
+    batch_size: int = 500
+    checkpoint: Path | None = None
+
+
+@dataclass
+class _PreparedCourse:
+    course_id: UUID
+    course: CourseCreate
+    assessment_rows: list[dict[str, Any]]
+    rule_rows: list[dict[str, Any]]
+    counts: tuple[int, int, int]
 
 
 def _parse_args() -> argparse.Namespace:
@@ -38,6 +80,27 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Delete existing relational assessments for a course before reinserting",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Courses fetched and written per transaction (default: 500)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help=(
+            "File recording the last committed course id; an interrupted run resumes after it. "
+            "It never moves past a failed course, so a rerun retries failures"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes to run in parallel, each over its own user-id range (default: 1)",
+    )
     return parser.parse_args()
 
 
@@ -59,17 +122,69 @@ def _has_legacy_data_column() -> bool:
         return bool(exists)
 
 
-def _load_legacy_rows(course_id: UUID | None, user_id: UUID | None) -> list[dict[str, Any]]:
+def partition_bounds(index: int, count: int) -> tuple[UUID, UUID | None]:
+    """Split the user-id space into ``count`` equal ranges; ``None`` means unbounded above."""
+    if not 0 <= index < count:
+        raise ValueError(f"partition index {index} out of range for {count} partitions")
+    span = _UUID_SPACE // count
+    upper = None if index == count - 1 else UUID(int=(index + 1) * span)
+    return UUID(int=index * span), upper
+
+
+def load_checkpoint(path: Path | None) -> UUID | None:
+    if path is None or not path.exists():
+        return None
+    return UUID(json.loads(path.read_text())["last_course_id"])
+
+
+def save_checkpoint(path: Path, last_course_id: UUID) -> None:
+    # Write-then-rename so a crash never leaves a truncated checkpoint.
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps({"last_course_id": str(last_course_id)}))
+    os.replace(tmp_path, path)
+
+
+def resume_point(rows: list[dict[str, Any]], failed_ids: set[UUID]) -> UUID | None:
+    """The last id of ``rows`` before the first failed course, or ``None`` if that is the first row."""
+    last_id = None
+    for row in rows:
+        if row["id"] in failed_ids:
+            break
+        last_id = row["id"]
+    return last_id
+
+
+def _stream_legacy_rows(
+    options: MigrationOptions,
+    *,
+    after: UUID | None,
+    bounds: tuple[UUID, UUID | None] | None,
+    session_factory=SessionLocal,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield legacy rows ``batch_size`` at a time from one server-side cursor.
+
+    Rows are ordered by id so the last id of a committed batch is enough to
+    resume from.
+    """
     conditions = ["data IS NOT NULL"]
     params: dict[str, Any] = {}
 
-    if course_id is not None:
+    if options.course_id is not None:
         conditions.append("id = :course_id")
-        params["course_id"] = str(course_id)
-
-    if user_id is not None:
+        params["course_id"] = str(options.course_id)
+    if options.user_id is not None:
         conditions.append("user_id = :user_id")
-        params["user_id"] = str(user_id)
+        params["user_id"] = str(options.user_id)
+    if after is not None:
+        conditions.append("id > :after")
+        params["after"] = str(after)
+    if bounds is not None:
+        lower, upper = bounds
+        conditions.append("user_id >= :lower")
+        params["lower"] = str(lower)
+        if upper is not None:
+            conditions.append("user_id < :upper")
+            params["upper"] = str(upper)
 
     where_clause = " AND ".join(conditions)
     query = text(
@@ -77,13 +192,18 @@ def _load_legacy_rows(course_id: UUID | None, user_id: UUID | None) -> list[dict
         SELECT id, user_id, name, term, data
         FROM courses
         WHERE {where_clause}
-        ORDER BY created_at ASC, id ASC
+        ORDER BY id ASC
         """
     )
 
-    with SessionLocal() as session:
-        rows = session.execute(query, params).mappings().all()
-        return [dict(row) for row in rows]
+    with session_factory() as session:
+        result = session.execute(
+            query,
+            params,
+            execution_options={"stream_results": True, "yield_per": options.batch_size},
+        )
+        for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
 
 
 def _count_components(course: CourseCreate) -> tuple[int, int, int]:
@@ -93,104 +213,224 @@ def _count_components(course: CourseCreate) -> tuple[int, int, int]:
     return parent_count, child_count, rule_count
 
 
-def _migrate_single_row(row: dict[str, Any], force_replace: bool, dry_run: bool) -> tuple[bool, str, tuple[int, int, int]]:
-    course_id = row["id"]
-
+def _prepare_row(row: dict[str, Any]) -> _PreparedCourse | str:
+    """Validate one legacy row and build its insert values, or return a failure reason."""
     payload = row.get("data")
     if payload is None:
-        return False, "no_payload", (0, 0, 0)
+        return "no_payload"
 
     try:
         course = CourseCreate.model_validate(payload)
+        assessment_rows, rule_rows = build_assessment_rows(row["id"], course.assessments)
     except ValidationError as exc:
-        return False, f"invalid_payload: {exc}", (0, 0, 0)
+        return f"invalid_payload: {exc}"
+    except ValueError as exc:
+        return f"invalid_rule_config: {exc}"
+
+    return _PreparedCourse(
+        course_id=row["id"],
+        course=course,
+        assessment_rows=assessment_rows,
+        rule_rows=rule_rows,
+        counts=_count_components(course),
+    )
 
-    parent_count, child_count, rule_count = _count_components(course)
 
-    with SessionLocal() as session:
-        course_row = session.scalar(select(CourseDB).where(CourseDB.id == course_id))
-        if course_row is None:
-            return False, f"course_not_found: {course_id}", (0, 0, 0)
+def _write_courses(session, courses: list[_PreparedCourse], replace_ids: list[UUID]) -> None:
+    if replace_ids:
+        session.execute(delete(AssessmentDB).where(AssessmentDB.course_id.in_(replace_ids)))
 
-        existing_count = session.scalar(
-            select(func.count()).select_from(AssessmentDB).where(AssessmentDB.course_id == course_id)
+    # Assessments are rewritten below; drop the denormalized copy so reads fall
+    # back to the relational rows until the snapshot is rebuilt.
+    session.execute(
+        update(CourseDB),
+        [
+            {"id": item.course_id, "name": item.course.name, "term": item.course.term, "snapshot": None}
+            for item in courses
+        ],
+    )
+    assessment_rows = [row for item in courses for row in item.assessment_rows]
+    rule_rows = [row for item in courses for row in item.rule_rows]
+    if assessment_rows:
+        session.execute(insert(AssessmentDB), assessment_rows)
+    if rule_rows:
+        session.execute(insert(RuleDB), rule_rows)
+
+
+def _record_failure(stats: MigrationStats, course_id: UUID, reason: str) -> None:
+    stats.failed += 1
+    stats.failed_course_ids.append(course_id)
+    failure = f"course_id={course_id} reason={reason}"
+    stats.failures.append(failure)
+    print(f"[MIGRATION][FAILED] {failure}")
+
+
+def _record_migrated(stats: MigrationStats, courses: list[_PreparedCourse]) -> None:
+    for item in courses:
+        stats.migrated_courses += 1
+        stats.migrated_assessments += item.counts[0]
+        stats.migrated_children += item.counts[1]
+        stats.migrated_rules += item.counts[2]
+
+
+def migrate_batch(
+    rows: list[dict[str, Any]],
+    options: MigrationOptions,
+    stats: MigrationStats,
+    *,
+    session_factory=SessionLocal,
+) -> None:
+    """Migrate ``rows`` with one insert per table, falling back to per-course
+    transactions when the batch fails so one bad course cannot sink the rest."""
+    prepared: list[_PreparedCourse] = []
+    for row in rows:
+        stats.total_rows += 1
+        result = _prepare_row(row)
+        if result == "no_payload":
+            stats.skipped_no_payload += 1
+        elif isinstance(result, str):
+            _record_failure(stats, row["id"], result)
+        else:
+            prepared.append(result)
+
+    if not prepared:
+        return
+
+    with session_factory() as session:
+        course_ids = [item.course_id for item in prepared]
+        migrated_ids = set(
+            session.scalars(
+                select(AssessmentDB.course_id)
+                .where(AssessmentDB.course_id.in_(course_ids))
+                .distinct()
+            ).all()
         )
-        if existing_count and not force_replace:
-            return False, "already_migrated", (0, 0, 0)
-
-        if dry_run:
-            return True, "dry_run_ok", (parent_count, child_count, rule_count)
-
+        pending = [
+            item
+            for item in prepared
+            if options.force_replace or item.course_id not in migrated_ids
+        ]
+        stats.skipped_already_migrated += len(prepared) - len(pending)
+        if not pending:
+            return
+        if options.dry_run:
+            _record_migrated(stats, pending)
+            return
+
+        replace_ids = [item.course_id for item in pending if item.course_id in migrated_ids]
         try:
-            course_row.name = course.name
-            course_row.term = course.term
-
-            if force_replace and existing_count:
-                session.execute(delete_stmt_for_course(course_id))
-                session.flush()
-
-            persist_course_assessments(session=session, course_id=course_id, assessments=course.assessments)
+            _write_courses(session, pending, replace_ids)
             session.commit()
-        except IntegrityError as exc:
-            session.rollback()
-            return False, f"integrity_error: {exc.orig}", (0, 0, 0)
-        except SQLAlchemyError as exc:
+            _record_migrated(stats, pending)
+            return
+        except SQLAlchemyError:
             session.rollback()
-            return False, f"db_error: {exc}", (0, 0, 0)
-
-    return True, "migrated", (parent_count, child_count, rule_count)
 
+        for item in pending:
+            try:
+                _write_courses(
+                    session,
+                    [item],
+                    [item.course_id] if item.course_id in migrated_ids else [],
+                )
+                session.commit()
+                _record_migrated(stats, [item])
+            except SQLAlchemyError as exc:
+                session.rollback()
+                _record_failure(stats, item.course_id, f"db_error: {exc}")
+
+
+def run_partition(
+    index: int,
+    count: int,
+    options: MigrationOptions,
+    *,
+    session_factory=SessionLocal,
+) -> MigrationStats:
+    """Migrate one user-id range, checkpointing after every committed batch.
+
+    Once a course fails, the checkpoint stays just before it for the rest of
+    the run, so resuming retries it (and skips what was migrated since).
+    """
+    stats = MigrationStats()
+    checkpoint = options.checkpoint
+    if checkpoint is not None and count > 1:
+        checkpoint = checkpoint.with_name(f"{checkpoint.name}.part{index}of{count}")
+    after = load_checkpoint(checkpoint)
+    bounds = partition_bounds(index, count) if count > 1 else None
+    label = f"{index + 1}/{count}"
+    if after is not None:
+        print(f"[MIGRATION] partition={label} resuming after course_id={after}")
+
+    held_before: UUID | None = None
+    started = time.perf_counter()
+    for batch_number, rows in enumerate(
+        _stream_legacy_rows(options, after=after, bounds=bounds, session_factory=session_factory),
+        start=1,
+    ):
+        batch_started = time.perf_counter()
+        migrated, skipped, failed = (
+            stats.migrated_courses,
+            stats.skipped_already_migrated,
+            stats.failed,
+        )
+        migrate_batch(rows, options, stats, session_factory=session_factory)
+        if checkpoint is not None and not options.dry_run and held_before is None:
+            batch_failures = set(stats.failed_course_ids[failed:])
+            last_id = resume_point(rows, batch_failures)
+            if last_id is not None:
+                save_checkpoint(checkpoint, last_id)
+            if batch_failures:
+                held_before = next(row["id"] for row in rows if row["id"] in batch_failures)
+                print(
+                    f"[MIGRATION] partition={label} checkpoint held before failed "
+                    f"course_id={held_before}; a resumed run retries from there"
+                )
 
-def delete_stmt_for_course(course_id: UUID):
-    return text("DELETE FROM assessments WHERE course_id = :course_id").bindparams(course_id=str(course_id))
+        elapsed = time.perf_counter() - batch_started
+        print(
+            f"[MIGRATION] partition={label} batch={batch_number} rows={len(rows)} "
+            f"migrated={stats.migrated_courses - migrated} "
+            f"skipped={stats.skipped_already_migrated - skipped} "
+            f"failed={stats.failed - failed} "
+            f"elapsed={elapsed:.2f}s rate={len(rows) / max(elapsed, 1e-9):.0f} rows/s "
+            f"total_rate={stats.total_rows / max(time.perf_counter() - started, 1e-9):.0f} rows/s"
+        )
+    return stats
 
 
 def main() -> int:
     args = _parse_args()
 
-    course_id = UUID(args.course_id) if args.course_id else None
-    user_id = UUID(args.user_id) if args.user_id else None
+    options = MigrationOptions(
+        course_id=UUID(args.course_id) if args.course_id else None,
+        user_id=UUID(args.user_id) if args.user_id else None,
+        dry_run=args.dry_run,
+        force_replace=args.force_replace,
+        batch_size=max(1, args.batch_size),
+        checkpoint=args.checkpoint,
+    )
+    workers = max(1, args.workers)
 
     if not _has_legacy_data_column():
         print("[MIGRATION] No legacy courses.data column found; nothing to migrate.")
         return 0
 
-    rows = _load_legacy_rows(course_id=course_id, user_id=user_id)
-    stats = MigrationStats(total_rows=len(rows))
-
     print(
         f"[MIGRATION] Starting JSONB -> relational migration. "
-        f"rows={stats.total_rows} dry_run={args.dry_run} force_replace={args.force_replace}"
+        f"dry_run={options.dry_run} force_replace={options.force_replace} "
+        f"batch_size={options.batch_size} workers={workers}"
     )
 
-    failures: list[str] = []
-
-    for row in rows:
-        ok, reason, counts = _migrate_single_row(
-            row=row,
-            force_replace=args.force_replace,
-            dry_run=args.dry_run,
-        )
-
-        if reason == "no_payload":
-            stats.skipped_no_payload += 1
-            continue
-        if reason == "already_migrated":
-            stats.skipped_already_migrated += 1
-            continue
-
-        if ok:
-            stats.migrated_courses += 1
-            stats.migrated_assessments += counts[0]
-            stats.migrated_children += counts[1]
-            stats.migrated_rules += counts[2]
-            print(f"[MIGRATION] course_id={row['id']} status={reason}")
-            continue
-
-        stats.failed += 1
-        failure = f"course_id={row['id']} reason={reason}"
-        failures.append(failure)
-        print(f"[MIGRATION][FAILED] {failure}")
+    stats = MigrationStats()
+    if workers == 1:
+        stats.merge(run_partition(0, 1, options))
+    else:
+        # spawn, not fork: each worker must build its own engine and pool.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            futures = [pool.submit(run_partition, index, workers, options) for index in range(workers)]
+            for future in futures:
+                stats.merge(future.result())
 
     print("[MIGRATION] Summary")
     print(f"  total_rows={stats.total_rows}")
@@ -202,12 +442,14 @@ def main() -> int:
     print(f"  migrated_children={stats.migrated_children}")
     print(f"  migrated_rules={stats.migrated_rules}")
 
-    if failures:
+    if stats.failures:
         print("[MIGRATION] Failures:")
-        for failure in failures:
+        for failure in stats.failures:
             print(f"  - {failure}")
         return 1
 
+    if stats.migrated_courses and not options.dry_run:
+        print("[MIGRATION] Run app.scripts.rebuild_course_snapshots to restore course snapshots.")
     return 0
 
 
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.db import CourseDB, SessionLocal, init_db
+from app.repositories.postgres_course_mapper import (
+    dump_course_snapshot,
+    hydrate_course_aggregate,
+)
+
+
+@dataclass
+class RebuildStats:
+    scanned: int = 0
+    rebuilt: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild courses.snapshot from the relational assessments/rules tables"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report drift without writing")
+    parser.add_argument("--course-id", type=str, default=None, help="Rebuild only one course UUID")
+    parser.add_argument("--user-id", type=str, default=None, help="Rebuild only one user's courses")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=200,
+        help="Courses rewritten per transaction (default: 200)",
+    )
+    return parser.parse_args()
+
+
+def _load_course_ids(course_id: UUID | None, user_id: UUID | None) -> list[UUID]:
+    query = select(CourseDB.id).order_by(CourseDB.created_at.asc(), CourseDB.id.asc())
+    if course_id is not None:
+        query = query.where(CourseDB.id == course_id)
+    if user_id is not None:
+        query = query.where(CourseDB.user_id == user_id)
+    with SessionLocal() as session:
+        return list(session.scalars(query).all())
+
+
+def rebuild_snapshots(
+    course_ids: list[UUID],
+    *,
+    dry_run: bool = False,
+    batch_size: int = 200,
+    session_factory=SessionLocal,
+) -> RebuildStats:
+    """Recompute snapshots for ``course_ids``, rewriting only the ones that drifted.
+
+    Each row is locked while it is rebuilt so a concurrent course write cannot
+    interleave between the relational read and the snapshot write.
+    """
+    stats = RebuildStats()
+    batch_size = max(1, batch_size)
+    for start in range(0, len(course_ids), batch_size):
+        batch = course_ids[start : start + batch_size]
+        with session_factory() as session:
+            try:
+                rows = session.scalars(
+                    select(CourseDB)
+                    .where(CourseDB.id.in_(batch))
+                    .order_by(CourseDB.id.asc())
+                    .with_for_update()
+                ).all()
+                for row in rows:
+                    stats.scanned += 1
+                    expected = dump_course_snapshot(
+                        hydrate_course_aggregate(session=session, course_row=row)
+                    )
+                    if row.snapshot == expected:
+                        stats.unchanged += 1
+                        continue
+                    stats.rebuilt += 1
+                    print(f"[SNAPSHOT] course_id={row.id} status={'stale' if dry_run else 'rebuilt'}")
+                    if not dry_run:
+                        row.snapshot = expected
+                if dry_run:
+                    session.rollback()
+                else:
+                    session.commit()
+            except SQLAlchemyError as exc:
+                session.rollback()
+                stats.failed += len(batch)
+                print(f"[SNAPSHOT][FAILED] batch_start={batch[0]} reason=db_error: {exc}")
+    return stats
+
+
+def main() -> int:
+    args = _parse_args()
+
+    course_id = UUID(args.course_id) if args.course_id else None
+    user_id = UUID(args.user_id) if args.user_id else None
+
+    init_db()
+    course_ids = _load_course_ids(course_id=course_id, user_id=user_id)
+    print(f"[SNAPSHOT] Rebuilding course snapshots. courses={len(course_ids)} dry_run={args.dry_run}")
+
+    stats = rebuild_snapshots(course_ids, dry_run=args.dry_run, batch_size=args.batch_size)
+
+    print("[SNAPSHOT] Summary")
+    print(f"  scanned={stats.scanned}")
+    print(f"  rebuilt={stats.rebuilt}")
+    print(f"  unchanged={stats.unchanged}")
+    print(f"  failed={stats.failed}")
+
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,7 @@ __all__ = [
     "CourseNotFoundError",
     "CourseValidationError",
     "CourseConflictError",
+    "CourseContext",
 ]
 
 
@@ -41,9 +42,11 @@ def __getattr__(name: str):
         "CourseNotFoundError",
         "CourseValidationError",
         "CourseConflictError",
+        "CourseContext",
     }:
         from app.services.course_service import (
             CourseConflictError,
+            CourseContext,
             CourseNotFoundError,
             CourseService,
             CourseValidationError,
@@ -54,6 +57,7 @@ def __getattr__(name: str):
             "CourseNotFoundError": CourseNotFoundError,
             "CourseValidationError": CourseValidationError,
             "CourseConflictError": CourseConflictError,
+            "CourseContext": CourseContext,
         }
         return exports[name]
 
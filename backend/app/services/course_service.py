@@ -1,8 +1,16 @@
+from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
 from app.models import CourseCreate
-from app.repositories.base import CourseRepository, StoredCourse
+from app.pagination import DEFAULT_PAGE_SIZE, InvalidCursorError, decode_cursor, encode_cursor
+from app.repositories.base import (
+    CourseCursor,
+    CourseRepository,
+    CourseVersionConflictError,
+    StoredCourse,
+    StoredCourseSummary,
+)
 from app.services.grading_service import (
     calculate_course_totals,
     compute_assessment_contribution,
@@ -65,6 +73,55 @@ class CourseService:
     def list_stored_courses(self, user_id: UUID) -> list[StoredCourse]:
         return self._repository.list_all(user_id=user_id)
 
+    def list_course_summaries(self, user_id: UUID) -> list[StoredCourseSummary]:
+        return self._repository.list_summaries(user_id=user_id)
+
+    def list_courses_page(
+        self,
+        user_id: UUID,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        view: str = "full",
+    ) -> tuple[list[dict], str | None]:
+        """Return one page of courses and the cursor of the next page (``None`` on the last).
+
+        ``view="summary"`` returns name, term and assessment count without the
+        assessment tree. Without ``limit`` or ``cursor`` every course is returned.
+        """
+        after = _decode_course_cursor(cursor)
+        if limit is None and after is not None:
+            limit = DEFAULT_PAGE_SIZE
+        # One extra row tells us whether another page exists.
+        fetch = None if limit is None else limit + 1
+
+        if view == "summary":
+            rows = self._repository.list_summaries(user_id=user_id, limit=fetch, after=after)
+        elif fetch is None:
+            rows = self._repository.list_all(user_id=user_id)
+        else:
+            rows = self._repository.list_page(user_id=user_id, limit=fetch, after=after)
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), last.course_id)
+
+        if view == "summary":
+            items = [
+                {
+                    "course_id": row.course_id,
+                    "name": row.name,
+                    "term": row.term,
+                    "assessment_count": row.assessment_count,
+                }
+                for row in rows
+            ]
+        else:
+            items = [{"course_id": row.course_id, **row.course.model_dump()} for row in rows]
+        return items, next_cursor
+
     def update_course_weights(self, user_id: UUID, course_id: UUID, assessments: list[dict]) -> dict:
         if not assessments:
             raise CourseValidationError("At least one assessment weight update is required")
@@ -114,7 +171,7 @@ class CourseService:
         for assessment in assessments:
             existing_assessments[assessment["name"]].weight = float(assessment["weight"])
 
-        self._repository.update(user_id=user_id, course_id=course_id, course=stored.course)
+        self._save_course(user_id=user_id, stored=stored, course=stored.course)
         course_index = self._repository.get_index(user_id=user_id, course_id=course_id)
 
         return {
@@ -224,7 +281,7 @@ class CourseService:
                     existing_child.raw_score = child_raw_score
                     existing_child.total_score = child_total_score
 
-        self._repository.update(user_id=user_id, course_id=course_id, course=stored.course)
+        self._save_course(user_id=user_id, stored=stored, course=stored.course)
         totals = calculate_course_totals(stored.course)
         current_standing = totals["final_total"]
         course_index = self._repository.get_index(user_id=user_id, course_id=course_id)
@@ -312,7 +369,7 @@ class CourseService:
         updated.name = course_update.name
         updated.term = course_update.term
 
-        self._repository.update(user_id=user_id, course_id=course_id, course=updated)
+        self._save_course(user_id=user_id, stored=stored, course=updated)
 
         return {
             "message": "Course structure updated successfully",
@@ -337,7 +394,7 @@ class CourseService:
         updated_course.name = cleaned_name
         updated_course.term = term
 
-        self._repository.update(user_id=user_id, course_id=course_id, course=updated_course)
+        self._save_course(user_id=user_id, stored=stored, course=updated_course)
         return {
             "message": "Course metadata updated successfully",
             "course_id": course_id,
@@ -354,6 +411,11 @@ class CourseService:
 
     def check_target_feasibility(self, user_id: UUID, course_id: UUID, target: float) -> dict:
         stored = self._get_course_or_raise(user_id=user_id, course_id=course_id)
+        return self.evaluate_target_feasibility(stored, target)
+
+    def evaluate_target_feasibility(self, stored: StoredCourse, target: float) -> dict:
+        """Feasibility of ``target`` for a course the caller has already loaded."""
+        course_id = stored.course_id
         current_totals = calculate_course_totals(stored.course)
         maximum_course = stored.course.model_copy(deep=True)
         fill_remaining_ungraded_scores(maximum_course, missing_percent=100.0)
@@ -430,8 +492,88 @@ class CourseService:
     def get_course(self, user_id: UUID, course_id: UUID) -> StoredCourse:
         return self._get_course_or_raise(user_id=user_id, course_id=course_id)
 
+    def _save_course(self, user_id: UUID, stored: StoredCourse, course: CourseCreate) -> StoredCourse:
+        try:
+            return self._repository.update(
+                user_id=user_id,
+                course_id=stored.course_id,
+                course=course,
+                expected_version=stored.version,
+            )
+        except CourseVersionConflictError as exc:
+            raise CourseConflictError(
+                "Course was modified by another request; reload and try again"
+            ) from exc
+
     def _get_course_or_raise(self, user_id: UUID, course_id: UUID) -> StoredCourse:
         stored = self._repository.get_by_id(user_id=user_id, course_id=course_id)
         if stored is None:
             raise CourseNotFoundError(f"Course not found for id {course_id}")
         return stored
+
+
+def _decode_course_cursor(cursor: str | None) -> CourseCursor | None:
+    if cursor is None:
+        return None
+    try:
+        created_at, course_id = decode_cursor(cursor, 2)
+        after = datetime.fromisoformat(created_at), UUID(course_id)
+    except (InvalidCursorError, ValueError) as exc:
+        raise CourseValidationError("Invalid pagination cursor") from exc
+    if after[0].tzinfo is None:
+        raise CourseValidationError("Invalid pagination cursor")
+    return after
+
+
+class CourseContext:
+    """Per-request memo of course aggregates and their assessment-id lookups.
+
+    Create one per request (or batch operation) and pass it down, so code that
+    needs the same course many times loads it once. Entries are never
+    invalidated, so a context must not outlive the request that created it.
+    """
+
+    def __init__(self, course_service: CourseService) -> None:
+        self._course_service = course_service
+        self._courses: dict[tuple[UUID, UUID], StoredCourse | None] = {}
+        self._targets_by_id: dict[tuple[UUID, UUID], dict[str, tuple]] = {}
+
+    def add(self, user_id: UUID, stored: StoredCourse) -> None:
+        key = (user_id, stored.course_id)
+        self._courses[key] = stored
+        self._targets_by_id.pop(key, None)
+
+    def get_course(self, user_id: UUID, course_id: UUID) -> StoredCourse:
+        key = (user_id, course_id)
+        if key not in self._courses:
+            try:
+                self._courses[key] = self._course_service._get_course_or_raise(
+                    user_id=user_id,
+                    course_id=course_id,
+                )
+            except CourseNotFoundError:
+                self._courses[key] = None
+                raise
+        stored = self._courses[key]
+        if stored is None:
+            raise CourseNotFoundError(f"Course not found for id {course_id}")
+        return stored
+
+    def resolve_by_id(self, user_id: UUID, course_id: UUID, assessment_id: UUID | str) -> tuple:
+        """Same result as ``resolve_assessment_target_by_id`` via a dict lookup."""
+        key = (user_id, course_id)
+        targets = self._targets_by_id.get(key)
+        if targets is None:
+            course = self.get_course(user_id, course_id).course
+            targets = {}
+            for assessment in course.assessments:
+                if assessment.assessment_id is not None:
+                    targets.setdefault(str(assessment.assessment_id), (assessment, None))
+                for child in assessment.children or []:
+                    if child.assessment_id is not None:
+                        targets.setdefault(str(child.assessment_id), (assessment, child))
+            self._targets_by_id[key] = targets
+        target = targets.get(str(assessment_id))
+        if target is None:
+            raise ValueError(f"Assessment '{assessment_id}' not found")
+        return target
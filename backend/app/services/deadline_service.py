@@ -36,11 +36,12 @@ from app.models_deadline import (
     DeadlineCreate,
     DeadlineUpdate,
 )
-from app.repositories.base import CalendarConnectionRepository, DeadlineRepository
+from app.pagination import DEFAULT_PAGE_SIZE, InvalidCursorError, decode_cursor, encode_cursor
+from app.repositories.base import CalendarConnectionRepository, DeadlineCursor, DeadlineRepository
+from app.services.course_service import CourseContext
 from app.services.grading_service import (
     _target_label,
     resolve_assessment_target,
-    resolve_assessment_target_by_id,
 )
 
 # ─── Date-parsing regexes (shared with extraction_service) ────────────────────
@@ -454,6 +455,23 @@ class DeadlineValidationError(Exception):
     pass
 
 
+def _decode_deadline_cursor(cursor: str | None) -> DeadlineCursor | None:
+    if cursor is None:
+        return None
+    try:
+        due_date, created_at, deadline_id = decode_cursor(cursor, 3)
+        after = (
+            date.fromisoformat(due_date),
+            datetime.fromisoformat(created_at),
+            UUID(deadline_id),
+        )
+    except (InvalidCursorError, ValueError) as exc:
+        raise DeadlineValidationError("Invalid pagination cursor") from exc
+    if after[1].tzinfo is None:
+        raise DeadlineValidationError("Invalid pagination cursor")
+    return after
+
+
 def get_google_auth_url(state: str = "") -> dict[str, str]:
     """Return the Google OAuth2 consent URL.  Raises if not configured."""
     if not google_calendar_configured():
@@ -671,41 +689,125 @@ class DeadlineService:
     # ── CRUD ──
 
     def create_deadline(
-        self, user_id: UUID, course_id: UUID, data: DeadlineCreate
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        data: DeadlineCreate,
+        *,
+        course_context: CourseContext | None = None,
     ) -> Deadline:
+        context = course_context or self._new_course_context()
         created = self._repo.create(
             user_id,
             course_id,
-            self._resolve_deadline_reference(user_id, course_id, data),
+            self._resolve_deadline_reference(user_id, course_id, data, context),
         )
-        return self._canonicalize_deadline(user_id, course_id, created)
+        return self._canonicalize_deadline(user_id, course_id, created, context)
 
-    def list_deadlines(self, user_id: UUID, course_id: UUID) -> list[Deadline]:
+    def list_deadlines(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        *,
+        course_context: CourseContext | None = None,
+    ) -> list[Deadline]:
+        context = course_context or self._new_course_context()
         deadlines = [
-            self._canonicalize_deadline(user_id, course_id, deadline)
+            self._canonicalize_deadline(user_id, course_id, deadline, context)
             for deadline in self._repo.list_all(user_id, course_id)
         ]
         return self._sort_deadlines(deadlines)
 
+    def list_deadlines_page(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        course_context: CourseContext | None = None,
+    ) -> tuple[list[Deadline], str | None]:
+        """Return one page of the course's deadlines and the next page's cursor.
+
+        Pages follow storage order (due date, then creation), not the due-time
+        order of ``list_deadlines``, so the cursor stays a plain keyset.
+        """
+        after = _decode_deadline_cursor(cursor)
+        limit = limit or DEFAULT_PAGE_SIZE
+        context = course_context or self._new_course_context()
+        rows = self._repo.list_page(user_id, course_id, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.due_date, last.created_at, last.deadline_id)
+        return (
+            [self._canonicalize_deadline(user_id, course_id, row, context) for row in rows],
+            next_cursor,
+        )
+
+    def list_deadlines_in_range(
+        self,
+        user_id: UUID,
+        start_date: date,
+        end_date: date,
+        *,
+        course_context: CourseContext | None = None,
+    ) -> list[Deadline]:
+        """Every deadline the user has due in ``[start_date, end_date]``, across all courses."""
+        context = course_context or self._new_course_context()
+        deadlines = [
+            self._canonicalize_deadline(user_id, deadline.course_id, deadline, context)
+            for deadline in self._repo.list_in_range(user_id, start_date, end_date)
+        ]
+        return self._sort_deadlines(deadlines)
+
+    def list_all_deadlines(
+        self,
+        user_id: UUID,
+        *,
+        course_context: CourseContext | None = None,
+    ) -> list[Deadline]:
+        """Every deadline the user has, across all courses, in one repository call."""
+        context = course_context or self._new_course_context()
+        deadlines = [
+            self._canonicalize_deadline(user_id, deadline.course_id, deadline, context)
+            for deadline in self._repo.list_for_user(user_id)
+        ]
+        return self._sort_deadlines(deadlines)
+
     def get_deadline(
-        self, user_id: UUID, course_id: UUID, deadline_id: UUID
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        deadline_id: UUID,
+        *,
+        course_context: CourseContext | None = None,
     ) -> Deadline | None:
         deadline = self._repo.get_by_id(user_id, course_id, deadline_id)
         if deadline is None:
             return None
-        return self._canonicalize_deadline(user_id, course_id, deadline)
+        context = course_context or self._new_course_context()
+        return self._canonicalize_deadline(user_id, course_id, deadline, context)
 
     def update_deadline(
-        self, user_id: UUID, course_id: UUID, deadline_id: UUID, data: Any
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        deadline_id: UUID,
+        data: Any,
+        *,
+        course_context: CourseContext | None = None,
     ) -> Deadline | None:
+        context = course_context or self._new_course_context()
         if isinstance(data, DeadlineUpdate):
-            resolved = self._resolve_deadline_reference(user_id, course_id, data)
+            resolved = self._resolve_deadline_reference(user_id, course_id, data, context)
         else:
             resolved = data
         updated = self._repo.update(user_id, course_id, deadline_id, resolved)
         if updated is None:
             return None
-        return self._canonicalize_deadline(user_id, course_id, updated)
+        return self._canonicalize_deadline(user_id, course_id, updated, context)
 
     def delete_deadline(
         self, user_id: UUID, course_id: UUID, deadline_id: UUID
@@ -720,8 +822,12 @@ class DeadlineService:
         course_id: UUID,
         raw_deadlines: list[dict[str, Any]],
     ) -> list[Deadline]:
-        """Save a batch of extracted deadline dicts to the repo."""
-        created: list[Deadline] = []
+        """Save a batch of extracted deadline dicts to the repo.
+
+        The course is loaded at most once to resolve every assessment
+        reference, and the batch is written with a single ``create_many``.
+        """
+        items: list[DeadlineCreate] = []
         seen_keys: set[tuple[str, str, str | None, str | None]] = set()
         for raw in raw_deadlines:
             dedupe_key = (
@@ -743,17 +849,28 @@ class DeadlineService:
                 assessment_id=raw.get("assessment_id"),
                 assessment_name=raw.get("assessment_name"),
             )
-            created.append(
-                self._repo.create(
-                    user_id,
-                    course_id,
-                    self._resolve_deadline_reference(user_id, course_id, dl_create),
-                )
-            )
-        return created
+            items.append(dl_create)
+
+        context = self._new_course_context()
+        resolved = [
+            self._resolve_deadline_reference(user_id, course_id, item, context)
+            for item in items
+        ]
+        return self._repo.create_many(user_id, course_id, resolved)
 
-    def _resolve_deadline_reference(self, user_id: UUID, course_id: UUID, data):
+    def _new_course_context(self) -> CourseContext | None:
         if self._course_service is None:
+            return None
+        return CourseContext(self._course_service)
+
+    def _resolve_deadline_reference(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        data,
+        context: CourseContext | None,
+    ):
+        if context is None:
             return data
 
         assessment_id = getattr(data, "assessment_id", None)
@@ -761,14 +878,11 @@ class DeadlineService:
         if assessment_id is None and not assessment_name:
             return data
 
-        stored_course = self._course_service._get_course_or_raise(
-            user_id=user_id,
-            course_id=course_id,
-        )
+        stored_course = context.get_course(user_id, course_id)
 
         try:
             if assessment_id is not None:
-                parent, child = resolve_assessment_target_by_id(stored_course.course, assessment_id)
+                parent, child = context.resolve_by_id(user_id, course_id, assessment_id)
             else:
                 parent, child = resolve_assessment_target(stored_course.course, assessment_name)
         except ValueError as exc:
@@ -787,19 +901,18 @@ class DeadlineService:
             }
         )
 
-    def _canonicalize_deadline(self, user_id: UUID, course_id: UUID, deadline: Deadline) -> Deadline:
-        if self._course_service is None or deadline.assessment_id is None:
+    def _canonicalize_deadline(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        deadline: Deadline,
+        context: CourseContext | None,
+    ) -> Deadline:
+        if context is None or deadline.assessment_id is None:
             return deadline
 
         try:
-            stored_course = self._course_service._get_course_or_raise(
-                user_id=user_id,
-                course_id=course_id,
-            )
-            parent, child = resolve_assessment_target_by_id(
-                stored_course.course,
-                deadline.assessment_id,
-            )
+            parent, child = context.resolve_by_id(user_id, course_id, deadline.assessment_id)
         except Exception:
             return deadline
 
@@ -817,12 +930,15 @@ class DeadlineService:
         course_name: str,
         deadline_ids: list[UUID] | None = None,
         min_grade_info: dict[str, Any] | None = None,
+        *,
+        course_context: CourseContext | None = None,
     ) -> str:
         """Generate .ics content for selected (or all) deadlines."""
         all_dls = self._select_deadlines(
             user_id=user_id,
             course_id=course_id,
             deadline_ids=deadline_ids,
+            course_context=course_context,
         )
         return generate_ics(all_dls, course_name, min_grade_info)
 
@@ -913,6 +1029,8 @@ class DeadlineService:
         course_name: str,
         deadline_ids: list[UUID] | None = None,
         min_grade_info: dict[str, Any] | None = None,
+        *,
+        course_context: CourseContext | None = None,
     ) -> dict[str, Any]:
         """
         Export deadlines to Google Calendar.  Skips already-exported
@@ -928,6 +1046,7 @@ class DeadlineService:
             user_id=user_id,
             course_id=course_id,
             deadline_ids=deadline_ids,
+            course_context=course_context,
         )
 
         exported = 0
@@ -998,8 +1117,9 @@ class DeadlineService:
         user_id: UUID,
         course_id: UUID,
         deadline_ids: list[UUID] | None,
+        course_context: CourseContext | None = None,
     ) -> list[Deadline]:
-        all_deadlines = self.list_deadlines(user_id, course_id)
+        all_deadlines = self.list_deadlines(user_id, course_id, course_context=course_context)
         if deadline_ids is None:
             return all_deadlines
 
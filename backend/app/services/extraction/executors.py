@@ -0,0 +1,374 @@
+"""Executors that keep extraction off the event loop.
+
+An upload goes through two stages:
+
+- ``parse``: PDF/DOCX text extraction and OCR. It is CPU-bound and holds
+  the GIL, so it runs in a process pool. A PDF is split into page tasks
+  on that pool by a coordinating thread, so one long outline uses several
+  processes. Workers never start pools of their own: the pool's size is
+  the whole process budget.
+- ``llm``: the rest of ``ExtractionService.extract``, which is mostly
+  waiting on the LLM API, runs on a thread pool.
+
+With a ``result_cache``, an upload whose bytes were already extracted
+skips both stages.
+
+Each stage has its own timeout. When a ``Request`` is passed, a stage is
+also abandoned as soon as the client disconnects. Work that has not
+started yet is cancelled. A stage that is already running cannot be
+interrupted, but the next stage is never started.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import (
+    BrokenExecutor,
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing import get_context
+from typing import Any, TypeVar
+
+from starlette.requests import Request
+
+from app.models_extraction import ExtractionResponse
+from app.services.extraction.ingest import ingest_text
+from app.services.extraction.orchestrator import ExtractionService
+from app.services.extraction.result_cache import ExtractionResultCache
+from app.services.extraction.text_ingest import upload_kind
+
+T = TypeVar("T")
+
+DISCONNECT_POLL_SECONDS = 0.5
+
+
+class ExtractionStageTimeoutError(Exception):
+    def __init__(self, stage: str, timeout_seconds: float) -> None:
+        super().__init__(f"extraction {stage} stage timed out after {timeout_seconds:g}s")
+        self.stage = stage
+        self.timeout_seconds = timeout_seconds
+
+
+class ClientDisconnectedError(Exception):
+    """The client went away while its extraction was in flight."""
+
+
+class ExtractionExecutors:
+    def __init__(
+        self,
+        *,
+        parse_processes: int = 2,
+        llm_threads: int = 8,
+        parse_timeout_seconds: float = 60.0,
+        llm_timeout_seconds: float = 180.0,
+        result_cache: ExtractionResultCache | None = None,
+    ) -> None:
+        # parse_processes=0 runs the parse stage on its own thread pool instead.
+        self.parse_processes = max(0, parse_processes)
+        self.llm_threads = max(1, llm_threads)
+        self.parse_timeout_seconds = parse_timeout_seconds
+        self.llm_timeout_seconds = llm_timeout_seconds
+        self.result_cache = result_cache
+        self._lock = threading.Lock()
+        self._parse_pool: Executor | None = None
+        self._llm_pool: ThreadPoolExecutor | None = None
+
+    # ── async API for routes ──
+
+    async def extract(
+        self,
+        service: ExtractionService,
+        *,
+        filename: str,
+        content_type: str,
+        file_bytes: bytes,
+        term: str | None = None,
+        request: Request | None = None,
+    ) -> ExtractionResponse:
+        cache_key = self._cache_key(service, filename, file_bytes)
+        if cache_key is not None:
+            cached = await self.run_io(self.result_cache.get, cache_key, request=request)
+            if cached is not None:
+                return cached
+        text_result = await self.ingest(
+            filename=filename,
+            content_type=content_type,
+            file_bytes=file_bytes,
+            request=request,
+        )
+        return await self.run_io(
+            self._extract_and_store,
+            service,
+            cache_key,
+            filename=filename,
+            content_type=content_type,
+            file_bytes=file_bytes,
+            term=term,
+            text_result=text_result,
+            read_full_text=self.full_text_reader(filename, content_type, file_bytes),
+            request=request,
+        )
+
+    async def ingest(
+        self,
+        *,
+        filename: str,
+        content_type: str,
+        file_bytes: bytes,
+        request: Request | None = None,
+    ) -> dict[str, Any]:
+        executor, fn, abandoned = self._parse_call(filename, content_type, file_bytes)
+        return await self._run_stage(
+            "parse",
+            executor,
+            fn,
+            timeout=self.parse_timeout_seconds,
+            request=request,
+            on_abandon=abandoned.set,
+        )
+
+    async def run_io(
+        self,
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+        request: Request | None = None,
+        **kwargs: Any,
+    ) -> T:
+        return await self._run_stage(
+            "llm",
+            self._llm_executor(),
+            functools.partial(fn, *args, **kwargs),
+            timeout=self.llm_timeout_seconds,
+            request=request,
+        )
+
+    # ── blocking API for worker threads (background jobs) ──
+
+    def extract_blocking(
+        self,
+        service: ExtractionService,
+        *,
+        filename: str,
+        content_type: str,
+        file_bytes: bytes,
+        term: str | None = None,
+    ) -> ExtractionResponse:
+        cache_key = self._cache_key(service, filename, file_bytes)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        executor, fn, abandoned = self._parse_call(filename, content_type, file_bytes)
+        future = executor.submit(fn)
+        try:
+            text_result = future.result(timeout=self.parse_timeout_seconds)
+        except FutureTimeoutError as exc:
+            future.cancel()
+            abandoned.set()
+            raise ExtractionStageTimeoutError("parse", self.parse_timeout_seconds) from exc
+        except BrokenExecutor:
+            self._discard_parse_pool(executor)
+            raise
+        return self._extract_and_store(
+            service,
+            cache_key,
+            filename=filename,
+            content_type=content_type,
+            file_bytes=file_bytes,
+            term=term,
+            text_result=text_result,
+            read_full_text=self.full_text_reader(filename, content_type, file_bytes),
+        )
+
+    def full_text_reader(self, filename: str, content_type: str, file_bytes: bytes) -> Callable[[], str]:
+        """A blocking call that reads every page of the upload on the parse pool.
+
+        For ``ExtractionService.extract(read_full_text=...)`` after lazy
+        ingestion returned partial text. The calling thread (already off the
+        event loop) coordinates, and the pages go to the parse pool as page
+        tasks, so the re-read never runs in the API process.
+        """
+
+        def read() -> str:
+            parse_pool = self._parse_executor()
+            page_executor = None
+            if isinstance(parse_pool, ProcessPoolExecutor):
+                page_executor = _PageTasks(parse_pool, threading.Event(), self._discard_parse_pool)
+            return ingest_text(
+                filename,
+                content_type,
+                file_bytes,
+                page_executor=page_executor,
+                page_workers=self.parse_processes,
+                early_stop=False,
+            )["text"]
+
+        return read
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pools = (self._parse_pool, self._llm_pool)
+            self._parse_pool = self._llm_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    # ── internals ──
+
+    def _parse_call(
+        self,
+        filename: str,
+        content_type: str,
+        file_bytes: bytes,
+    ) -> tuple[Executor, Callable[[], dict[str, Any]], threading.Event]:
+        """Where and how to run the parse stage, plus the event that abandons it."""
+        abandoned = threading.Event()
+        parse_pool = self._parse_executor()
+        if isinstance(parse_pool, ProcessPoolExecutor) and upload_kind(filename, content_type) == "pdf":
+            # Coordinate from a thread and send the pages to the pool.
+            pages = _PageTasks(parse_pool, abandoned, self._discard_parse_pool)
+            fn = functools.partial(
+                ingest_text,
+                filename,
+                content_type,
+                file_bytes,
+                page_executor=pages,
+                page_workers=self.parse_processes,
+            )
+            return self._llm_executor(), fn, abandoned
+        return parse_pool, functools.partial(ingest_text, filename, content_type, file_bytes), abandoned
+
+    def _cache_key(self, service: ExtractionService, filename: str, file_bytes: bytes) -> str | None:
+        if self.result_cache is None:
+            return None
+        return self.result_cache.key_for(file_bytes, filename=filename, model=service.llm_model)
+
+    def _extract_and_store(
+        self,
+        service: ExtractionService,
+        cache_key: str | None,
+        **kwargs: Any,
+    ) -> ExtractionResponse:
+        response = service.extract(**kwargs)
+        if cache_key is not None:
+            self.result_cache.put(cache_key, response)
+        return response
+
+    async def _run_stage(
+        self,
+        stage: str,
+        executor: Executor,
+        fn: Callable[[], T],
+        *,
+        timeout: float,
+        request: Request | None,
+        on_abandon: Callable[[], None] | None = None,
+    ) -> T:
+        submitted = executor.submit(fn)
+        work = asyncio.wrap_future(submitted)
+        watcher = asyncio.ensure_future(_wait_for_disconnect(request)) if request is not None else None
+        try:
+            done, _ = await asyncio.wait(
+                {work} if watcher is None else {work, watcher},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        except asyncio.CancelledError:
+            submitted.cancel()
+            if on_abandon is not None:
+                on_abandon()
+            raise
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+
+        if work in done:
+            try:
+                return work.result()
+            except BrokenExecutor:
+                self._discard_parse_pool(executor)
+                raise
+        # Drops the work if it has not started yet; a running call finishes
+        # in the background and its result is discarded.
+        submitted.cancel()
+        work.cancel()
+        if on_abandon is not None:
+            on_abandon()
+        if watcher is not None and watcher in done:
+            raise ClientDisconnectedError()
+        raise ExtractionStageTimeoutError(stage, timeout)
+
+    def _parse_executor(self) -> Executor:
+        with self._lock:
+            if self._parse_pool is None:
+                if self.parse_processes:
+                    # spawn: the API process runs threads, which fork does not copy safely.
+                    self._parse_pool = ProcessPoolExecutor(
+                        max_workers=self.parse_processes,
+                        mp_context=get_context("spawn"),
+                    )
+                else:
+                    self._parse_pool = ThreadPoolExecutor(thread_name_prefix="extraction-parse")
+            return self._parse_pool
+
+    def _llm_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._llm_pool is None:
+                self._llm_pool = ThreadPoolExecutor(
+                    max_workers=self.llm_threads,
+                    thread_name_prefix="extraction-llm",
+                )
+            return self._llm_pool
+
+    def _discard_parse_pool(self, executor: Executor) -> None:
+        # A worker process died; start a fresh pool on the next upload.
+        with self._lock:
+            if self._parse_pool is executor:
+                self._parse_pool = None
+
+
+class _PageTasks(Executor):
+    """One upload's page tasks on the parse pool.
+
+    Once the stage is abandoned (timeout or disconnect) no further pages are
+    submitted, and a pool broken by a dead worker is replaced for the next
+    upload.
+    """
+
+    def __init__(
+        self,
+        pool: ProcessPoolExecutor,
+        abandoned: threading.Event,
+        on_broken: Callable[[Executor], None],
+    ) -> None:
+        self._pool = pool
+        self._abandoned = abandoned
+        self._on_broken = on_broken
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        if self._abandoned.is_set():
+            raise CancelledError()
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BrokenExecutor:
+            self._on_broken(self._pool)
+            raise
+        future.add_done_callback(self._check_broken)
+        return future
+
+    def _check_broken(self, future: Future[Any]) -> None:
+        if not future.cancelled() and isinstance(future.exception(), BrokenExecutor):
+            self._on_broken(self._pool)
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
@@ -0,0 +1,42 @@
+"""Text extraction as a plain function, so it can run in a worker process."""
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import Any
+
+from app.services.extraction.diagnostics import DiagnosticsMixin
+from app.services.extraction.text_ingest import TextIngestMixin
+
+
+class _TextIngestor(TextIngestMixin, DiagnosticsMixin):
+    pass
+
+
+_INGESTOR = _TextIngestor()
+
+
+def ingest_text(
+    filename: str,
+    content_type: str,
+    file_bytes: bytes,
+    *,
+    page_executor: Executor | None = None,
+    page_workers: int = 1,
+    early_stop: bool | None = None,
+) -> dict[str, Any]:
+    """Same result as ``ExtractionService._extract_text``.
+
+    With ``page_executor``, PDF pages are read by tasks on it and this call
+    only coordinates them, so it must not run on one of its workers.
+    """
+    ingestor = _INGESTOR
+    if page_executor is not None:
+        ingestor = _TextIngestor()
+        ingestor.page_executor = page_executor
+        ingestor.page_workers = page_workers
+    return ingestor._extract_text(
+        filename=filename,
+        content_type=content_type,
+        file_bytes=file_bytes,
+        early_stop=early_stop,
+    )
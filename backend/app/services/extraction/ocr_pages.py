@@ -0,0 +1,151 @@
+"""Page-at-a-time OCR for scanned PDFs.
+
+Each page is rendered and OCR'd on its own, so pages spread across the
+parse pool and only one page image per worker is held in memory. Like the
+text-layer page tasks, each task gets the path of the spooled upload and a
+page number, not the PDF bytes.
+
+- Pages are first rendered at ``base_dpi``. A page whose mean word
+  confidence is below ``min_confidence`` is rendered again at
+  ``retry_dpi``, and the better-scoring text is kept.
+- Results are cached by a hash of the rendered image, so the same page
+  (a re-upload, or a scan shared between outlines) is not OCR'd twice by
+  the same worker process.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
+from typing import Any
+
+from app.services.extraction.pdf_pages import PdfSource
+
+OCR_CACHE_MAX_ENTRIES = 256
+
+_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+OCR_PACKAGES = ("pdf2image", "pytesseract")
+
+
+def missing_ocr_packages() -> list[str]:
+    """The OCR packages that are not installed; checked without importing them."""
+    return [name for name in OCR_PACKAGES if importlib.util.find_spec(name) is None]
+
+
+def pdf_page_count(source: PdfSource) -> int:
+    from pdf2image import pdfinfo_from_bytes, pdfinfo_from_path
+
+    info = pdfinfo_from_bytes(source) if isinstance(source, bytes) else pdfinfo_from_path(source)
+    return int(info["Pages"])
+
+
+def ocr_page(
+    source: PdfSource,
+    page_number: int,
+    *,
+    base_dpi: int,
+    retry_dpi: int,
+    min_confidence: float,
+) -> dict[str, Any]:
+    """OCR one page (1-based). Returns ``text``, ``confidence`` and ``dpi``."""
+    text, confidence = _ocr_rendered(_render_page(source, page_number, base_dpi))
+    dpi = base_dpi
+    if confidence < min_confidence and retry_dpi > base_dpi:
+        retry_text, retry_confidence = _ocr_rendered(_render_page(source, page_number, retry_dpi))
+        if retry_confidence >= confidence:
+            text, confidence, dpi = retry_text, retry_confidence, retry_dpi
+    return {"text": text, "confidence": confidence, "dpi": dpi}
+
+
+def ocr_pages(
+    source: PdfSource,
+    page_count: int,
+    *,
+    base_dpi: int,
+    retry_dpi: int,
+    min_confidence: float,
+    executor: Executor | None = None,
+    workers: int = 1,
+) -> list[dict[str, Any]]:
+    """OCR pages ``1..page_count`` in order, ``workers`` at a time on ``executor``.
+
+    Without an executor the pages are OCR'd in this process.
+    """
+    options = {"base_dpi": base_dpi, "retry_dpi": retry_dpi, "min_confidence": min_confidence}
+    page_numbers = deque(range(1, page_count + 1))
+    if executor is None:
+        return [ocr_page(source, number, **options) for number in page_numbers]
+
+    results: list[dict[str, Any]] = []
+    in_flight: deque[Future[dict[str, Any]]] = deque()
+    try:
+        while page_numbers or in_flight:
+            while page_numbers and len(in_flight) < max(1, workers):
+                in_flight.append(executor.submit(ocr_page, source, page_numbers.popleft(), **options))
+            results.append(in_flight.popleft().result())
+    finally:
+        for future in in_flight:
+            future.cancel()
+    return results
+
+
+def _render_page(source: PdfSource, page_number: int, dpi: int) -> Any:
+    from pdf2image import convert_from_bytes, convert_from_path
+
+    convert = convert_from_bytes if isinstance(source, bytes) else convert_from_path
+    images = convert(source, dpi=dpi, first_page=page_number, last_page=page_number)
+    return images[0] if images else None
+
+
+def _ocr_rendered(image: Any) -> tuple[str, float]:
+    if image is None:
+        return "", 0.0
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}:{image.size}".encode())
+    digest.update(image.tobytes())
+    key = digest.hexdigest()
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+    result = _ocr_image(image)
+    with _cache_lock:
+        _cache[key] = result
+        while len(_cache) > OCR_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return result
+
+
+def _ocr_image(image: Any) -> tuple[str, float]:
+    import pytesseract
+
+    data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+    return text_and_confidence(data)
+
+
+def text_and_confidence(data: dict[str, list[Any]]) -> tuple[str, float]:
+    """Rebuild line text from ``image_to_data`` output; mean word confidence."""
+    lines: dict[tuple[int, int, int], list[str]] = {}
+    confidences: list[float] = []
+    for index, word in enumerate(data.get("text", [])):
+        word = (word or "").strip()
+        confidence = float(data["conf"][index])
+        if not word or confidence < 0:
+            continue
+        line_key = (data["block_num"][index], data["par_num"][index], data["line_num"][index])
+        lines.setdefault(line_key, []).append(word)
+        confidences.append(confidence)
+    text = "\n".join(" ".join(words) for words in lines.values())
+    return text, (sum(confidences) / len(confidences) if confidences else 0.0)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import re
 import time
+from collections.abc import Callable
 from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
@@ -42,6 +43,13 @@ class ExtractionService(
         self._llm_client = llm_client or LlmExtractionClient()
         self._grading_filter = GradingSectionFilter()
 
+    @property
+    def llm_model(self) -> str:
+        return self._llm_client.model
+
+    def llm_cache_stats(self) -> dict[str, Any]:
+        return self._llm_client.cache_stats()
+
     def extract(
         self,
         *,
@@ -49,7 +57,18 @@ class ExtractionService(
         content_type: str,
         file_bytes: bytes,
         term: str | None = None,
+        text_result: dict[str, Any] | None = None,
+        read_full_text: Callable[[], str] | None = None,
     ) -> ExtractionResponse:
+        """Run the pipeline on an upload.
+
+        ``text_result`` is the output of ``ingest_text`` for the same file;
+        pass it when text was already extracted elsewhere (e.g. in a worker
+        process) to skip that step. If it is ``partial``, the fallbacks call
+        ``read_full_text`` for the whole document; pass one that goes back
+        through the parse stage (``ExtractionExecutors.full_text_reader``),
+        otherwise the rest is read in this process.
+        """
         debug_enabled = bool(os.getenv("FILTER_DEBUG"))
         deadline_keywords = (
             "due",
@@ -141,11 +160,12 @@ class ExtractionService(
         start_total = time.perf_counter()
         print("[UPLOAD_FILENAME]")
         print(f"filename={filename}")
-        text_result = self._extract_text(
-            filename=filename,
-            content_type=content_type,
-            file_bytes=file_bytes,
-        )
+        if text_result is None:
+            text_result = self._extract_text(
+                filename=filename,
+                content_type=content_type,
+                file_bytes=file_bytes,
+            )
         full_text = text_result["text"]
         print("FULL_TEXT_LEN:", len(full_text))
         print("FULL_TEXT_APPROX_TOKENS:", len(full_text) / 4)
@@ -208,17 +228,44 @@ class ExtractionService(
                 if course_code_executor is not None:
                     course_code_executor.shutdown(wait=False)
             return resolved_course_code["value"] if isinstance(resolved_course_code["value"], str) else None
+        complete_text: dict[str, str] = {}
+
+        def _complete_text() -> str:
+            # Lazy PDF ingestion may have stopped after the grading and
+            # schedule sections; the fallbacks below read the whole document.
+            if "value" not in complete_text:
+                if text_result.get("partial") and read_full_text is not None:
+                    complete_text["value"] = read_full_text()
+                elif text_result.get("partial"):
+                    complete_text["value"] = self._extract_text(
+                        filename=filename,
+                        content_type=content_type,
+                        file_bytes=file_bytes,
+                        early_stop=False,
+                    )["text"]
+                else:
+                    complete_text["value"] = full_text
+            return complete_text["value"]
+
+        retry_input: dict[str, str | None] = {}
+
+        def _full_text_retry_input() -> str:
+            if "value" not in retry_input:
+                retry_input["value"], retry_input["warning"] = _truncate_text_for_llm(
+                    _complete_text(),
+                    max_chars=max_retry_input_chars,
+                    warning_prefix="full_text_retry_truncated",
+                )
+            return retry_input["value"] or ""
+
         llm_input_text, filtered_used = self._grading_filter.filter(full_text)
         llm_input_text, llm_input_truncation_warning = _truncate_text_for_llm(
             llm_input_text,
             max_chars=max_llm_input_chars,
             warning_prefix="llm_input_truncated",
         )
-        full_text_retry_input, full_retry_truncation_warning = _truncate_text_for_llm(
-            full_text,
-            max_chars=max_retry_input_chars,
-            warning_prefix="full_text_retry_truncated",
-        )
+        if not text_result.get("partial"):
+            _full_text_retry_input()
         print("FILTERED_TEXT_LEN:", len(llm_input_text))
         print("FILTERED_TEXT_APPROX_TOKENS:", len(llm_input_text) / 4)
         print("FILTER_USED:", filtered_used)
@@ -318,7 +365,7 @@ class ExtractionService(
                 print("reason=no_normalized_deadlines_from_llm")
             fallback_deadlines = []
             parsed_deadlines = extract_deadlines_from_text(
-                full_text,
+                _complete_text(),
                 _resolve_course_code() or filename,
             )
             if debug_enabled:
@@ -373,7 +420,7 @@ class ExtractionService(
                 retry_start = time.perf_counter()
                 if debug_enabled:
                     print("[LLM_INPUT_SOURCE] source=full_text_retry")
-                retry_payload = self._llm_client.extract(full_text_retry_input)
+                retry_payload = self._llm_client.extract(_full_text_retry_input())
                 retry_end = time.perf_counter()
                 print("LLM_RETRY_DURATION_SECONDS:", round(retry_end - retry_start, 3))
                 retry_normalized = self._normalize_llm_payload(retry_payload)
@@ -414,8 +461,8 @@ class ExtractionService(
         source_warnings = [filtered_warning]
         if llm_input_truncation_warning:
             source_warnings.append(llm_input_truncation_warning)
-        if full_retry_truncation_warning:
-            source_warnings.append(full_retry_truncation_warning)
+        if retry_input.get("warning"):
+            source_warnings.append(retry_input["warning"])
         if retry_skipped_warning:
             source_warnings.append(retry_skipped_warning)
         if retry_warning:
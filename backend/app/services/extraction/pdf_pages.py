@@ -0,0 +1,87 @@
+"""Per-page PDF text extraction spread across the parse pool.
+
+``page.extract_text()`` is pure-Python layout analysis, so long outlines
+only get faster with more processes. Pages are split into contiguous
+chunks; each task reopens the document and extracts its chunk, and the
+chunks come back in page order.
+
+Tasks go to an executor the caller passes in (the extraction parse pool),
+so no pool is ever started from inside a worker. They receive the path of
+a spooled copy of the upload (``spooled_pdf``) rather than the bytes. Even
+the page count (``count_pages``) is a task, so the caller parses nothing.
+
+``iter_pages_parallel`` yields pages as their chunk finishes and keeps only
+a few chunks in flight, so a caller that stops early (lazy ingestion) does
+not pay for the rest of the document.
+"""
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any
+
+# A file path, or the upload's bytes when the pages are read in-process.
+PdfSource = str | bytes
+
+
+@contextmanager
+def spooled_pdf(file_bytes: bytes) -> Iterator[str]:
+    """Write the upload to a temporary file that worker tasks can open by path."""
+    fd, path = tempfile.mkstemp(prefix="evalio-upload-", suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(file_bytes)
+        yield path
+    finally:
+        os.unlink(path)
+
+
+def open_pdf(source: PdfSource) -> Any:
+    import pdfplumber
+
+    return pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def count_pages(source: PdfSource) -> int:
+    with open_pdf(source) as pdf:
+        return len(pdf.pages)
+
+
+def extract_page_range(source: PdfSource, start: int, stop: int) -> list[str]:
+    with open_pdf(source) as pdf:
+        return [(page.extract_text() or "").strip() for page in pdf.pages[start:stop]]
+
+
+def page_chunks(page_count: int, workers: int) -> list[tuple[int, int]]:
+    # Two chunks per worker evens out pages that take longer than others.
+    size = max(1, -(-page_count // (workers * 2)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def iter_pages_parallel(
+    source: PdfSource,
+    page_count: int,
+    *,
+    executor: Executor,
+    workers: int,
+) -> Iterator[str]:
+    """Yield the stripped text of every page, in order, ``workers`` chunks ahead.
+
+    Closing the generator cancels the chunks that have not started.
+    """
+    chunks = deque(page_chunks(page_count, workers))
+    in_flight: deque[Future[list[str]]] = deque()
+    try:
+        while chunks or in_flight:
+            while chunks and len(in_flight) < workers:
+                start, stop = chunks.popleft()
+                in_flight.append(executor.submit(extract_page_range, source, start, stop))
+            yield from in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
@@ -0,0 +1,169 @@
+"""Disk-backed cache of finished extraction results.
+
+Entries are keyed on the sha256 of the uploaded bytes plus everything else
+that changes the result: ``EXTRACTION_PIPELINE_VERSION``, the LLM model, the
+course code read from the filename, and the text-ingestion settings
+(``PDF_EARLY_STOP_*`` and the ``OCR_*`` DPI and confidence settings).
+Changing a setting therefore misses the old entries instead of returning
+results computed under it. Re-uploading an outline that
+someone already extracted returns the stored ``ExtractionResponse`` without
+running text extraction, OCR or the LLM.
+
+The cache is one SQLite database. Every API worker process can open the
+same file, so each outline is extracted once for everyone who uploads it.
+When the stored responses exceed ``max_bytes``, the least recently used ones
+are evicted.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from app.models_extraction import ExtractionResponse
+from app.services.extraction.course_code import extract_course_code_from_filename
+from app.services.extraction.text_ingest import TextIngestMixin
+
+# Bump when a change to the pipeline should invalidate stored results. Settings
+# that change results belong in _ingest_settings() instead.
+EXTRACTION_PIPELINE_VERSION = "2"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DB_NAME = "extraction-cache.sqlite3"
+
+
+def is_cacheable(response: ExtractionResponse) -> bool:
+    """Leave out results that a retry could improve: stubs, LLM and OCR failures."""
+    diagnostics = response.diagnostics
+    if diagnostics.stub or diagnostics.ocr_error:
+        return False
+    return not any(reason.startswith("llm_") for reason in diagnostics.trigger_reasons)
+
+
+def _ingest_settings() -> list[str]:
+    """Text-ingestion settings that change what the pipeline returns."""
+    return [
+        f"early_stop={TextIngestMixin.pdf_early_stop}:{TextIngestMixin.pdf_early_stop_margin_pages}",
+        f"ocr={TextIngestMixin.ocr_base_dpi}:{TextIngestMixin.ocr_retry_dpi}:{TextIngestMixin.ocr_min_confidence:g}",
+    ]
+
+
+class ExtractionResultCache:
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    @staticmethod
+    def key_for(file_bytes: bytes, *, filename: str, model: str) -> str:
+        digest = hashlib.sha256(file_bytes).hexdigest()
+        scope = "\0".join(
+            [
+                EXTRACTION_PIPELINE_VERSION,
+                model,
+                extract_course_code_from_filename(filename) or "",
+                *_ingest_settings(),
+            ]
+        )
+        return f"{digest}:{hashlib.sha256(scope.encode('utf-8')).hexdigest()[:16]}"
+
+    def get(self, key: str) -> ExtractionResponse | None:
+        db = self._connect()
+        row = db.execute("SELECT response FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self._count(misses=1)
+            return None
+        with db:
+            db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._count(hits=1)
+        return ExtractionResponse.model_validate_json(row[0])
+
+    def put(self, key: str, response: ExtractionResponse) -> None:
+        if not is_cacheable(response):
+            return
+        payload = response.model_dump_json()
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        db = self._connect()
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, response, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, payload, size, time.time()),
+            )
+            evicted = self._evict(db)
+        self._count(stores=1, evictions=evicted)
+
+    def stats(self) -> dict[str, Any]:
+        entries, total = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        with self._stats_lock:
+            return {
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
+
+    def _evict(self, db: sqlite3.Connection) -> int:
+        # Runs inside the insert's transaction, so concurrent writers from
+        # other processes see a consistent total.
+        (total,) = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+        evicted = 0
+        if total <= self.max_bytes:
+            return evicted
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY last_used").fetchall():
+            db.execute("DELETE FROM results WHERE key = ?", (key,))
+            evicted += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        return evicted
+
+    def _count(self, **deltas: int) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread; SQLite's file locks coordinate processes.
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path / _DB_NAME, timeout=30.0)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
@@ -2,16 +2,90 @@ from __future__ import annotations
 
 import io
 import shutil
+from collections.abc import Iterator
+from concurrent.futures import BrokenExecutor, CancelledError, Executor
+from contextlib import contextmanager, nullcontext
 from typing import Any
 
+from app.config import (
+    OCR_BASE_DPI,
+    OCR_MIN_CONFIDENCE,
+    OCR_RETRY_DPI,
+    PDF_EARLY_STOP_ENABLED,
+    PDF_EARLY_STOP_MARGIN_PAGES,
+    PDF_PARALLEL_MIN_PAGES,
+)
 from app.services.extraction.constants import MAX_OCR_PAGES, PDF_SUSPICIOUS_TEXT_THRESHOLD
+from app.services.extraction.ocr_pages import missing_ocr_packages, ocr_pages, pdf_page_count
+from app.services.extraction.pdf_pages import (
+    PdfSource,
+    count_pages,
+    iter_pages_parallel,
+    open_pdf,
+    spooled_pdf,
+)
+from app.services.grading_section_filter import SectionAnchorTracker
+
+
+def upload_kind(filename: str, content_type: str) -> str:
+    """``"txt"``, ``"docx"``, ``"image"``, ``"pdf"`` or ``"unsupported"``."""
+    lowered_name = filename.lower()
+    lowered_type = content_type.lower()
+    if lowered_name.endswith(".txt") or "text/plain" in lowered_type:
+        return "txt"
+    if lowered_name.endswith(".docx") or "wordprocessingml.document" in lowered_type:
+        return "docx"
+    if (
+        lowered_name.endswith(".png")
+        or lowered_name.endswith(".jpg")
+        or lowered_name.endswith(".jpeg")
+        or "image/png" in lowered_type
+        or "image/jpeg" in lowered_type
+        or "image/jpg" in lowered_type
+    ):
+        return "image"
+    if lowered_name.endswith(".pdf") or "application/pdf" in lowered_type:
+        return "pdf"
+    return "unsupported"
 
 
 class TextIngestMixin:
-    def _extract_text(self, *, filename: str, content_type: str, file_bytes: bytes) -> dict[str, Any]:
-        lowered_name = filename.lower()
-        lowered_type = content_type.lower()
-        if lowered_name.endswith(".txt") or "text/plain" in lowered_type:
+    # PDF pages are read by tasks on page_executor (the extraction parse
+    # pool) when one is set, in up to page_workers chunks at a time for
+    # documents of pdf_parallel_min_pages or more, and in one chunk below
+    # that. Nothing is parsed in the calling process then; if the pool
+    # breaks, the read fails. Without one (inside a parse worker, scripts,
+    # tests) every page is read in this process, so pools never nest.
+    page_executor: Executor | None = None
+    page_workers = 1
+    pdf_parallel_min_pages = PDF_PARALLEL_MIN_PAGES
+    # Lazy ingestion: stop reading a PDF once its grading and schedule
+    # sections have been seen, plus this many pages.
+    pdf_early_stop = PDF_EARLY_STOP_ENABLED
+    pdf_early_stop_margin_pages = PDF_EARLY_STOP_MARGIN_PAGES
+    # Scanned PDFs: pages are OCR'd one task each on page_executor (or in
+    # this process without one) at ocr_base_dpi, and pages scoring under
+    # ocr_min_confidence are redone at ocr_retry_dpi.
+    ocr_base_dpi = OCR_BASE_DPI
+    ocr_retry_dpi = OCR_RETRY_DPI
+    ocr_min_confidence = OCR_MIN_CONFIDENCE
+
+    def _extract_text(
+        self,
+        *,
+        filename: str,
+        content_type: str,
+        file_bytes: bytes,
+        early_stop: bool | None = None,
+    ) -> dict[str, Any]:
+        """Extract the upload's text.
+
+        For PDFs, ``early_stop`` (default ``pdf_early_stop``) may end reading
+        before the last page; the result then has ``"partial": True``, and
+        calling again with ``early_stop=False`` returns the whole document.
+        """
+        kind = upload_kind(filename, content_type)
+        if kind == "txt":
             txt_result = self._extract_text_txt(file_bytes)
             return {
                 "text": txt_result["text"],
@@ -21,7 +95,7 @@ class TextIngestMixin:
                 "parse_warnings": txt_result["parse_warnings"],
             }
 
-        if lowered_name.endswith(".docx") or "wordprocessingml.document" in lowered_type:
+        if kind == "docx":
             docx_result = self._extract_text_docx(file_bytes)
             return {
                 "text": docx_result["text"],
@@ -31,18 +105,14 @@ class TextIngestMixin:
                 "parse_warnings": docx_result["parse_warnings"],
             }
 
-        if (
-            lowered_name.endswith(".png")
-            or lowered_name.endswith(".jpg")
-            or lowered_name.endswith(".jpeg")
-            or "image/png" in lowered_type
-            or "image/jpeg" in lowered_type
-            or "image/jpg" in lowered_type
-        ):
+        if kind == "image":
             return self._extract_text_image(file_bytes)
 
-        if lowered_name.endswith(".pdf") or "application/pdf" in lowered_type:
-            return self._extract_text_pdf(file_bytes)
+        if kind == "pdf":
+            return self._extract_text_pdf(
+                file_bytes,
+                early_stop=self.pdf_early_stop if early_stop is None else early_stop,
+            )
 
         return {
             "text": "",
@@ -82,30 +152,57 @@ class TextIngestMixin:
         )
         return {"text": text, "parse_warnings": parse_warnings}
 
-    def _extract_text_pdf(self, file_bytes: bytes) -> dict[str, Any]:
+    def _extract_text_pdf(self, file_bytes: bytes, *, early_stop: bool = False) -> dict[str, Any]:
+        # Page tasks open a spooled copy by path instead of each receiving the bytes.
+        spool = spooled_pdf(file_bytes) if self.page_executor is not None else nullcontext(file_bytes)
+        with spool as source:
+            return self._read_pdf(source, early_stop=early_stop)
+
+    def _read_pdf(self, source: PdfSource, *, early_stop: bool) -> dict[str, Any]:
         primary_text = ""
         pdfplumber_failed = False
+        partial = False
         parse_warnings: list[str] = []
         try:
-            import pdfplumber
-
-            with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-                page_texts = [(page.extract_text() or "").strip() for page in pdf.pages]
+            with self._pdf_page_texts(source) as (page_count, pages):
+                tracker = (
+                    SectionAnchorTracker(margin_pages=self.pdf_early_stop_margin_pages)
+                    if early_stop
+                    else None
+                )
+                page_texts: list[str] = []
+                for text in pages:
+                    page_texts.append(text)
+                    if tracker is not None and tracker.feed(text):
+                        break
+                partial = len(page_texts) < page_count
+                if partial:
+                    parse_warnings.append(
+                        self._format_warning(
+                            "pdf_early_stop",
+                            f"read {len(page_texts)} of {page_count} pages",
+                        )
+                    )
             primary_text = "\n".join(part for part in page_texts if part)
+        except (CancelledError, BrokenExecutor):
+            raise
         except Exception as exc:
             pdfplumber_failed = True
+            partial = False
             parse_warnings.append(self._format_warning("pdf_parse_error", str(exc)))
 
-        if not self._should_trigger_ocr(primary_text, pdfplumber_failed=pdfplumber_failed):
+        # Stopping early means the anchors were found in the text layer.
+        if partial or not self._should_trigger_ocr(primary_text, pdfplumber_failed=pdfplumber_failed):
             return {
                 "text": primary_text,
                 "ocr_used": False,
                 "ocr_available": True,
                 "ocr_error": None,
                 "parse_warnings": parse_warnings,
+                "partial": partial,
             }
 
-        ocr_result = self._extract_text_ocr(file_bytes)
+        ocr_result = self._extract_text_ocr(source)
         parse_warnings.extend(ocr_result["parse_warnings"])
         if ocr_result["text"].strip():
             return {
@@ -135,15 +232,36 @@ class TextIngestMixin:
             "ocr_available": ocr_result["available"],
             "ocr_error": ocr_result["error"],
             "parse_warnings": parse_warnings,
+            "partial": partial,
         }
 
+    @contextmanager
+    def _pdf_page_texts(self, source: PdfSource) -> Iterator[tuple[int, Iterator[str]]]:
+        """``(page_count, page texts in order)``, from ``page_executor`` tasks when there is one."""
+        if self.page_executor is None:
+            with open_pdf(source) as pdf:
+                yield len(pdf.pages), ((page.extract_text() or "").strip() for page in pdf.pages)
+            return
+        page_count = self.page_executor.submit(count_pages, source).result()
+        workers = self.page_workers if page_count >= self.pdf_parallel_min_pages else 1
+        pages = iter_pages_parallel(
+            source,
+            page_count,
+            executor=self.page_executor,
+            workers=max(1, workers),
+        )
+        try:
+            yield page_count, pages
+        finally:
+            pages.close()
+
     def _should_trigger_ocr(self, text: str, *, pdfplumber_failed: bool = False) -> bool:
         if pdfplumber_failed:
             return True
         normalized = text.strip()
         return len(normalized) < PDF_SUSPICIOUS_TEXT_THRESHOLD
 
-    def _extract_text_ocr(self, file_bytes: bytes) -> dict[str, Any]:
+    def _extract_text_ocr(self, source: PdfSource) -> dict[str, Any]:
         parse_warnings: list[str] = []
         if shutil.which("tesseract") is None or shutil.which("pdftoppm") is None:
             message = "OCR dependencies not available (tesseract or poppler missing)"
@@ -154,31 +272,36 @@ class TextIngestMixin:
                 "error": message,
                 "parse_warnings": parse_warnings,
             }
-        try:
-            from pdf2image import convert_from_bytes
-            import pytesseract
-        except ImportError as exc:
-            parse_warnings.append(self._format_warning("ocr_import_error", str(exc)))
+        missing = missing_ocr_packages()
+        if missing:
+            message = f"No module named {', '.join(repr(name) for name in missing)}"
+            parse_warnings.append(self._format_warning("ocr_import_error", message))
             return {
                 "text": "",
                 "available": False,
-                "error": self._truncate_error(f"OCR package missing: {exc}"),
+                "error": self._truncate_error(f"OCR package missing: {message}"),
                 "parse_warnings": parse_warnings,
             }
 
         try:
-            images = convert_from_bytes(
-                file_bytes,
-                first_page=1,
-                last_page=MAX_OCR_PAGES,
+            pages = ocr_pages(
+                source,
+                min(pdf_page_count(source), MAX_OCR_PAGES),
+                base_dpi=self.ocr_base_dpi,
+                retry_dpi=self.ocr_retry_dpi,
+                min_confidence=self.ocr_min_confidence,
+                executor=self.page_executor,
+                workers=self.page_workers,
             )
-            chunks = [pytesseract.image_to_string(image).strip() for image in images]
+            chunks = [page["text"].strip() for page in pages]
             return {
                 "text": "\n".join(part for part in chunks if part),
                 "available": True,
                 "error": None,
                 "parse_warnings": parse_warnings,
             }
+        except (CancelledError, BrokenExecutor):
+            raise
         except Exception as exc:
             parse_warnings.append(self._format_warning("ocr_runtime_error", str(exc)))
             return {
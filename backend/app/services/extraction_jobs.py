@@ -0,0 +1,282 @@
+"""Background extraction jobs.
+
+``POST /extraction/jobs`` hands an upload to ``ExtractionJobQueue`` and
+returns at once; a fixed pool of worker threads runs the extraction, and
+clients poll the job or follow it over Server-Sent Events.
+
+Jobs live in this process only. Run one API worker (or route a client back
+to the same worker) when using them.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from app.models_extraction import ExtractionResponse
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATUSES = frozenset({JOB_SUCCEEDED, JOB_FAILED})
+
+
+class ExtractionQueueFullError(Exception):
+    """Raised when the queue already holds ``max_queued`` waiting jobs."""
+
+
+class ExtractionJobLimitError(Exception):
+    """Raised when a user already has ``max_active_per_user`` unfinished jobs."""
+
+
+@dataclass
+class ExtractionJob:
+    job_id: UUID
+    user_id: UUID
+    filename: str
+    status: str
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: ExtractionResponse | None = None
+    error: str | None = None
+    # Bumped on every status change; event streams wait for it to move.
+    version: int = 0
+
+
+class ExtractionJobQueue:
+    """Bounded worker pool plus an in-memory job table.
+
+    ``get`` and ``wait_for_update`` return copies, so callers never see a
+    job change underneath them.
+    """
+
+    def __init__(
+        self,
+        extract: Callable[..., ExtractionResponse],
+        *,
+        workers: int = 2,
+        max_queued: int = 32,
+        max_active_per_user: int = 3,
+        retention_seconds: float = 900.0,
+    ) -> None:
+        self._extract = extract
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.max_active_per_user = max_active_per_user
+        self.retention_seconds = retention_seconds
+        # Started on first submit, and again after shutdown().
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._jobs: dict[UUID, ExtractionJob] = {}
+        # Work items of jobs that have not started, so shutdown() can fail them.
+        self._pending: dict[UUID, Future[None]] = {}
+        self._watchers: dict[UUID, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+
+        self._submitted = 0
+        self._rejected = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._wait_seconds_total = 0.0
+        self._run_seconds_total = 0.0
+
+    def submit(
+        self,
+        *,
+        user_id: UUID,
+        filename: str,
+        content_type: str,
+        file_bytes: bytes,
+        term: str | None = None,
+    ) -> ExtractionJob:
+        with self._lock:
+            self._prune()
+            queued = sum(1 for job in self._jobs.values() if job.status == JOB_QUEUED)
+            if queued >= self.max_queued:
+                self._rejected += 1
+                raise ExtractionQueueFullError(f"extraction queue is full ({queued} waiting)")
+            active = sum(
+                1
+                for job in self._jobs.values()
+                if job.user_id == user_id and job.status not in FINISHED_STATUSES
+            )
+            if active >= self.max_active_per_user:
+                self._rejected += 1
+                raise ExtractionJobLimitError(
+                    f"at most {self.max_active_per_user} extraction jobs may run at once"
+                )
+            job = ExtractionJob(
+                job_id=uuid4(),
+                user_id=user_id,
+                filename=filename,
+                status=JOB_QUEUED,
+                created_at=datetime.now(UTC),
+            )
+            self._jobs[job.job_id] = job
+            self._submitted += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="extraction-job"
+                )
+            self._pending[job.job_id] = self._executor.submit(
+                self._run,
+                job.job_id,
+                {
+                    "filename": filename,
+                    "content_type": content_type,
+                    "file_bytes": file_bytes,
+                    "term": term,
+                },
+            )
+            return replace(job)
+
+    def get(self, job_id: UUID, user_id: UUID) -> ExtractionJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.user_id != user_id:
+                return None
+            return replace(job)
+
+    async def wait_for_update(
+        self,
+        job_id: UUID,
+        user_id: UUID,
+        *,
+        seen_version: int | None,
+        timeout: float,
+    ) -> ExtractionJob | None:
+        """Return the job once its version differs from ``seen_version``.
+
+        Returns the unchanged job after ``timeout`` seconds, and ``None``
+        if the job does not exist (or has been pruned).
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.user_id != user_id:
+                return None
+            if job.version != seen_version:
+                return replace(job)
+            self._watchers.setdefault(job_id, []).append((loop, waiter))
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                watchers = self._watchers.get(job_id)
+                if watchers is not None:
+                    watchers[:] = [entry for entry in watchers if entry[1] is not waiter]
+                    if not watchers:
+                        del self._watchers[job_id]
+        return self.get(job_id, user_id)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            queued = sum(1 for job in self._jobs.values() if job.status == JOB_QUEUED)
+            running = sum(1 for job in self._jobs.values() if job.status == JOB_RUNNING)
+            finished = self._succeeded + self._failed
+            return {
+                "workers": self.workers,
+                "max_queued": self.max_queued,
+                "max_active_per_user": self.max_active_per_user,
+                "queued": queued,
+                "running": running,
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+                "avg_wait_seconds": round(self._wait_seconds_total / finished, 3) if finished else 0.0,
+                "avg_run_seconds": round(self._run_seconds_total / finished, 3) if finished else 0.0,
+            }
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Stop the workers. Jobs still queued are marked failed, which wakes their watchers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pending, self._pending = self._pending, {}
+        for job_id, future in pending.items():
+            # A job a worker has already picked up runs to completion instead.
+            if future.cancel():
+                self._update(
+                    job_id,
+                    status=JOB_FAILED,
+                    finished_at=datetime.now(UTC),
+                    error="extraction queue shut down before the job started",
+                )
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jobs = {}
+
+    def _run(self, job_id: UUID, kwargs: dict[str, Any]) -> None:
+        self._update(job_id, status=JOB_RUNNING, started_at=datetime.now(UTC))
+        start = time.perf_counter()
+        try:
+            result = self._extract(**kwargs)
+        except Exception as exc:
+            self._update(
+                job_id,
+                status=JOB_FAILED,
+                finished_at=datetime.now(UTC),
+                error=f"extraction failed: {exc}",
+                run_seconds=time.perf_counter() - start,
+            )
+            return
+        self._update(
+            job_id,
+            status=JOB_SUCCEEDED,
+            finished_at=datetime.now(UTC),
+            result=result,
+            run_seconds=time.perf_counter() - start,
+        )
+
+    def _update(self, job_id: UUID, *, run_seconds: float | None = None, **changes: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            self._pending.pop(job_id, None)
+            if job is None:
+                return
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+            if job.status in FINISHED_STATUSES:
+                if job.status == JOB_SUCCEEDED:
+                    self._succeeded += 1
+                else:
+                    self._failed += 1
+                self._run_seconds_total += run_seconds or 0.0
+                if job.started_at is not None:
+                    self._wait_seconds_total += (job.started_at - job.created_at).total_seconds()
+            watchers = self._watchers.pop(job_id, [])
+        for loop, waiter in watchers:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:  # The stream's event loop has already closed.
+                pass
+
+    def _prune(self) -> None:
+        # Caller holds the lock.
+        cutoff = datetime.now(UTC).timestamp() - self.retention_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at.timestamp() < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -1,4 +1,5 @@
 import os
+import re
 from typing import Tuple
 
 DEBUG = os.getenv("FILTER_DEBUG") == "1"
@@ -20,6 +21,23 @@ ANCHOR_PHRASES = [
 ]
 LINES_ABOVE = 5
 LINES_BELOW = 30
+# Headings that open the deadline/schedule part of an outline. Only used to
+# decide when lazy PDF ingestion has read enough (see SectionAnchorTracker).
+# Single words like "schedule" or "deadlines" are left out: they show up on
+# cover pages and in tables of contents long before the section itself.
+SCHEDULE_ANCHOR_PHRASES = [
+    "course schedule",
+    "class schedule",
+    "weekly schedule",
+    "tentative schedule",
+    "important dates",
+    "key dates",
+    "due dates",
+    "course calendar",
+]
+# A table-of-contents entry: dot leaders, or a trailing page number.
+_TOC_ENTRY = re.compile(r"(?:\.{3,}|…|\s)\s*\d{1,3}$")
+_TOC_HEADINGS = {"contents", "table of contents"}
 
 
 class GradingSectionFilter:
@@ -91,13 +109,13 @@ class GradingSectionFilter:
             )
         return merged_text, True
 
-    def _is_anchor_line(self, normalized_line: str) -> bool:
+    def _is_anchor_line(self, normalized_line: str, anchors: list[str] = ANCHOR_PHRASES) -> bool:
         if not normalized_line:
             return False
         if len(normalized_line.split()) > 8:
             return False
 
-        for anchor in ANCHOR_PHRASES:
+        for anchor in anchors:
             if normalized_line == anchor:
                 return True
             if normalized_line.startswith(anchor):
@@ -127,3 +145,47 @@ class GradingSectionFilter:
         print(f"[{tag}]")
         for key, value in fields.items():
             print(f"{key}={value}")
+
+
+class SectionAnchorTracker:
+    """Decides, page by page, when an outline has been read far enough.
+
+    Feed page texts in order. ``feed`` returns True once both a grading
+    anchor and a schedule anchor have been seen and ``margin_pages`` more
+    pages have been read after the later of the two, so the sections
+    themselves (which run on past their heading) are complete. Table of
+    contents pages and entries (dot leaders, trailing page numbers) never
+    count as anchors.
+    """
+
+    def __init__(self, *, margin_pages: int = 2) -> None:
+        self.margin_pages = max(0, margin_pages)
+        self._filter = GradingSectionFilter()
+        self.pages_read = 0
+        self.grading_page: int | None = None
+        self.schedule_page: int | None = None
+
+    def feed(self, page_text: str) -> bool:
+        page = self.pages_read
+        self.pages_read += 1
+        lines = [raw_line.strip().lower() for raw_line in page_text.splitlines()]
+        # A table of contents names both sections without containing either.
+        if any(line in _TOC_HEADINGS for line in lines):
+            return self.done
+        for normalized_line in lines:
+            if _TOC_ENTRY.search(normalized_line):
+                continue
+            if self.grading_page is None and self._filter._is_anchor_line(normalized_line):
+                self.grading_page = page
+            if self.schedule_page is None and self._filter._is_anchor_line(
+                normalized_line, SCHEDULE_ANCHOR_PHRASES
+            ):
+                self.schedule_page = page
+        return self.done
+
+    @property
+    def done(self) -> bool:
+        if self.grading_page is None or self.schedule_page is None:
+            return False
+        last_anchor_page = max(self.grading_page, self.schedule_page)
+        return self.pages_read > last_anchor_page + self.margin_pages
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import copy
 import hashlib
 import json
 import os
 from typing import Any
 
+from app.services.llm_payload_cache import LlmPayloadCache
+from app.services.single_flight import SingleFlight, SingleFlightTimeoutError
+
 
 class _CompatResponsesAPI:
     def __init__(self, client: Any):
@@ -85,6 +87,13 @@ def _extract_chat_completion_content(completion: Any) -> str:
     return ""
 
 
+def _env_number(name: str, default: Any, parse: Any) -> Any:
+    try:
+        return parse(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
 class LlmExtractionError(RuntimeError):
     def __init__(self, reason_code: str, message: str):
         super().__init__(message)
@@ -217,14 +226,20 @@ class LlmExtractionClient:
             "on",
         }
 
-        cache_size_raw = os.getenv("LLM_EXTRACTION_CACHE_SIZE", "8")
-        try:
-            parsed_cache_size = int(cache_size_raw)
-        except ValueError:
-            parsed_cache_size = 8
-        self._cache_size = max(0, parsed_cache_size)
-        self._payload_cache: dict[str, dict[str, Any]] = {}
-        self._cache_order: list[str] = []
+        cache_size = _env_number("LLM_EXTRACTION_CACHE_SIZE", 128, int)
+        cache_max_mb = _env_number("LLM_EXTRACTION_CACHE_MAX_MB", 16.0, float)
+        cache_ttl = _env_number("LLM_EXTRACTION_CACHE_TTL_SECONDS", 3600.0, float)
+        self._payload_cache = LlmPayloadCache(
+            max_entries=cache_size if self._cache_enabled else 0,
+            max_bytes=int(cache_max_mb * 1024 * 1024),
+            ttl_seconds=cache_ttl,
+        )
+        # Identical uploads that arrive together share one LLM call. Waiters
+        # allow for the leader's call plus its retry.
+        self._inflight: SingleFlight[dict[str, Any]] = SingleFlight()
+        self.coalesce_timeout_seconds = _env_number(
+            "LLM_EXTRACTION_COALESCE_TIMEOUT_SECONDS", 2 * self.timeout_seconds + 5, float
+        )
 
         self._client = client
 
@@ -236,34 +251,22 @@ class LlmExtractionClient:
         return digest.hexdigest()
 
     def _get_cached_payload(self, cache_key: str) -> dict[str, Any] | None:
-        if not self._cache_enabled or self._cache_size <= 0:
-            return None
-
+        # Cached payloads are read-only (see llm_payload_cache), so hits are
+        # returned without copying.
         cached = self._payload_cache.get(cache_key)
-        if cached is None:
-            return None
-
-        if cache_key in self._cache_order:
-            self._cache_order.remove(cache_key)
-        self._cache_order.append(cache_key)
-
-        if os.getenv("FILTER_DEBUG"):
+        if cached is not None and os.getenv("FILTER_DEBUG"):
             print("[GPT_CACHE_HIT]", cache_key[:12])
-        return copy.deepcopy(cached)
-
-    def _store_cached_payload(self, cache_key: str, payload: dict[str, Any]) -> None:
-        if not self._cache_enabled or self._cache_size <= 0:
-            return
-
-        self._payload_cache[cache_key] = copy.deepcopy(payload)
+        return cached
 
-        if cache_key in self._cache_order:
-            self._cache_order.remove(cache_key)
-        self._cache_order.append(cache_key)
+    def _store_cached_payload(self, cache_key: str, payload: dict[str, Any]) -> dict[str, Any]:
+        return self._payload_cache.put(cache_key, payload)
 
-        while len(self._cache_order) > self._cache_size:
-            evicted_key = self._cache_order.pop(0)
-            self._payload_cache.pop(evicted_key, None)
+    def cache_stats(self) -> dict[str, Any]:
+        return {
+            **self._payload_cache.stats(),
+            "coalesced_calls": self._inflight.shared,
+            "in_flight_calls": self._inflight.in_flight(),
+        }
 
     def _get_client(self) -> Any:
         if self._client is not None:
@@ -290,6 +293,16 @@ class LlmExtractionClient:
         if cached_payload is not None:
             return cached_payload
 
+        try:
+            return self._inflight.do(
+                cache_key,
+                lambda: self._extract_uncached(text, cache_key),
+                timeout=self.coalesce_timeout_seconds,
+            )
+        except SingleFlightTimeoutError as exc:
+            raise LlmExtractionError("llm_timeout", str(exc)) from exc
+
+    def _extract_uncached(self, text: str, cache_key: str) -> dict[str, Any]:
         client = self._get_client()
         if os.getenv("FILTER_DEBUG"):
             print(
@@ -471,8 +484,7 @@ class LlmExtractionClient:
         if not isinstance(payload, dict):
             raise LlmExtractionError("llm_invalid_schema", "LLM JSON root must be an object")
 
-        self._store_cached_payload(cache_key, payload)
-        return payload
+        return self._store_cached_payload(cache_key, payload)
 
     def _log_payload_counts(self, payload: Any, *, attempt: int) -> None:
         if not isinstance(payload, dict):
@@ -0,0 +1,151 @@
+"""In-process LRU of parsed LLM extraction payloads.
+
+Payloads are frozen on the way in, so a hit hands out the stored object
+itself instead of a deep copy. ``FrozenDict`` and ``FrozenList`` subclass
+``dict`` and ``list`` so ``isinstance`` checks in the normalizers still
+pass, but any in-place change raises ``TypeError``. ``copy.deepcopy``
+returns ordinary mutable containers for callers that need to edit.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+
+def _read_only(self, *_args, **_kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only; copy.deepcopy() it to edit")
+
+
+class FrozenDict(dict):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (dict, (thaw(self),))
+
+
+class FrozenList(list):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (list, (thaw(self),))
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+class LlmPayloadCache:
+    """Thread-safe LRU bounded by entry count, total bytes and age.
+
+    The byte size of an entry is the length of its compact JSON encoding,
+    which tracks its in-memory footprint closely enough for a budget.
+    ``max_entries=0`` or ``max_bytes=0`` disables the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 128,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float | None = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, size, payload)
+        self._entries: OrderedDict[str, tuple[float | None, int, FrozenDict]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: str) -> FrozenDict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, payload = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> FrozenDict:
+        """Store ``payload`` and return the frozen copy that was stored."""
+        frozen = payload if isinstance(payload, FrozenDict) else freeze(payload)
+        if not self.enabled:
+            return frozen
+        size = len(json.dumps(frozen, separators=(",", ":")))
+        if size > self.max_bytes:
+            return frozen
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (expires_at, size, frozen)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return frozen
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
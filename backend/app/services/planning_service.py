@@ -4,9 +4,9 @@ from datetime import date, datetime, time, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from app.repositories.base import StoredCourse
+from app.repositories.base import StoredCourse, StoredGradeTarget
 from app.repositories.base import GradeTargetRepository
-from app.services.course_service import CourseService
+from app.services.course_service import CourseContext, CourseService
 from app.services.deadline_service import DeadlineService
 from app.services.grading_service import (
     _get_target_weight,
@@ -18,6 +18,7 @@ from app.services.grading_service import (
 
 PLANNING_TIMEZONE = ZoneInfo("America/Toronto")
 WEEKLY_WINDOW_DAYS = 7
+MAX_PLANNER_WINDOW_DAYS = 183
 CONFLICT_WINDOW_HOURS = 48
 NEAR_TERM_WINDOW_HOURS = 72
 HIGH_WEIGHT_THRESHOLD = 20.0
@@ -47,29 +48,47 @@ class PlanningService:
         user_id,
         *,
         start_date: date | None = None,
+        days: int = WEEKLY_WINDOW_DAYS,
     ) -> dict[str, Any]:
+        """Deadlines due in the ``days``-long window starting at ``start_date``.
+
+        Costs one course listing plus one ranged deadline query, however many
+        courses the user has or however long the window is.
+        """
+        day_count = max(1, min(int(days), MAX_PLANNER_WINDOW_DAYS))
         window_start = start_date or self._now().date()
-        window_end = window_start + timedelta(days=WEEKLY_WINDOW_DAYS - 1)
+        window_end = window_start + timedelta(days=day_count - 1)
+
+        stored_courses = self._course_service.list_stored_courses(user_id)
+        courses_by_id = {stored_course.course_id: stored_course for stored_course in stored_courses}
+        course_context = self._course_context(user_id, stored_courses)
 
         items: list[dict[str, Any]] = []
-        for stored_course in self._course_service.list_stored_courses(user_id):
-            items.extend(
-                self._build_weekly_items_for_course(
-                    user_id=user_id,
-                    stored_course=stored_course,
-                    window_start=window_start,
-                    window_end=window_end,
-                )
-            )
+        for deadline in self._deadline_service.list_deadlines_in_range(
+            user_id,
+            window_start,
+            window_end,
+            course_context=course_context,
+        ):
+            stored_course = courses_by_id.get(deadline.course_id)
+            if stored_course is None:
+                continue
+            item = self._build_weekly_item(stored_course, deadline, window_start)
+            if item is not None:
+                items.append(item)
 
         items.sort(key=self._weekly_item_sort_key)
         conflicts = self._detect_conflicts(items)
 
-        days: list[dict[str, Any]] = []
-        for offset in range(WEEKLY_WINDOW_DAYS):
+        items_by_date: dict[str, list[dict[str, Any]]] = {}
+        for item in items:
+            items_by_date.setdefault(item["due_date"], []).append(item)
+
+        day_entries: list[dict[str, Any]] = []
+        for offset in range(day_count):
             current_date = window_start + timedelta(days=offset)
-            day_items = [item for item in items if item["due_date"] == current_date.isoformat()]
-            days.append(
+            day_items = items_by_date.get(current_date.isoformat(), [])
+            day_entries.append(
                 {
                     "date": current_date.isoformat(),
                     "item_count": len(day_items),
@@ -79,8 +98,8 @@ class PlanningService:
             )
 
         busiest_day = None
-        if days:
-            busiest_day_entry = max(days, key=lambda day: (day["item_count"], day["date"]))
+        if day_entries:
+            busiest_day_entry = max(day_entries, key=lambda day: (day["item_count"], day["date"]))
             if busiest_day_entry["item_count"] > 0:
                 busiest_day = {
                     "date": busiest_day_entry["date"],
@@ -92,18 +111,18 @@ class PlanningService:
             "window": {
                 "start_date": window_start.isoformat(),
                 "end_date": window_end.isoformat(),
-                "day_count": WEEKLY_WINDOW_DAYS,
+                "day_count": day_count,
                 "timezone": "America/Toronto",
                 "conflict_window_hours": CONFLICT_WINDOW_HOURS,
             },
             "summary": {
                 "item_count": len(items),
                 "course_count": len({item["course_id"] for item in items}),
-                "days_with_items": sum(1 for day in days if day["item_count"] > 0),
+                "days_with_items": sum(1 for day in day_entries if day["item_count"] > 0),
                 "conflict_count": len(conflicts),
                 "busiest_day": busiest_day,
             },
-            "days": days,
+            "days": day_entries,
             "items": items,
             "conflicts": conflicts,
         }
@@ -117,24 +136,39 @@ class PlanningService:
         reference_point = self._normalize_datetime(reference_at) if reference_at else self._now()
         alerts: list[dict[str, Any]] = []
 
-        for stored_course in self._course_service.list_stored_courses(user_id):
+        # Three reads in total, however many courses the user has: the per-course
+        # builders below only work on what is prefetched here.
+        stored_courses = self._course_service.list_stored_courses(user_id)
+        course_context = self._course_context(user_id, stored_courses)
+        deadlines_by_course: dict[Any, list] = {}
+        for deadline in self._deadline_service.list_all_deadlines(
+            user_id,
+            course_context=course_context,
+        ):
+            deadlines_by_course.setdefault(deadline.course_id, []).append(deadline)
+        targets_by_course = {
+            target.course_id: target for target in self._grade_target_repo.list_targets(user_id)
+        }
+
+        for stored_course in stored_courses:
+            deadlines = deadlines_by_course.get(stored_course.course_id, [])
             alerts.extend(
                 self._build_deadline_alerts_for_course(
-                    user_id=user_id,
                     stored_course=stored_course,
+                    deadlines=deadlines,
                     reference_point=reference_point,
                 )
             )
             alerts.extend(
                 self._build_target_alerts_for_course(
-                    user_id=user_id,
                     stored_course=stored_course,
+                    target_record=targets_by_course.get(stored_course.course_id),
                 )
             )
             alerts.extend(
                 self._build_ungraded_alerts_for_course(
-                    user_id=user_id,
                     stored_course=stored_course,
+                    deadlines=deadlines,
                     reference_point=reference_point,
                 )
             )
@@ -169,56 +203,57 @@ class PlanningService:
             "alerts": ranked_alerts,
         }
 
-    def _build_weekly_items_for_course(
+    def _course_context(self, user_id, stored_courses: list[StoredCourse]) -> CourseContext:
+        # The planner already holds every course; let deadline canonicalization
+        # reuse them instead of reloading one course per deadline.
+        course_context = CourseContext(self._course_service)
+        for stored_course in stored_courses:
+            course_context.add(user_id, stored_course)
+        return course_context
+
+    def _build_weekly_item(
         self,
-        *,
-        user_id,
         stored_course: StoredCourse,
+        deadline,
         window_start: date,
-        window_end: date,
-    ) -> list[dict[str, Any]]:
-        items: list[dict[str, Any]] = []
-        for deadline in self._deadline_service.list_deadlines(user_id, stored_course.course_id):
-            due_date = self._parse_due_date(deadline.due_date)
-            if due_date is None or due_date < window_start or due_date > window_end:
-                continue
+    ) -> dict[str, Any] | None:
+        due_date = self._parse_due_date(deadline.due_date)
+        if due_date is None:
+            return None
 
-            due_at = self._deadline_due_at(deadline.due_date, deadline.due_time)
-            assessment_context = self._resolve_deadline_assessment_context(
-                stored_course.course,
-                getattr(deadline, "assessment_id", None),
-                deadline.assessment_name,
-                deadline.title,
-            )
-            items.append(
-                {
-                    "deadline_id": str(deadline.deadline_id),
-                    "course_id": str(stored_course.course_id),
-                    "course_name": stored_course.course.name,
-                    "title": deadline.title,
-                    "deadline_type": deadline.deadline_type,
-                    "due_date": deadline.due_date,
-                    "due_time": deadline.due_time,
-                    "due_at": due_at.isoformat(),
-                    "days_until_due": (due_date - window_start).days,
-                    "source": deadline.source,
-                    "assessment_name": assessment_context["assessment_name"],
-                    "assessment_weight": assessment_context["assessment_weight"],
-                }
-            )
-        return items
+        due_at = self._deadline_due_at(deadline.due_date, deadline.due_time)
+        assessment_context = self._resolve_deadline_assessment_context(
+            stored_course.course,
+            getattr(deadline, "assessment_id", None),
+            deadline.assessment_name,
+            deadline.title,
+        )
+        return {
+            "deadline_id": str(deadline.deadline_id),
+            "course_id": str(stored_course.course_id),
+            "course_name": stored_course.course.name,
+            "title": deadline.title,
+            "deadline_type": deadline.deadline_type,
+            "due_date": deadline.due_date,
+            "due_time": deadline.due_time,
+            "due_at": due_at.isoformat(),
+            "days_until_due": (due_date - window_start).days,
+            "source": deadline.source,
+            "assessment_name": assessment_context["assessment_name"],
+            "assessment_weight": assessment_context["assessment_weight"],
+        }
 
     def _build_deadline_alerts_for_course(
         self,
         *,
-        user_id,
         stored_course: StoredCourse,
+        deadlines: list,
         reference_point: datetime,
     ) -> list[dict[str, Any]]:
         alerts: list[dict[str, Any]] = []
         near_term_limit = reference_point + timedelta(hours=NEAR_TERM_WINDOW_HOURS)
 
-        for deadline in self._deadline_service.list_deadlines(user_id, stored_course.course_id):
+        for deadline in deadlines:
             due_at = self._deadline_due_at(deadline.due_date, deadline.due_time)
             assessment_context = self._resolve_deadline_assessment_context(
                 stored_course.course,
@@ -275,17 +310,15 @@ class PlanningService:
     def _build_target_alerts_for_course(
         self,
         *,
-        user_id,
         stored_course: StoredCourse,
+        target_record: StoredGradeTarget | None,
     ) -> list[dict[str, Any]]:
-        target_record = self._grade_target_repo.get_target(user_id, stored_course.course_id)
         if target_record is None or target_record.target_percentage is None:
             return []
 
-        feasibility = self._course_service.check_target_feasibility(
-            user_id=user_id,
-            course_id=stored_course.course_id,
-            target=target_record.target_percentage,
+        feasibility = self._course_service.evaluate_target_feasibility(
+            stored_course,
+            target_record.target_percentage,
         )
         if feasibility["feasible"]:
             return []
@@ -313,12 +346,11 @@ class PlanningService:
     def _build_ungraded_alerts_for_course(
         self,
         *,
-        user_id,
         stored_course: StoredCourse,
+        deadlines: list,
         reference_point: datetime,
     ) -> list[dict[str, Any]]:
         alerts: list[dict[str, Any]] = []
-        deadlines = self._deadline_service.list_deadlines(user_id, stored_course.course_id)
 
         for assessment in stored_course.course.assessments:
             if getattr(assessment, "is_bonus", False):
@@ -0,0 +1,75 @@
+"""Coalesce concurrent calls that share a key.
+
+The first caller for a key runs the function; callers that arrive while it
+is running wait for it and get the same result, or the same exception.
+Once the call finishes the key is released, so the next caller runs the
+function again (put a cache in front if that should be a hit).
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlightTimeoutError(TimeoutError):
+    """A waiter gave up before the leader's call finished."""
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Any, _Call[T]] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Any, fn: Callable[[], T], *, timeout: float | None = None) -> T:
+        """Run ``fn`` once per concurrent ``key``.
+
+        ``timeout`` only applies to waiters; the leader runs ``fn`` to
+        completion so the waiters still behind it get a result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise SingleFlightTimeoutError(f"timed out after {timeout:g}s waiting for a shared call")
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -73,3 +73,47 @@ def test_course_management_endpoints_are_user_scoped(make_auth_client):
     delete_by_other = client_b.delete(f"/courses/{course_id}")
     assert delete_by_other.status_code == 404
 
+
+
+def test_list_courses_pages_with_keyset_cursor(auth_client):
+    created_ids = []
+    for index in range(5):
+        response = auth_client.post("/courses/", json=_course_payload(name=f"COURSE{index}"))
+        assert response.status_code == 200
+        created_ids.append(response.json()["course_id"])
+
+    seen = []
+    cursor = None
+    for _ in range(5):
+        params = {"limit": 2, "view": "summary"}
+        if cursor:
+            params["cursor"] = cursor
+        response = auth_client.get("/courses/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert all("assessments" not in course for course in page)
+        assert all(course["assessment_count"] == 3 for course in page)
+        seen.extend(course["course_id"] for course in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == created_ids
+
+    first_page = auth_client.get("/courses/", params={"limit": 3})
+    assert [course["name"] for course in first_page.json()] == ["COURSE0", "COURSE1", "COURSE2"]
+    assert len(first_page.json()[0]["assessments"]) == 3
+    rest = auth_client.get(
+        "/courses/", params={"cursor": first_page.headers["X-Next-Cursor"]}
+    )
+    assert [course["name"] for course in rest.json()] == ["COURSE3", "COURSE4"]
+    assert "X-Next-Cursor" not in rest.headers
+
+    unpaged = auth_client.get("/courses/")
+    assert len(unpaged.json()) == 5
+    assert "X-Next-Cursor" not in unpaged.headers
+
+
+def test_list_courses_rejects_malformed_cursor(auth_client):
+    response = auth_client.get("/courses/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
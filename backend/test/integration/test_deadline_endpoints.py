@@ -216,6 +216,93 @@ class TestDeadlineService:
         items = self.service.list_deadlines(self.user_id, self.course_id)
         assert len(items) == 2
 
+    def test_import_extracted_loads_course_once_and_writes_one_batch(self):
+        from app.models import Assessment, CourseCreate
+        from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+        from app.services.course_service import CourseService
+
+        course_repo = InMemoryCourseRepository()
+        stored = course_repo.create(
+            self.user_id,
+            CourseCreate(
+                name="EECS 2311",
+                assessments=[
+                    Assessment(name="Quiz 1", weight=40),
+                    Assessment(name="Final", weight=60),
+                ],
+            ),
+        )
+        course_reads = []
+        original_get = course_repo.get_by_id
+        course_repo.get_by_id = lambda *a, **k: course_reads.append(1) or original_get(*a, **k)
+        batches = []
+        original_create_many = self.repo.create_many
+        self.repo.create_many = lambda u, c, items: batches.append(len(items)) or original_create_many(u, c, items)
+        service = DeadlineService(self.repo, course_service=CourseService(course_repo))
+
+        created = service.import_extracted_deadlines(
+            self.user_id,
+            stored.course_id,
+            [
+                {"title": "Quiz 1", "due_date": "2026-02-01", "assessment_name": "Quiz 1"},
+                {"title": "Final Exam", "due_date": "2026-04-20", "assessment_name": "Final"},
+                {"title": "Reading week", "due_date": "2026-02-16"},
+            ],
+        )
+
+        assert course_reads == [1]
+        assert batches == [3]
+        assert [d.assessment_name for d in created] == ["Quiz 1", "Final", None]
+
+    def test_list_deadlines_loads_the_course_once(self):
+        from app.models import Assessment, CourseCreate
+        from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+        from app.services.course_service import CourseContext, CourseService
+
+        course_repo = InMemoryCourseRepository()
+        quiz_id, final_id = uuid4(), uuid4()
+        stored = course_repo.create(
+            self.user_id,
+            CourseCreate(
+                name="EECS 2311",
+                assessments=[
+                    Assessment(assessment_id=quiz_id, name="Quiz", weight=40),
+                    Assessment(assessment_id=final_id, name="Final", weight=60),
+                ],
+            ),
+        )
+        course_reads = []
+        original_get = course_repo.get_by_id
+        course_repo.get_by_id = lambda *a, **k: course_reads.append(1) or original_get(*a, **k)
+        course_service = CourseService(course_repo)
+        service = DeadlineService(self.repo, course_service=course_service)
+        for index in range(10):
+            self.repo.create(
+                self.user_id,
+                stored.course_id,
+                DeadlineCreate(
+                    title=f"Item {index}",
+                    due_date="2026-03-01",
+                    assessment_id=quiz_id if index % 2 else final_id,
+                    assessment_name="stale name",
+                ),
+            )
+
+        items = service.list_deadlines(self.user_id, stored.course_id)
+        assert len(course_reads) == 1
+        assert {item.assessment_name for item in items} == {"Quiz", "Final"}
+
+        context = CourseContext(course_service)
+        context.add(self.user_id, stored)
+        service.list_deadlines(self.user_id, stored.course_id, course_context=context)
+        service.create_deadline(
+            self.user_id,
+            stored.course_id,
+            DeadlineCreate(title="Quiz 2", due_date="2026-03-05", assessment_name="Quiz"),
+            course_context=context,
+        )
+        assert len(course_reads) == 1
+
     def test_ics_export(self):
         data = DeadlineCreate(title="Final", due_date="2026-04-15")
         self.service.create_deadline(self.user_id, self.course_id, data)
@@ -265,6 +352,35 @@ class TestDeadlineEndpoints:
         assert r2.status_code == 200
         assert r2.json()["count"] == 1
 
+    def test_list_deadlines_pages_with_keyset_cursor(self, auth_client):
+        course_id = self._create_course(auth_client)
+        for day in (20, 5, 12, 12, 1):
+            r = auth_client.post(f"/courses/{course_id}/deadlines", json={
+                "title": f"Item {day}",
+                "due_date": f"2026-03-{day:02d}",
+            })
+            assert r.status_code == 200
+
+        dates = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            r = auth_client.get(f"/courses/{course_id}/deadlines", params=params)
+            assert r.status_code == 200
+            body = r.json()
+            assert body["count"] <= 2
+            dates.extend(d["due_date"] for d in body["deadlines"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert dates == ["2026-03-01", "2026-03-05", "2026-03-12", "2026-03-12", "2026-03-20"]
+        assert auth_client.get(f"/courses/{course_id}/deadlines").json()["next_cursor"] is None
+        bad = auth_client.get(f"/courses/{course_id}/deadlines", params={"cursor": "bogus"})
+        assert bad.status_code == 400
+
     def test_deadline_type_round_trip(self, auth_client):
         course_id = self._create_course(auth_client)
 
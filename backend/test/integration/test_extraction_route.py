@@ -1,3 +1,5 @@
+import time
+
 from app.dependencies import get_extraction_service
 
 
@@ -129,3 +131,81 @@ def test_extraction_outline_validation_failure_hard_contract(auth_client, monkey
     assert diagnostics["failure_reason"] == "Weight sum does not equal 100"
     assert diagnostics["trigger_gpt"] is True
     assert "weight_sum_not_100" in diagnostics["trigger_reasons"]
+
+
+def _stub_llm(monkeypatch) -> None:
+    service = get_extraction_service()
+    monkeypatch.setattr(
+        service._llm_client,
+        "extract",
+        lambda _text: {
+            "assessments": [
+                {"name": "Assignment", "weight": 20},
+                {"name": "Midterm", "weight": 30},
+                {"name": "Final Exam", "weight": 50},
+            ],
+            "deadlines": [],
+        },
+    )
+
+
+def _outline_upload() -> dict:
+    outline_text = "\n".join(
+        ["Course Grading Breakdown", "Assignment 20%", "Midterm 30%", "Final Exam 50%"]
+    )
+    return {"file": ("outline.txt", outline_text.encode("utf-8"), "text/plain")}
+
+
+def _wait_for_job(client, job_id: str) -> dict:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        body = client.get(f"/extraction/jobs/{job_id}").json()
+        if body["status"] in {"succeeded", "failed"}:
+            return body
+        time.sleep(0.02)
+    raise AssertionError("extraction job did not finish")
+
+
+def test_extraction_job_runs_in_background_and_can_be_polled(auth_client, monkeypatch):
+    _stub_llm(monkeypatch)
+
+    response = auth_client.post("/extraction/jobs", files=_outline_upload(), data={"term": "W26"})
+    assert response.status_code == 202
+    submitted = response.json()
+    assert submitted["status"] == "queued"
+    assert submitted["result"] is None
+
+    body = _wait_for_job(auth_client, submitted["job_id"])
+    assert body["status"] == "succeeded"
+    assert body["result"]["structure_valid"] is True
+    assert len(body["result"]["assessments"]) == 3
+
+    stats = auth_client.get("/health/extraction-jobs").json()
+    assert stats["succeeded"] >= 1
+    assert stats["queued"] == 0
+
+
+def test_extraction_job_events_stream_ends_with_the_result(auth_client, monkeypatch):
+    _stub_llm(monkeypatch)
+    job_id = auth_client.post("/extraction/jobs", files=_outline_upload()).json()["job_id"]
+
+    with auth_client.stream("GET", f"/extraction/jobs/{job_id}/events") as stream:
+        assert stream.headers["content-type"].startswith("text/event-stream")
+        events = [line.removeprefix("event: ") for line in stream.iter_lines() if line.startswith("event: ")]
+
+    assert events[-1] == "succeeded"
+
+
+def test_extraction_job_is_private_to_its_owner(auth_client, make_auth_client, monkeypatch):
+    _stub_llm(monkeypatch)
+    job_id = auth_client.post("/extraction/jobs", files=_outline_upload()).json()["job_id"]
+    other = make_auth_client("other@example.com")
+
+    assert other.get(f"/extraction/jobs/{job_id}").status_code == 404
+    assert other.get(f"/extraction/jobs/{job_id}/events").status_code == 404
+
+
+def test_extraction_job_requires_a_file(auth_client):
+    response = auth_client.post("/extraction/jobs", data={"term": "W26"})
+    assert response.status_code == 422
+    assert response.json()["detail"] == "file required"
@@ -82,6 +82,29 @@ def test_weekly_planner_aggregates_items_and_detects_conflicts(auth_client):
     assert conflict["severity"] in {"medium", "high"}
 
 
+def test_weekly_planner_accepts_multi_week_windows(auth_client):
+    course_a = _create_course(auth_client, "EECS2311")
+    course_b = _create_course(auth_client, "EECS3311")
+
+    _create_deadline(auth_client, course_a, title="Week 1", due_date="2026-03-23")
+    _create_deadline(auth_client, course_b, title="Week 3", due_date="2026-04-06")
+    _create_deadline(auth_client, course_b, title="Too Late", due_date="2026-04-20")
+    _create_deadline(auth_client, course_a, title="Too Early", due_date="2026-03-21")
+
+    response = auth_client.get("/planning/weekly?start_date=2026-03-22&days=21")
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["window"]["end_date"] == "2026-04-11"
+    assert body["window"]["day_count"] == 21
+    assert len(body["days"]) == 21
+    assert [item["title"] for item in body["items"]] == ["Week 1", "Week 3"]
+    assert body["items"][1]["days_until_due"] == 15
+
+    assert auth_client.get("/planning/weekly?days=0").status_code == 422
+    assert auth_client.get("/planning/weekly?days=1000").status_code == 422
+
+
 def test_risk_alerts_include_supported_alert_types(auth_client):
     course_a = _create_course(
         auth_client,
@@ -250,3 +273,122 @@ def test_risk_alerts_rank_supported_types_in_deterministic_order(auth_client):
     assert "near_term_deadline" in alert_types
     assert "high_weight_ungraded" in alert_types
     assert body["summary"]["severity_counts"]["critical"] == 2
+
+
+def test_risk_alerts_read_each_repository_once_regardless_of_course_count():
+    from datetime import datetime, timezone
+    from uuid import uuid4
+
+    from app.models import Assessment, CourseCreate
+    from app.models_deadline import DeadlineCreate
+    from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+    from app.repositories.inmemory_deadline_repo import InMemoryDeadlineRepository
+    from app.repositories.inmemory_grade_target_repo import InMemoryGradeTargetRepository
+    from app.services.course_service import CourseService
+    from app.services.deadline_service import DeadlineService
+    from app.services.planning_service import PlanningService
+
+    user_id = uuid4()
+    course_repo = InMemoryCourseRepository()
+    deadline_repo = InMemoryDeadlineRepository()
+    target_repo = InMemoryGradeTargetRepository()
+    for index in range(6):
+        stored = course_repo.create(
+            user_id,
+            CourseCreate(
+                name=f"COURSE{index}",
+                assessments=[
+                    Assessment(name="Midterm", weight=60, raw_score=10, total_score=100),
+                    Assessment(name="Final", weight=40),
+                ],
+            ),
+        )
+        deadline_repo.create(
+            user_id,
+            stored.course_id,
+            DeadlineCreate(title="Final", due_date="2026-03-23", assessment_name="Final"),
+        )
+        target_repo.set_target(user_id, stored.course_id, 90)
+
+    calls: list[str] = []
+
+    def _counted(repo, name):
+        original = getattr(repo, name)
+        setattr(repo, name, lambda *a, **k: calls.append(name) or original(*a, **k))
+
+    for repo, names in (
+        (course_repo, ("list_all", "list_summaries", "get_by_id")),
+        (deadline_repo, ("list_all", "list_for_user")),
+        (target_repo, ("get_target", "list_targets")),
+    ):
+        for name in names:
+            _counted(repo, name)
+
+    course_service = CourseService(course_repo)
+    service = PlanningService(
+        course_service=course_service,
+        deadline_service=DeadlineService(deadline_repo, course_service=course_service),
+        grade_target_repo=target_repo,
+    )
+    body = service.get_risk_alerts(
+        user_id,
+        reference_at=datetime(2026, 3, 22, 16, tzinfo=timezone.utc),
+    )
+
+    assert sorted(calls) == ["list_all", "list_for_user", "list_targets"]
+    type_counts = body["summary"]["type_counts"]
+    assert type_counts["impossible_target"] == 6
+    assert type_counts["near_term_deadline"] == 6
+    assert type_counts["high_weight_ungraded"] == 6
+
+
+def test_weekly_planner_reads_courses_once_for_a_term_long_window():
+    from datetime import date
+    from uuid import uuid4
+
+    from app.models import Assessment, CourseCreate
+    from app.models_deadline import DeadlineCreate
+    from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+    from app.repositories.inmemory_deadline_repo import InMemoryDeadlineRepository
+    from app.repositories.inmemory_grade_target_repo import InMemoryGradeTargetRepository
+    from app.services.course_service import CourseService
+    from app.services.deadline_service import DeadlineService
+    from app.services.planning_service import PlanningService
+
+    user_id = uuid4()
+    course_repo = InMemoryCourseRepository()
+    deadline_repo = InMemoryDeadlineRepository()
+    for index in range(5):
+        stored = course_repo.create(
+            user_id,
+            CourseCreate(name=f"COURSE{index}", assessments=[Assessment(name="Final", weight=100)]),
+        )
+        deadline_repo.create(
+            user_id,
+            stored.course_id,
+            DeadlineCreate(
+                title="Final",
+                due_date="2026-03-23" if index == 0 else "2026-05-01",
+                assessment_name="Final",
+            ),
+        )
+
+    calls: list[str] = []
+    for name in ("list_all", "list_summaries", "get_by_id"):
+        original = getattr(course_repo, name)
+        setattr(course_repo, name, lambda *a, _n=name, _o=original, **k: calls.append(_n) or _o(*a, **k))
+
+    course_service = CourseService(course_repo)
+    service = PlanningService(
+        course_service=course_service,
+        deadline_service=DeadlineService(deadline_repo, course_service=course_service),
+        grade_target_repo=InMemoryGradeTargetRepository(),
+    )
+    body = service.get_weekly_planner(user_id, start_date=date(2026, 3, 22), days=183)
+
+    assert calls == ["list_all"]
+    assert [item["course_name"] for item in body["items"]] == [f"COURSE{index}" for index in range(5)]
+    item = body["items"][0]
+    assert item["course_name"] == "COURSE0"
+    assert item["assessment_name"] == "Final"
+    assert item["assessment_weight"] == 100.0
@@ -151,3 +151,22 @@ def test_multicourse_targets_restore_on_new_client_refresh(auth_client):
         course_a_target_again = refreshed_client.get(f"/courses/{course_a}/target")
         assert course_a_target_again.status_code == 200
         assert course_a_target_again.json()["target_percentage"] == 91.0
+
+
+def test_state_skips_aggregates_and_per_course_target_lookups(auth_client, monkeypatch):
+    from app.dependencies import get_course_repo, get_grade_target_repo
+
+    course_id = _create_course(auth_client)
+    auth_client.post(f"/courses/{course_id}/target", json={"target": 82})
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("/auth/me/state should not load per-course data")
+
+    monkeypatch.setattr(get_course_repo(), "list_all", _unexpected)
+    monkeypatch.setattr(get_grade_target_repo(), "get_target", _unexpected)
+
+    response = auth_client.get("/auth/me/state")
+    assert response.status_code == 200
+    course = response.json()["courses"][0]
+    assert course["assessment_count"] == 2
+    assert course["target_percentage"] == 82.0
@@ -0,0 +1,188 @@
+from uuid import uuid4
+
+import pytest
+
+from app.models import Assessment, CourseCreate
+from app.repositories.base import CourseVersionConflictError
+from app.repositories.caching_course_repo import CachingCourseRepository
+from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+
+
+class _CountingCourseRepository(InMemoryCourseRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_calls = 0
+
+    def get_by_id(self, user_id, course_id):
+        self.get_calls += 1
+        stored = super().get_by_id(user_id, course_id)
+        if stored is None:
+            return None
+        # Mimic Postgres: every read hydrates a fresh aggregate.
+        return type(stored)(
+            course_id=stored.course_id,
+            course=stored.course.model_copy(deep=True),
+            version=stored.version,
+        )
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _course(name: str = "EECS2311") -> CourseCreate:
+    return CourseCreate(
+        name=name,
+        term="W26",
+        assessments=[
+            Assessment(name="Midterm", weight=40),
+            Assessment(name="Final", weight=60),
+        ],
+    )
+
+
+def test_repeated_reads_hit_the_cache():
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner)
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+
+    first = repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+    second = repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+
+    assert inner.get_calls == 1
+    assert first.course == second.course
+    assert repo.hits == 1
+
+
+def test_mutating_a_returned_course_does_not_leak_into_the_cache():
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner)
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+
+    repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+    hit = repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+    hit.course.assessments[0].weight = 99
+
+    again = repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+    assert again.course.assessments[0].weight == 40
+
+
+def test_update_and_delete_invalidate_the_entry():
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner)
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+    repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+
+    repo.update(user_id=user_id, course_id=stored.course_id, course=_course(name="Renamed"))
+    assert repo.get_by_id(user_id=user_id, course_id=stored.course_id).course.name == "Renamed"
+    assert inner.get_calls == 2
+
+    repo.delete(user_id=user_id, course_id=stored.course_id)
+    assert repo.get_by_id(user_id=user_id, course_id=stored.course_id) is None
+
+
+def test_entries_expire_after_ttl():
+    clock = _FakeClock()
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner, ttl_seconds=10, clock=clock)
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+
+    repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+    clock.now = 5
+    repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+    assert inner.get_calls == 1
+
+    # Another worker writes behind the cache's back; expiry picks it up.
+    inner.update(user_id=user_id, course_id=stored.course_id, course=_course(name="Elsewhere"))
+    clock.now = 11
+    assert repo.get_by_id(user_id=user_id, course_id=stored.course_id).course.name == "Elsewhere"
+    assert inner.get_calls == 2
+
+
+def test_hits_see_another_workers_write_before_expiry():
+    clock = _FakeClock()
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner, ttl_seconds=30, clock=clock)
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+    repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+
+    # The user's first edit landed on another worker.
+    inner.update(user_id=user_id, course_id=stored.course_id, course=_course(name="Elsewhere"))
+    clock.now = 5
+    current = repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+    assert (current.course.name, current.version) == ("Elsewhere", 2)
+    assert inner.get_calls == 2
+
+    # Their second edit on this worker saves against the current version.
+    saved = repo.update(
+        user_id=user_id,
+        course_id=stored.course_id,
+        course=_course(name="Again"),
+        expected_version=current.version,
+    )
+    assert saved.version == 3
+
+
+def test_size_bound_evicts_least_recently_used():
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner, max_entries=2, ttl_seconds=None)
+    user_id = uuid4()
+    ids = [repo.create(user_id=user_id, course=_course(name=f"C{i}")).course_id for i in range(3)]
+
+    repo.get_by_id(user_id=user_id, course_id=ids[0])
+    repo.get_by_id(user_id=user_id, course_id=ids[1])
+    repo.get_by_id(user_id=user_id, course_id=ids[0])  # refresh 0
+    repo.get_by_id(user_id=user_id, course_id=ids[2])  # evicts 1
+    assert inner.get_calls == 3
+
+    repo.get_by_id(user_id=user_id, course_id=ids[0])
+    assert inner.get_calls == 3
+    repo.get_by_id(user_id=user_id, course_id=ids[1])
+    assert inner.get_calls == 4
+
+
+def test_cache_is_scoped_per_user():
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner)
+    owner = uuid4()
+    stored = repo.create(user_id=owner, course=_course())
+    repo.get_by_id(user_id=owner, course_id=stored.course_id)
+
+    assert repo.get_by_id(user_id=uuid4(), course_id=stored.course_id) is None
+
+
+def test_failed_update_still_invalidates():
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner)
+    user_id = uuid4()
+
+    with pytest.raises(KeyError):
+        repo.update(user_id=user_id, course_id=uuid4(), course=_course())
+
+
+def test_saving_a_stale_cached_read_conflicts():
+    inner = _CountingCourseRepository()
+    repo = CachingCourseRepository(inner, ttl_seconds=None)
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+    stale = repo.get_by_id(user_id=user_id, course_id=stored.course_id)
+
+    inner.update(user_id=user_id, course_id=stored.course_id, course=_course(name="Elsewhere"))
+
+    with pytest.raises(CourseVersionConflictError):
+        repo.update(
+            user_id=user_id,
+            course_id=stored.course_id,
+            course=stale.course,
+            expected_version=stale.version,
+        )
+    assert inner.get_by_id(user_id, stored.course_id).course.name == "Elsewhere"
@@ -0,0 +1,110 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.scripts.migrate_courses_jsonb_to_relational import (
+    MigrationStats,
+    _prepare_row,
+    load_checkpoint,
+    partition_bounds,
+    resume_point,
+    save_checkpoint,
+)
+
+
+def test_partition_bounds_cover_the_uuid_space_without_overlap():
+    bounds = [partition_bounds(index, 3) for index in range(3)]
+
+    assert bounds[0][0] == UUID(int=0)
+    assert bounds[-1][1] is None
+    for (_, upper), (lower, _) in zip(bounds, bounds[1:]):
+        assert upper == lower
+    assert partition_bounds(0, 1) == (UUID(int=0), None)
+    with pytest.raises(ValueError):
+        partition_bounds(3, 3)
+
+
+def test_checkpoint_round_trips_and_missing_file_means_start(tmp_path):
+    path = tmp_path / "migration.checkpoint"
+    assert load_checkpoint(path) is None
+    assert load_checkpoint(None) is None
+
+    course_id = uuid4()
+    save_checkpoint(path, course_id)
+    assert load_checkpoint(path) == course_id
+    assert not path.with_name(path.name + ".tmp").exists()
+
+
+def test_resume_point_stops_before_the_first_failed_course():
+    rows = [{"id": UUID(int=n)} for n in range(1, 6)]
+
+    assert resume_point(rows, set()) == UUID(int=5)
+    assert resume_point(rows, {UUID(int=3), UUID(int=5)}) == UUID(int=2)
+    assert resume_point(rows, {UUID(int=1)}) is None
+
+
+def test_prepare_row_builds_parent_child_and_rule_rows():
+    course_id = uuid4()
+    prepared = _prepare_row(
+        {
+            "id": course_id,
+            "data": {
+                "name": "EECS2311",
+                "term": "W26",
+                "assessments": [
+                    {
+                        "name": "Labs",
+                        "weight": 40,
+                        "children": [
+                            {"name": "Lab 1", "weight": 20},
+                            {"name": "Lab 2", "weight": 20},
+                        ],
+                    },
+                    {
+                        "name": "Final",
+                        "weight": 60,
+                        "rule_type": "mandatory_pass",
+                        "rule_config": {"pass_threshold": "55"},
+                    },
+                ],
+            },
+        }
+    )
+
+    assert prepared.counts == (2, 2, 1)
+    labs, lab_1, lab_2, final = prepared.assessment_rows
+    assert labs["parent_assessment_id"] is None
+    assert lab_1["parent_assessment_id"] == lab_2["parent_assessment_id"] == labs["id"]
+    assert [lab_1["position"], lab_2["position"], final["position"]] == [0, 1, 1]
+    assert {row["course_id"] for row in prepared.assessment_rows} == {course_id}
+    [rule] = prepared.rule_rows
+    assert rule["assessment_id"] == final["id"]
+    assert rule["rule_config"] == {"pass_threshold": 55.0}
+
+
+def test_prepare_row_reports_bad_payloads_instead_of_raising():
+    assert _prepare_row({"id": uuid4(), "data": None}) == "no_payload"
+    assert _prepare_row({"id": uuid4(), "data": {"name": "x"}}).startswith("invalid_payload")
+    missing_threshold = _prepare_row(
+        {
+            "id": uuid4(),
+            "data": {
+                "name": "x",
+                "assessments": [{"name": "Final", "weight": 100, "rule_type": "mandatory_pass"}],
+            },
+        }
+    )
+    assert missing_threshold.startswith("invalid_")
+
+
+def test_stats_merge_sums_partitions():
+    failed_id = uuid4()
+    first = MigrationStats(
+        total_rows=3, migrated_courses=2, failed=1, failures=["a"], failed_course_ids=[failed_id]
+    )
+    second = MigrationStats(total_rows=4, migrated_courses=4, migrated_rules=2)
+    first.merge(second)
+    assert (first.total_rows, first.migrated_courses, first.failed) == (7, 6, 1)
+    assert first.migrated_rules == 2
+    assert first.failures == ["a"]
+    assert first.failed_course_ids == [failed_id]
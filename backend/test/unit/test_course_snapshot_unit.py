@@ -0,0 +1,118 @@
+from uuid import uuid4
+
+from app.models import Assessment, ChildAssessment, CourseCreate
+from app.repositories.postgres_course_mapper import (
+    COURSE_SNAPSHOT_FORMAT,
+    _trusted,
+    dump_course_snapshot,
+    load_course_snapshot,
+    snapshot_fallback_counts,
+)
+
+
+def _course() -> CourseCreate:
+    return CourseCreate(
+        name="EECS2311",
+        term="W26",
+        bonus_policy="capped",
+        bonus_cap_percentage=5,
+        assessments=[
+            Assessment(
+                assessment_id=uuid4(),
+                name="Labs",
+                weight=30,
+                children=[
+                    ChildAssessment(assessment_id=uuid4(), name="Lab 1", weight=15, raw_score=8, total_score=10),
+                    ChildAssessment(assessment_id=uuid4(), name="Lab 2", weight=15),
+                ],
+            ),
+            Assessment(
+                assessment_id=uuid4(),
+                name="Final",
+                weight=70,
+                rule_type="mandatory_pass",
+                rule_config={"pass_threshold": 50.0},
+            ),
+            Assessment(assessment_id=uuid4(), name="Bonus Quiz", weight=5, is_bonus=True),
+        ],
+    )
+
+
+def test_snapshot_round_trips_the_full_aggregate():
+    course = _course()
+    snapshot = dump_course_snapshot(course)
+
+    assert snapshot["format"] == COURSE_SNAPSHOT_FORMAT
+    assert load_course_snapshot(snapshot) == course
+
+
+def test_missing_or_foreign_snapshots_are_ignored():
+    snapshot = dump_course_snapshot(_course())
+
+    assert load_course_snapshot(None) is None
+    assert load_course_snapshot({**snapshot, "format": COURSE_SNAPSHOT_FORMAT + 1}) is None
+    assert load_course_snapshot({"format": COURSE_SNAPSHOT_FORMAT, "course": {"name": ""}}) is None
+
+
+def test_snapshot_loads_trusted_models_and_counts_fallbacks(caplog):
+    course = _course()
+    snapshot = dump_course_snapshot(course)
+    before = snapshot_fallback_counts()
+
+    loaded = load_course_snapshot(snapshot)
+    assert loaded == course
+    assert loaded.assessments[0].children[0].assessment_id == course.assessments[0].children[0].assessment_id
+
+    load_course_snapshot(None)
+    load_course_snapshot({**snapshot, "format": COURSE_SNAPSHOT_FORMAT + 1})
+    with caplog.at_level("WARNING"):
+        load_course_snapshot({"format": COURSE_SNAPSHOT_FORMAT, "course": {"name": "x"}})
+
+    after = snapshot_fallback_counts()
+    for reason in ("missing", "format", "malformed"):
+        assert after.get(reason, 0) == before.get(reason, 0) + 1
+    assert "malformed course snapshot" in caplog.text
+
+
+def test_trusted_construction_matches_validated_models():
+    validated = _course()
+    rebuilt = _trusted(
+        CourseCreate,
+        name=validated.name,
+        term=validated.term,
+        bonus_policy=validated.bonus_policy,
+        bonus_cap_percentage=validated.bonus_cap_percentage,
+        assessments=[
+            _trusted(
+                Assessment,
+                **{
+                    **assessment.__dict__,
+                    "children": [
+                        _trusted(ChildAssessment, **child.__dict__) for child in assessment.children
+                    ]
+                    if assessment.children
+                    else None,
+                },
+            )
+            for assessment in validated.assessments
+        ],
+    )
+
+    assert rebuilt == validated
+    assert rebuilt.model_dump() == validated.model_dump()
+    assert rebuilt.model_copy(deep=True) == validated
+
+
+def test_hydrated_models_fields_are_all_supplied():
+    # hydrate_course_aggregate passes every field explicitly; a new model field
+    # must be added there too, or trusted instances would lack the attribute.
+    assert set(CourseCreate.model_fields) == {
+        "name", "term", "bonus_policy", "bonus_cap_percentage", "assessments",
+    }
+    assert set(Assessment.model_fields) == {
+        "assessment_id", "name", "weight", "raw_score", "total_score",
+        "children", "rule_type", "rule_config", "is_bonus",
+    }
+    assert set(ChildAssessment.model_fields) == {
+        "assessment_id", "name", "weight", "raw_score", "total_score",
+    }
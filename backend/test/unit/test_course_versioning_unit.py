@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+import pytest
+
+from app.models import Assessment, CourseCreate
+from app.repositories.base import CourseVersionConflictError
+from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+from app.services.course_service import CourseConflictError, CourseService
+
+
+def _course(name: str = "EECS2311") -> CourseCreate:
+    return CourseCreate(
+        name=name,
+        term="W26",
+        assessments=[
+            Assessment(name="Midterm", weight=40),
+            Assessment(name="Final", weight=60),
+        ],
+    )
+
+
+def test_versions_start_at_one_and_increase_on_update():
+    repo = InMemoryCourseRepository()
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+    assert stored.version == 1
+
+    updated = repo.update(user_id=user_id, course_id=stored.course_id, course=_course(name="A"))
+    assert updated.version == 2
+    assert repo.get_version(user_id=user_id, course_id=stored.course_id) == 2
+    assert repo.get_by_id(user_id=user_id, course_id=stored.course_id).version == 2
+
+
+def test_update_with_stale_expected_version_is_rejected():
+    repo = InMemoryCourseRepository()
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+    repo.update(user_id=user_id, course_id=stored.course_id, course=_course(name="First"), expected_version=1)
+
+    with pytest.raises(CourseVersionConflictError):
+        repo.update(
+            user_id=user_id,
+            course_id=stored.course_id,
+            course=_course(name="Second"),
+            expected_version=1,
+        )
+    assert repo.get_by_id(user_id=user_id, course_id=stored.course_id).course.name == "First"
+
+
+class _InterleavingCourseRepository(InMemoryCourseRepository):
+    """Lets another writer commit between the service's read and its save."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.interleave = False
+
+    def get_by_id(self, user_id, course_id):
+        stored = super().get_by_id(user_id, course_id)
+        if stored is not None and self.interleave:
+            self.interleave = False
+            super().update(user_id, course_id, stored.course.model_copy(deep=True))
+        return stored
+
+
+def test_service_reports_lost_update_as_conflict():
+    repo = _InterleavingCourseRepository()
+    service = CourseService(repo)
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+
+    repo.interleave = True
+    with pytest.raises(CourseConflictError):
+        service.update_course_metadata(
+            user_id=user_id,
+            course_id=stored.course_id,
+            name="Renamed",
+            term="W26",
+        )
+    assert repo.get_by_id(user_id=user_id, course_id=stored.course_id).course.name == "EECS2311"
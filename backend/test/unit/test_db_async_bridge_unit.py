@@ -0,0 +1,57 @@
+import asyncio
+from uuid import uuid4
+
+from app import db_async
+from app.db import engine
+from app.repositories.async_adapter import AsyncRepositoryAdapter
+from app.repositories.inmemory_grade_target_repo import InMemoryGradeTargetRepository
+
+
+def _bound_engine():
+    with db_async.bridged_session_factory() as session:
+        return session.get_bind()
+
+
+def test_bridged_sessions_use_async_engine_only_inside_the_bridge():
+    assert _bound_engine() is engine
+
+    bridged = asyncio.run(db_async.run_in_async_session(_bound_engine))
+    assert bridged is db_async.get_async_engine().sync_engine
+
+    # The flag is scoped to the awaited call.
+    assert _bound_engine() is engine
+
+
+def test_run_in_async_session_propagates_exceptions():
+    def _boom():
+        raise KeyError("missing")
+
+    try:
+        asyncio.run(db_async.run_in_async_session(_boom))
+    except KeyError as exc:
+        assert "missing" in str(exc)
+    else:
+        raise AssertionError("expected KeyError")
+
+
+def test_async_repository_adapter_awaits_through_runner():
+    calls: list[str] = []
+
+    async def _runner(fn, *args, **kwargs):
+        calls.append(fn.__name__)
+        return fn(*args, **kwargs)
+
+    repo = InMemoryGradeTargetRepository()
+    adapter = AsyncRepositoryAdapter(repo, _runner)
+    user_id, course_id = uuid4(), uuid4()
+
+    async def _scenario():
+        await adapter.set_target(user_id=user_id, course_id=course_id, target_percentage=85.0)
+        return await adapter.get_target(user_id=user_id, course_id=course_id)
+
+    stored = asyncio.run(_scenario())
+
+    assert stored is not None
+    assert stored.target_percentage == 85.0
+    assert calls == ["set_target", "get_target"]
+    assert adapter.repository is repo
@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.db_pool import InstrumentedQueuePool
+
+
+def _engine(tmp_path, *, pool_size=1, max_overflow=1, pool_timeout=0.2):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+    )
+
+
+def test_pool_stats_track_checkouts_and_in_use(tmp_path):
+    engine = _engine(tmp_path)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        stats = engine.pool.stats()
+        assert stats["in_use"] == 1
+        assert stats["pool_size"] == 1
+
+    stats = engine.pool.stats()
+    assert stats["in_use"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["overflow_events"] == 0
+    assert stats["checkout_wait_ms_max"] >= 0
+
+
+def test_pool_counts_overflow_and_timeouts(tmp_path):
+    engine = _engine(tmp_path, pool_size=1, max_overflow=1, pool_timeout=0.1)
+
+    first = engine.connect()
+    second = engine.connect()
+    try:
+        assert engine.pool.stats()["overflow_events"] == 1
+        assert engine.pool.stats()["overflow"] == 1
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    finally:
+        second.close()
+        first.close()
+
+    stats = engine.pool.stats()
+    assert stats["checkout_timeouts"] == 1
+    assert stats["checkout_wait_ms_max"] >= 100
+
+
+def test_pool_records_wait_for_a_released_connection(tmp_path):
+    engine = _engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=2)
+    held = engine.connect()
+    released = threading.Event()
+
+    def _release_later():
+        released.wait(0.15)
+        held.close()
+
+    releaser = threading.Thread(target=_release_later)
+    releaser.start()
+    with engine.connect():
+        pass
+    releaser.join()
+
+    stats = engine.pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["checkout_wait_ms_max"] >= 100
+    assert stats["checkout_timeouts"] == 0
+
+
+def test_async_pool_is_sized_separately_from_sync_pool(monkeypatch):
+    from app import db
+
+    monkeypatch.setattr(db, "DATABASE_URL", "postgresql+psycopg://user:pw@localhost/evalio")
+    monkeypatch.setenv("POSTGRES_POOL_SIZE", "2")
+    monkeypatch.setenv("POSTGRES_MAX_OVERFLOW", "1")
+    monkeypatch.setenv("POSTGRES_ASYNC_POOL_SIZE", "7")
+    monkeypatch.setenv("POSTGRES_ASYNC_MAX_OVERFLOW", "4")
+
+    sync_kwargs = db._engine_kwargs(InstrumentedQueuePool)
+    async_kwargs = db._engine_kwargs(InstrumentedQueuePool, pool_env_prefix="POSTGRES_ASYNC")
+
+    assert (sync_kwargs["pool_size"], sync_kwargs["max_overflow"]) == (2, 1)
+    assert (async_kwargs["pool_size"], async_kwargs["max_overflow"]) == (7, 4)
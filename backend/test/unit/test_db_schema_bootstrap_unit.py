@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import create_engine, select
+
+from app.db import (
+    SCHEMA_MIGRATIONS,
+    SchemaMigration,
+    SchemaMigrationDB,
+    _apply_pending_migrations,
+)
+
+
+def _sqlite_connection():
+    engine = create_engine("sqlite://")
+    connection = engine.connect()
+    SchemaMigrationDB.__table__.create(bind=connection)
+    connection.commit()
+    return connection
+
+
+def test_pending_migrations_apply_once_and_are_recorded():
+    connection = _sqlite_connection()
+    calls: list[str] = []
+    migrations = (
+        SchemaMigration("0001_first", lambda _conn: calls.append("0001_first")),
+        SchemaMigration("0002_second", lambda _conn: calls.append("0002_second")),
+    )
+
+    applied = _apply_pending_migrations(connection, migrations)
+    assert applied == ["0001_first", "0002_second"]
+    assert calls == ["0001_first", "0002_second"]
+
+    recorded = set(connection.scalars(select(SchemaMigrationDB.version)).all())
+    assert recorded == {"0001_first", "0002_second"}
+
+    # Second startup: nothing left to do.
+    assert _apply_pending_migrations(connection, migrations) == []
+    assert calls == ["0001_first", "0002_second"]
+
+
+def test_only_new_migrations_run_after_history_grows():
+    connection = _sqlite_connection()
+    calls: list[str] = []
+    first = SchemaMigration("0001_first", lambda _conn: calls.append("0001_first"))
+    second = SchemaMigration("0002_second", lambda _conn: calls.append("0002_second"))
+
+    _apply_pending_migrations(connection, (first,))
+    applied = _apply_pending_migrations(connection, (first, second))
+
+    assert applied == ["0002_second"]
+    assert calls == ["0001_first", "0002_second"]
+
+
+def test_failed_migration_is_not_recorded():
+    connection = _sqlite_connection()
+
+    def _boom(_conn):
+        raise RuntimeError("ddl failed")
+
+    with pytest.raises(RuntimeError, match="ddl failed"):
+        _apply_pending_migrations(connection, (SchemaMigration("0001_broken", _boom),))
+
+    recorded = connection.scalars(select(SchemaMigrationDB.version)).all()
+    assert recorded == []
+
+
+def test_schema_migration_versions_are_unique_and_ordered():
+    versions = [migration.version for migration in SCHEMA_MIGRATIONS]
+    assert len(versions) == len(set(versions))
+    assert versions == sorted(versions)
+
+
+def test_non_transactional_migration_runs_outside_a_transaction():
+    connection = _sqlite_connection()
+    seen: list[bool] = []
+
+    def _record_autocommit(conn):
+        seen.append(conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT")
+
+    applied = _apply_pending_migrations(
+        connection,
+        (SchemaMigration("0001_concurrent", _record_autocommit, transactional=False),),
+    )
+
+    assert applied == ["0001_concurrent"]
+    assert seen == [True]
+    assert connection.get_execution_options().get("isolation_level") != "AUTOCOMMIT"
+    assert connection.scalars(select(SchemaMigrationDB.version)).all() == ["0001_concurrent"]
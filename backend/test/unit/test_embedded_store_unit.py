@@ -0,0 +1,204 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.models import Assessment, CourseCreate
+from app.models_deadline import DeadlineCreate, DeadlineUpdate
+from app.repositories.base import StoredScenarioEntry
+from app.repositories.embedded_repos import (
+    EmbeddedCalendarRepository,
+    EmbeddedCourseRepository,
+    EmbeddedDeadlineRepository,
+    EmbeddedGradeTargetRepository,
+    EmbeddedScenarioRepository,
+    EmbeddedUserRepository,
+)
+from app.repositories.embedded_store import EmbeddedStore, EmbeddedStoreError
+
+
+def _course(name: str = "EECS2311") -> CourseCreate:
+    return CourseCreate(
+        name=name,
+        term="W26",
+        assessments=[
+            Assessment(name="Midterm", weight=40, raw_score=31, total_score=40),
+            Assessment(name="Final", weight=60),
+        ],
+    )
+
+
+class _Repos:
+    def __init__(self, path, **store_options) -> None:
+        self.store = EmbeddedStore(path, **store_options)
+        self.courses = EmbeddedCourseRepository(self.store)
+        self.deadlines = EmbeddedDeadlineRepository(self.store)
+        self.scenarios = EmbeddedScenarioRepository(self.store)
+        self.users = EmbeddedUserRepository(self.store)
+        self.targets = EmbeddedGradeTargetRepository(self.store)
+        self.calendars = EmbeddedCalendarRepository(self.store)
+        self.store.open()
+
+
+def _reopen(repos: _Repos, **store_options) -> _Repos:
+    """Open the same directory again as a restarted process would after a crash.
+
+    A crashed process loses its lock with its descriptors; the store is not
+    closed, so nothing is flushed or compacted.
+    """
+    repos.store._release_lock()
+    return _Repos(repos.store.path, **store_options)
+
+
+def test_every_repository_survives_a_restart(tmp_path):
+    repos = _Repos(tmp_path)
+    user = repos.users.create_user("Student@Example.com", "hash")
+    course = repos.courses.create(user.user_id, _course())
+    course = repos.courses.update(user.user_id, course.course_id, _course("EECS3311"), expected_version=1)
+    deadline = repos.deadlines.create(
+        user.user_id, course.course_id, DeadlineCreate(title="A1", due_date="2026-03-01")
+    )
+    repos.deadlines.update(user.user_id, course.course_id, deadline.deadline_id, DeadlineUpdate(title="A1 v2"))
+    scenario = repos.scenarios.create(
+        user.user_id,
+        course.course_id,
+        "Best case",
+        [StoredScenarioEntry(assessment_id=uuid4(), assessment_name="Final", score=90.0)],
+    )
+    target = repos.targets.set_target(user.user_id, course.course_id, 85.0)
+    expiry = datetime(2026, 4, 1, tzinfo=UTC)
+    repos.calendars.create(user.user_id, "google", "access", "refresh", token_expiry=expiry)
+    repos.calendars.disconnect(user.user_id, "google")
+    # No close(): recovery must come from the log alone.
+
+    reopened = _reopen(repos)
+
+    assert reopened.users.get_by_email("student@example.com") == user
+    restored = reopened.courses.get_by_id(user.user_id, course.course_id)
+    assert restored == course
+    assert restored.version == 2
+    assert reopened.deadlines.get_by_id(user.user_id, course.course_id, deadline.deadline_id).title == "A1 v2"
+    assert reopened.scenarios.get_by_id(user.user_id, course.course_id, scenario.scenario_id) == scenario
+    assert reopened.targets.get_target(user.user_id, course.course_id) == target
+    connection = reopened.calendars.get_by_user_and_provider(user.user_id, "google")
+    assert connection is not None and connection.is_connected is False
+    assert reopened.calendars.get_tokens(user.user_id, "google") is None
+
+
+def test_listing_targets_returns_only_the_users_own(tmp_path):
+    repos = _Repos(tmp_path)
+    owner, other = uuid4(), uuid4()
+    mine = repos.targets.set_target(owner, uuid4(), 85.0)
+    repos.targets.set_target(other, uuid4(), 70.0)
+
+    assert repos.targets.list_targets(owner) == [mine]
+    assert _reopen(repos).targets.list_targets(owner) == [mine]
+
+
+def test_deletes_are_replayed(tmp_path):
+    repos = _Repos(tmp_path)
+    user_id = uuid4()
+    kept = repos.courses.create(user_id, _course("Kept"))
+    dropped = repos.courses.create(user_id, _course("Dropped"))
+    repos.courses.delete(user_id, dropped.course_id)
+
+    reopened = _reopen(repos)
+
+    assert [stored.course_id for stored in reopened.courses.list_all(user_id)] == [kept.course_id]
+    # New courses still sort after the replayed ones.
+    newer = reopened.courses.create(user_id, _course("Newer"))
+    assert newer.created_at > kept.created_at
+
+
+def test_snapshot_compacts_the_log(tmp_path):
+    repos = _Repos(tmp_path, snapshot_every=1_000_000)
+    user_id = uuid4()
+    course_ids = [repos.courses.create(user_id, _course(f"C{i}")).course_id for i in range(5)]
+    for course_id in course_ids[:3]:
+        repos.courses.delete(user_id, course_id)
+
+    repos.store.close()
+
+    snapshots = sorted(tmp_path.glob("snapshot-*.jsonl"))
+    assert [path.name for path in snapshots] == [f"snapshot-{8:016d}.jsonl"]
+    # Only live courses are kept; the deleted ones are gone from disk.
+    assert len(snapshots[0].read_bytes().splitlines()) == 2
+    assert all(path.stat().st_size == 0 for path in tmp_path.glob("wal-*.log"))
+
+    reopened = _Repos(tmp_path)
+    assert [stored.course_id for stored in reopened.courses.list_all(user_id)] == course_ids[3:]
+
+
+def test_writes_after_a_snapshot_are_replayed_on_top_of_it(tmp_path):
+    repos = _Repos(tmp_path)
+    user_id = uuid4()
+    first = repos.courses.create(user_id, _course("First"))
+    repos.store.compact()
+    second = repos.courses.create(user_id, _course("Second"))
+    repos.courses.update(user_id, first.course_id, _course("First v2"))
+
+    reopened = _reopen(repos)
+
+    names = [stored.course.name for stored in reopened.courses.list_all(user_id)]
+    assert names == ["First v2", "Second"]
+    assert reopened.courses.get_version(user_id, second.course_id) == 1
+
+
+def test_torn_tail_record_is_dropped(tmp_path):
+    repos = _Repos(tmp_path)
+    user_id = uuid4()
+    kept = repos.courses.create(user_id, _course())
+    segment = max(tmp_path.glob("wal-*.log"))
+    with open(segment, "ab") as fh:
+        fh.write(b'{"seq":2,"ns":"course","op":"put","da')
+
+    reopened = _reopen(repos)
+
+    assert [stored.course_id for stored in reopened.courses.list_all(user_id)] == [kept.course_id]
+    assert segment.read_bytes().endswith(b"\n")
+    reopened.courses.create(user_id, _course("After recovery"))
+    assert len(_reopen(reopened).courses.list_all(user_id)) == 2
+
+
+def test_concurrent_writers_share_flushes(tmp_path):
+    repos = _Repos(tmp_path, commit_delay_seconds=0.005)
+    barrier = threading.Barrier(8)
+
+    def register(i: int) -> None:
+        barrier.wait()
+        repos.users.create_user(f"user{i}@example.com", "hash")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(register, range(8)))
+
+    assert repos.store.commits == 8
+    assert repos.store.flushes < 8
+    reopened = _reopen(repos)
+    assert all(reopened.users.get_by_email(f"user{i}@example.com") for i in range(8))
+
+
+def test_failed_log_write_stops_further_writes(tmp_path, monkeypatch):
+    repos = _Repos(tmp_path)
+
+    def failing_fsync(fd):
+        raise OSError("disk gone")
+
+    monkeypatch.setattr("app.repositories.embedded_store.os.fsync", failing_fsync)
+    with pytest.raises(EmbeddedStoreError):
+        repos.users.create_user("a@example.com", "hash")
+    monkeypatch.undo()
+
+    with pytest.raises(EmbeddedStoreError):
+        repos.users.create_user("b@example.com", "hash")
+
+
+def test_a_second_process_cannot_open_the_same_directory(tmp_path):
+    repos = _Repos(tmp_path)
+
+    with pytest.raises(EmbeddedStoreError, match="another process"):
+        _Repos(tmp_path)
+
+    repos.store.close()
+    _Repos(tmp_path).store.close()
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services.extraction.executors import (
+    ClientDisconnectedError,
+    ExtractionExecutors,
+    ExtractionStageTimeoutError,
+)
+from app.services.extraction.ingest import ingest_text
+from app.services.extraction.orchestrator import ExtractionService
+
+
+class _DisconnectedRequest:
+    async def is_disconnected(self) -> bool:
+        return True
+
+
+def test_parse_stage_in_worker_process_matches_inline_ingest():
+    executors = ExtractionExecutors(parse_processes=1)
+    payload = b"Course Grading Breakdown\nMidterm 40%\nFinal Exam 60%\n"
+    try:
+        result = asyncio.run(
+            executors.ingest(filename="outline.txt", content_type="text/plain", file_bytes=payload)
+        )
+    finally:
+        executors.shutdown()
+
+    expected = ExtractionService()._extract_text(
+        filename="outline.txt", content_type="text/plain", file_bytes=payload
+    )
+    assert result == expected == ingest_text("outline.txt", "text/plain", payload)
+
+
+def test_llm_stage_timeout_raises_and_frees_the_caller():
+    executors = ExtractionExecutors(parse_processes=0, llm_threads=1, llm_timeout_seconds=0.05)
+    release = threading.Event()
+    try:
+        with pytest.raises(ExtractionStageTimeoutError) as excinfo:
+            asyncio.run(executors.run_io(release.wait, 5))
+    finally:
+        release.set()
+        executors.shutdown()
+    assert excinfo.value.stage == "llm"
+
+
+def test_client_disconnect_cancels_queued_work():
+    executors = ExtractionExecutors(parse_processes=0, llm_threads=1)
+    release = threading.Event()
+    ran: list[str] = []
+
+    async def scenario() -> None:
+        blocker = asyncio.ensure_future(executors.run_io(release.wait, 5))
+        await asyncio.sleep(0.01)
+        # The only thread is busy, so this call is still queued when the
+        # client goes away and must never run.
+        with pytest.raises(ClientDisconnectedError):
+            await executors.run_io(ran.append, "late", request=_DisconnectedRequest())
+        release.set()
+        await blocker
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executors.shutdown()
+    assert ran == []
+
+
+def test_app_shutdown_stops_the_extraction_pools(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.dependencies import get_extraction_executors
+    from app.main import app
+
+    order: list[str] = []
+    monkeypatch.setattr(
+        "app.main.get_extraction_job_queue",
+        lambda: type("_Queue", (), {"shutdown": lambda self: order.append("jobs")})(),
+    )
+    monkeypatch.setattr(get_extraction_executors(), "shutdown", lambda: order.append("executors"))
+
+    with TestClient(app):
+        pass
+
+    assert order == ["jobs", "executors"]
+
+
+def test_abandoned_parse_stage_submits_no_more_page_tasks():
+    from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+    from app.services.extraction.executors import _PageTasks
+
+    abandoned = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pages = _PageTasks(pool, abandoned, lambda _pool: None)
+        assert pages.submit(len, "abc").result() == 3
+
+        abandoned.set()
+        with pytest.raises(CancelledError):
+            pages.submit(len, "abc")
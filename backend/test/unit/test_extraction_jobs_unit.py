@@ -0,0 +1,160 @@
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+
+from app.models_extraction import ExtractionDiagnostics, ExtractionResponse
+from app.services.extraction_jobs import (
+    ExtractionJobLimitError,
+    ExtractionJobQueue,
+    ExtractionQueueFullError,
+)
+
+
+def _response() -> ExtractionResponse:
+    return ExtractionResponse(
+        diagnostics=ExtractionDiagnostics(
+            method="llm", ocr_used=False, confidence_score=90, confidence_level="High", stub=False
+        ),
+        structure_valid=True,
+        message="ok",
+    )
+
+
+class _GatedExtract:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+
+    def __call__(self, **_kwargs) -> ExtractionResponse:
+        self.started.release()
+        assert self.release.wait(5)
+        return _response()
+
+
+def _submit(queue: ExtractionJobQueue, user_id=None):
+    return queue.submit(
+        user_id=user_id or uuid4(),
+        filename="outline.pdf",
+        content_type="application/pdf",
+        file_bytes=b"%PDF",
+    )
+
+
+def test_queue_rejects_jobs_beyond_its_depth():
+    extract = _GatedExtract()
+    queue = ExtractionJobQueue(extract, workers=1, max_queued=2)
+    try:
+        _submit(queue)
+        assert extract.started.acquire(timeout=5)
+        _submit(queue)
+        _submit(queue)
+        with pytest.raises(ExtractionQueueFullError):
+            _submit(queue)
+
+        stats = queue.stats()
+        assert (stats["running"], stats["queued"], stats["rejected"]) == (1, 2, 1)
+    finally:
+        extract.release.set()
+        queue.shutdown(wait=True)
+
+
+def test_per_user_limit_counts_unfinished_jobs_only():
+    extract = _GatedExtract()
+    queue = ExtractionJobQueue(extract, workers=2, max_active_per_user=1)
+    user_id = uuid4()
+    try:
+        first = _submit(queue, user_id)
+        with pytest.raises(ExtractionJobLimitError):
+            _submit(queue, user_id)
+        _submit(queue)  # Other users are unaffected.
+
+        extract.release.set()
+        asyncio.run(_wait_finished(queue, first.job_id, user_id))
+        _submit(queue, user_id)
+    finally:
+        extract.release.set()
+        queue.shutdown(wait=True)
+
+
+def test_failed_extraction_is_reported_on_the_job():
+    def boom(**_kwargs):
+        raise RuntimeError("parser crashed")
+
+    queue = ExtractionJobQueue(boom, workers=1)
+    user_id = uuid4()
+    job = _submit(queue, user_id)
+    finished = asyncio.run(_wait_finished(queue, job.job_id, user_id))
+    queue.shutdown(wait=True)
+
+    assert finished.status == "failed"
+    assert "parser crashed" in finished.error
+    assert queue.stats()["failed"] == 1
+
+
+def test_waiters_are_woken_by_status_changes():
+    extract = _GatedExtract()
+    queue = ExtractionJobQueue(extract, workers=1)
+    user_id = uuid4()
+
+    async def follow():
+        job = _submit(queue, user_id)
+        seen = []
+        version = None
+        while True:
+            current = await queue.wait_for_update(job.job_id, user_id, seen_version=version, timeout=5)
+            if current.version == version:
+                raise AssertionError("timed out waiting for a status change")
+            version = current.version
+            seen.append(current.status)
+            if current.status == "running":
+                extract.release.set()
+            if current.status == "succeeded":
+                return seen
+
+    try:
+        assert asyncio.run(follow())[-2:] == ["running", "succeeded"]
+    finally:
+        extract.release.set()
+        queue.shutdown(wait=True)
+
+
+def test_shutdown_fails_queued_jobs_and_frees_their_slots():
+    extract = _GatedExtract()
+    queue = ExtractionJobQueue(extract, workers=1, max_queued=1, max_active_per_user=2)
+    user_id = uuid4()
+    running = _submit(queue, user_id)
+    assert extract.started.acquire(timeout=5)
+    queued = _submit(queue, user_id)
+
+    async def shut_down_while_watching():
+        watcher = asyncio.ensure_future(
+            queue.wait_for_update(queued.job_id, user_id, seen_version=queued.version, timeout=5)
+        )
+        await asyncio.sleep(0.05)
+        queue.shutdown()
+        return await watcher
+
+    try:
+        woken = asyncio.run(shut_down_while_watching())
+        assert woken.status == "failed"
+        assert woken.finished_at is not None
+        assert "shut down" in woken.error
+        assert queue.stats()["queued"] == 0
+    finally:
+        extract.release.set()
+    assert asyncio.run(_wait_finished(queue, running.job_id, user_id)).status == "succeeded"
+
+    # Neither the queue depth nor the user's limit still counts the failed job.
+    _submit(queue, user_id)
+    queue.shutdown(wait=True)
+
+
+async def _wait_finished(queue: ExtractionJobQueue, job_id, user_id):
+    version = None
+    while True:
+        job = await queue.wait_for_update(job_id, user_id, seen_version=version, timeout=5)
+        if job.status in {"succeeded", "failed"}:
+            return job
+        version = job.version
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from app.models_extraction import ExtractionAssessment, ExtractionDiagnostics, ExtractionResponse
+from app.services.extraction.executors import ExtractionExecutors
+from app.services.extraction.result_cache import ExtractionResultCache
+
+
+def _response(*, stub: bool = False, trigger_reasons: list[str] | None = None, padding: str = "") -> ExtractionResponse:
+    return ExtractionResponse(
+        course_code="EECS2311",
+        assessments=[ExtractionAssessment(name="Final" + padding, weight=100)],
+        diagnostics=ExtractionDiagnostics(
+            method="llm",
+            ocr_used=False,
+            confidence_score=90,
+            confidence_level="High",
+            trigger_reasons=trigger_reasons or [],
+            stub=stub,
+        ),
+        structure_valid=True,
+        message="ok",
+    )
+
+
+class _CountingService:
+    llm_model = "test-model"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def extract(self, **_kwargs) -> ExtractionResponse:
+        self.calls += 1
+        return _response()
+
+
+def test_results_are_shared_through_the_directory(tmp_path):
+    key = ExtractionResultCache.key_for(b"outline", filename="outline.pdf", model="m")
+    ExtractionResultCache(tmp_path).put(key, _response())
+
+    # A second instance stands in for another worker process.
+    other = ExtractionResultCache(tmp_path)
+    assert other.get(key) == _response()
+    assert other.get(ExtractionResultCache.key_for(b"other", filename="outline.pdf", model="m")) is None
+    assert (other.hits, other.misses) == (1, 1)
+
+
+def test_key_depends_on_model_and_filename_course_code():
+    base = ExtractionResultCache.key_for(b"outline", filename="outline.pdf", model="m")
+    assert ExtractionResultCache.key_for(b"outline", filename="syllabus.pdf", model="m") == base
+    assert ExtractionResultCache.key_for(b"outline", filename="outline.pdf", model="n") != base
+    assert ExtractionResultCache.key_for(b"outline", filename="EECS2311.pdf", model="m") != base
+
+
+@pytest.mark.parametrize(
+    ("setting", "value"),
+    [
+        ("pdf_early_stop", False),
+        ("pdf_early_stop_margin_pages", 5),
+        ("ocr_base_dpi", 200),
+        ("ocr_retry_dpi", 400),
+        ("ocr_min_confidence", 50.0),
+    ],
+)
+def test_key_depends_on_ingest_settings(monkeypatch, setting, value):
+    from app.services.extraction.text_ingest import TextIngestMixin
+
+    base = ExtractionResultCache.key_for(b"outline", filename="outline.pdf", model="m")
+    monkeypatch.setattr(TextIngestMixin, setting, value)
+    assert ExtractionResultCache.key_for(b"outline", filename="outline.pdf", model="m") != base
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    size = len(_response(padding="x" * 200).model_dump_json())
+    cache = ExtractionResultCache(tmp_path, max_bytes=size * 2)
+    cache.put("a", _response(padding="a" * 200))
+    cache.put("b", _response(padding="b" * 200))
+    assert cache.get("a") is not None
+
+    cache.put("c", _response(padding="c" * 200))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_failed_extractions_are_not_stored(tmp_path):
+    cache = ExtractionResultCache(tmp_path)
+    cache.put("stub", _response(stub=True))
+    cache.put("timeout", _response(trigger_reasons=["llm_timeout"]))
+    assert cache.stats()["entries"] == 0
+
+
+def test_executors_skip_both_stages_on_a_hit(tmp_path):
+    executors = ExtractionExecutors(parse_processes=0, result_cache=ExtractionResultCache(tmp_path))
+    service = _CountingService()
+    upload = {"filename": "outline.txt", "content_type": "text/plain", "file_bytes": b"Final 100%"}
+    try:
+        first = asyncio.run(executors.extract(service, **upload))
+        second = asyncio.run(executors.extract(service, **upload))
+        third = executors.extract_blocking(service, **upload)
+    finally:
+        executors.shutdown()
+
+    assert first == second == third
+    assert service.calls == 1
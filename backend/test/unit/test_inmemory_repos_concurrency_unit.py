@@ -0,0 +1,141 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from app.models import Assessment, CourseCreate
+from app.models_deadline import DeadlineCreate
+from app.repositories.base import CourseVersionConflictError
+from app.repositories.inmemory_course_repo import InMemoryCourseRepository
+from app.repositories.inmemory_deadline_repo import InMemoryDeadlineRepository
+from app.repositories.inmemory_user_repo import InMemoryUserRepository
+
+
+def _course(name: str = "EECS2311") -> CourseCreate:
+    return CourseCreate(
+        name=name,
+        term="W26",
+        assessments=[
+            Assessment(name="Midterm", weight=40),
+            Assessment(name="Final", weight=60),
+        ],
+    )
+
+
+def test_returned_course_is_a_copy_of_the_stored_one():
+    repo = InMemoryCourseRepository()
+    user_id = uuid4()
+    created = repo.create(user_id=user_id, course=_course())
+
+    created.course.assessments[0].raw_score = 99
+    fetched = repo.get_by_id(user_id=user_id, course_id=created.course_id)
+    fetched.course.name = "changed"
+
+    again = repo.get_by_id(user_id=user_id, course_id=created.course_id)
+    assert again.course.name == "EECS2311"
+    assert again.course.assessments[0].raw_score is None
+
+
+def test_saving_a_course_does_not_keep_a_reference_to_the_caller_object():
+    repo = InMemoryCourseRepository()
+    user_id = uuid4()
+    course = _course()
+    stored = repo.create(user_id=user_id, course=course)
+
+    course.name = "edited after save"
+
+    assert repo.get_by_id(user_id=user_id, course_id=stored.course_id).course.name == "EECS2311"
+
+
+def test_concurrent_creates_for_one_user_are_all_kept_in_order():
+    repo = InMemoryCourseRepository(lock_stripes=4)
+    user_id = uuid4()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: repo.create(user_id=user_id, course=_course(f"C{i}")), range(200)))
+
+    courses = repo.list_all(user_id)
+    assert len(courses) == 200
+    keys = [(stored.created_at, stored.course_id) for stored in courses]
+    assert keys == sorted(keys)
+
+
+def test_concurrent_versioned_updates_let_exactly_one_writer_win():
+    repo = InMemoryCourseRepository()
+    user_id = uuid4()
+    stored = repo.create(user_id=user_id, course=_course())
+    barrier = threading.Barrier(8)
+
+    def attempt(i: int) -> bool:
+        barrier.wait()
+        try:
+            repo.update(user_id, stored.course_id, _course(f"writer-{i}"), expected_version=1)
+        except CourseVersionConflictError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(attempt, range(8)))
+
+    assert results.count(True) == 1
+    assert repo.get_version(user_id, stored.course_id) == 2
+
+
+def test_readers_see_whole_deadline_buckets_while_writers_add_to_them():
+    repo = InMemoryDeadlineRepository()
+    user_id, course_id = uuid4(), uuid4()
+    batch = [DeadlineCreate(title=f"D{i}", due_date="2026-03-01") for i in range(5)]
+    done = threading.Event()
+    seen_sizes: set[int] = set()
+
+    def read() -> None:
+        while not done.is_set():
+            seen_sizes.add(len(repo.list_for_user(user_id)))
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for _ in range(50):
+            repo.create_many(user_id, course_id, batch)
+    finally:
+        done.set()
+        reader.join()
+
+    assert len(repo.list_all(user_id, course_id)) == 250
+    # create_many publishes once, so a reader never sees a partial batch.
+    assert all(size % 5 == 0 for size in seen_sizes)
+
+
+def test_concurrent_registration_of_one_email_creates_a_single_user():
+    repo = InMemoryUserRepository()
+    barrier = threading.Barrier(8)
+
+    def register(_: int) -> bool:
+        barrier.wait()
+        try:
+            repo.create_user(" Student@Example.com ", "hash")
+        except ValueError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(register, range(8)))
+
+    assert results.count(True) == 1
+    assert repo.get_by_email("student@example.com") is not None
+
+
+def test_clear_resets_every_repository():
+    courses, deadlines = InMemoryCourseRepository(), InMemoryDeadlineRepository()
+    user_id = uuid4()
+    stored = courses.create(user_id=user_id, course=_course())
+    deadlines.create(user_id, stored.course_id, DeadlineCreate(title="A1", due_date="2026-03-01"))
+
+    courses.clear()
+    deadlines.clear()
+
+    assert courses.list_all(user_id) == []
+    assert deadlines.list_for_user(user_id) == []
+    with pytest.raises(KeyError):
+        courses.delete(user_id, stored.course_id)
@@ -1,4 +1,9 @@
-from app.services.llm_extraction_client import LlmExtractionClient
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.llm_extraction_client import LlmExtractionClient, LlmExtractionError
 
 
 class _FakeMessage:
@@ -29,14 +34,50 @@ class _FakeChatCompletions:
         return _FakeChatCompletion('{"assessments":[],"deadlines":[]}')
 
 
+class _GatedChatCompletions(_FakeChatCompletions):
+    """Blocks every call until ``release`` is set, optionally failing."""
+
+    def __init__(self, *, error: Exception | None = None):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.error = error
+
+    def create(self, **kwargs):
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            self.call_count += 1
+            raise self.error
+        return super().create(**kwargs)
+
+
 class _FakeChat:
-    def __init__(self):
-        self.completions = _FakeChatCompletions()
+    def __init__(self, completions=None):
+        self.completions = completions or _FakeChatCompletions()
 
 
 class _FakeOpenAIWithoutResponses:
-    def __init__(self):
-        self.chat = _FakeChat()
+    def __init__(self, completions=None):
+        self.chat = _FakeChat(completions)
+
+
+def _extract_concurrently(llm_client, completions, callers: int) -> list:
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futures = [pool.submit(llm_client.extract, "Same outline text")]
+        assert completions.started.wait(5)
+        futures += [pool.submit(llm_client.extract, "Same outline text") for _ in range(callers - 1)]
+        # Let the followers reach the shared call before the leader finishes.
+        while llm_client._inflight.shared < callers - 1:
+            threading.Event().wait(0.001)
+        completions.release.set()
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
 
 
 def test_llm_client_adds_responses_compat_for_sdk_without_responses():
@@ -68,3 +109,43 @@ def test_llm_client_responses_compat_smoke_extract():
     assert "unit_weight" in assessment_props
     assert "rule_type" in assessment_props
     assert set(assessment_items["required"]) == set(assessment_props.keys())
+
+
+def test_concurrent_identical_extractions_share_one_llm_call():
+    completions = _GatedChatCompletions()
+    llm_client = LlmExtractionClient(client=_FakeOpenAIWithoutResponses(completions), timeout_seconds=20)
+
+    outcomes = _extract_concurrently(llm_client, completions, callers=6)
+
+    assert completions.call_count == 1
+    assert all(outcome == {"assessments": [], "deadlines": []} for outcome in outcomes)
+    assert llm_client.cache_stats()["coalesced_calls"] == 5
+    assert llm_client.cache_stats()["in_flight_calls"] == 0
+
+
+def test_shared_llm_failure_reaches_every_waiter():
+    completions = _GatedChatCompletions(error=RuntimeError("upstream down"))
+    llm_client = LlmExtractionClient(client=_FakeOpenAIWithoutResponses(completions), timeout_seconds=20)
+
+    outcomes = _extract_concurrently(llm_client, completions, callers=3)
+
+    assert all(isinstance(outcome, LlmExtractionError) for outcome in outcomes)
+    assert {outcome.reason_code for outcome in outcomes} == {"llm_call_failed"}
+    # The failure is not cached; the next upload tries again.
+    completions.error = None
+    assert llm_client.extract("Same outline text") == {"assessments": [], "deadlines": []}
+
+
+def test_waiter_gives_up_after_the_coalesce_timeout():
+    completions = _GatedChatCompletions()
+    llm_client = LlmExtractionClient(client=_FakeOpenAIWithoutResponses(completions), timeout_seconds=20)
+    llm_client.coalesce_timeout_seconds = 0.05
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(llm_client.extract, "Same outline text")
+        assert completions.started.wait(5)
+        with pytest.raises(LlmExtractionError) as excinfo:
+            llm_client.extract("Same outline text")
+        completions.release.set()
+        assert leader.result() == {"assessments": [], "deadlines": []}
+    assert excinfo.value.reason_code == "llm_timeout"
@@ -0,0 +1,86 @@
+import copy
+import threading
+
+import pytest
+
+from app.services.llm_payload_cache import FrozenDict, FrozenList, LlmPayloadCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _payload(name: str = "Final") -> dict:
+    return {"assessments": [{"name": name, "weight": 100, "children": []}], "deadlines": []}
+
+
+def test_hits_return_the_same_read_only_payload():
+    cache = LlmPayloadCache()
+    stored = cache.put("k", _payload())
+
+    hit = cache.get("k")
+
+    assert hit is stored
+    assert hit == _payload()
+    assert isinstance(hit, dict) and isinstance(hit["assessments"], list)
+    assert isinstance(hit, FrozenDict) and isinstance(hit["assessments"], FrozenList)
+    with pytest.raises(TypeError):
+        hit["assessments"].append({})
+    with pytest.raises(TypeError):
+        hit["assessments"][0]["name"] = "Changed"
+
+    editable = copy.deepcopy(hit)
+    editable["assessments"][0]["name"] = "Changed"
+    assert type(editable) is dict and cache.get("k") == _payload()
+    assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_least_recently_used_entry_is_evicted_by_count():
+    cache = LlmPayloadCache(max_entries=2)
+    cache.put("a", _payload("A"))
+    cache.put("b", _payload("B"))
+    cache.get("a")
+    cache.put("c", _payload("C"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_byte_budget_and_ttl_bound_the_cache():
+    clock = _Clock()
+    size = len('{"assessments":[{"name":"A","weight":100,"children":[]}],"deadlines":[]}')
+    cache = LlmPayloadCache(max_entries=100, max_bytes=size * 2, ttl_seconds=10, clock=clock)
+    for key in ("a", "b", "c"):
+        cache.put(key, _payload(key.upper()))
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] <= size * 2
+
+    clock.now = 10
+    assert cache.get("c") is None
+    assert cache.expirations == 1
+
+
+def test_concurrent_access_keeps_counters_consistent():
+    cache = LlmPayloadCache(max_entries=16)
+
+    def worker(offset: int) -> None:
+        for i in range(500):
+            key = str((offset + i) % 32)
+            if cache.get(key) is None:
+                cache.put(key, _payload(key))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8 * 500
+    assert stats["entries"] <= 16
+    assert stats["bytes"] == sum(size for _, size, _ in cache._entries.values())
@@ -0,0 +1,94 @@
+from PIL import Image
+
+from app.services.extraction import ocr_pages
+
+
+def _image(shade: int, dpi: int) -> Image.Image:
+    # Size follows dpi like a real render, so each dpi hashes differently.
+    return Image.new("L", (dpi // 10, dpi // 10), color=shade)
+
+
+def _patch(monkeypatch, *, confidence_by_dpi: dict[int, float], shades: dict[int, int]):
+    rendered: list[tuple[int, int]] = []
+    ocr_calls: list[tuple[int, int]] = []
+
+    def fake_render(_file_bytes, page_number, dpi):
+        rendered.append((page_number, dpi))
+        return _image(shades[page_number], dpi)
+
+    def fake_ocr(image):
+        dpi = image.size[0] * 10
+        ocr_calls.append((image.getpixel((0, 0)), dpi))
+        return f"shade {image.getpixel((0, 0))} at {dpi}", confidence_by_dpi[dpi]
+
+    ocr_pages.clear_cache()
+    monkeypatch.setattr(ocr_pages, "_render_page", fake_render)
+    monkeypatch.setattr(ocr_pages, "_ocr_image", fake_ocr)
+    return rendered, ocr_calls
+
+
+def test_text_and_confidence_rebuilds_lines_and_skips_non_words():
+    data = {
+        "text": ["", "Midterm", "30%", "", "Final", "50%"],
+        "conf": ["-1", "90", "80", "-1", "60", "70"],
+        "block_num": [1, 1, 1, 1, 1, 1],
+        "par_num": [1, 1, 1, 1, 1, 1],
+        "line_num": [0, 1, 1, 1, 2, 2],
+    }
+    text, confidence = ocr_pages.text_and_confidence(data)
+    assert text == "Midterm 30%\nFinal 50%"
+    assert confidence == 75.0
+
+
+def test_only_low_confidence_pages_are_rendered_again_at_higher_dpi(monkeypatch):
+    rendered, _ = _patch(monkeypatch, confidence_by_dpi={150: 40.0, 300: 85.0}, shades={1: 10, 2: 20})
+
+    page = ocr_pages.ocr_page(b"pdf", 1, base_dpi=150, retry_dpi=300, min_confidence=70)
+    assert page == {"text": "shade 10 at 300", "confidence": 85.0, "dpi": 300}
+    assert rendered == [(1, 150), (1, 300)]
+
+    rendered.clear()
+    page = ocr_pages.ocr_page(b"pdf", 2, base_dpi=150, retry_dpi=300, min_confidence=30)
+    assert page["dpi"] == 150
+    assert rendered == [(2, 150)]
+
+
+def test_identical_page_images_are_ocrd_once(monkeypatch):
+    _, ocr_calls = _patch(monkeypatch, confidence_by_dpi={150: 90.0}, shades={1: 10, 2: 10, 3: 30})
+
+    pages = ocr_pages.ocr_pages(b"pdf", 3, base_dpi=150, retry_dpi=300, min_confidence=70)
+
+    assert [page["text"] for page in pages] == ["shade 10 at 150", "shade 10 at 150", "shade 30 at 150"]
+    assert ocr_calls == [(10, 150), (30, 150)]
+
+
+def test_pages_are_ocrd_in_order_from_a_bounded_window(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    _patch(monkeypatch, confidence_by_dpi={150: 90.0}, shades={1: 10, 2: 20, 3: 30, 4: 40})
+    submitted: list[tuple] = []
+
+    class _Recording(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            submitted.append(args)
+            return super().submit(fn, *args, **kwargs)
+
+    with _Recording(max_workers=2) as pool:
+        pages = ocr_pages.ocr_pages(
+            "/tmp/upload.pdf", 4, base_dpi=150, retry_dpi=300, min_confidence=70, executor=pool, workers=2
+        )
+
+    assert [page["text"] for page in pages] == [f"shade {shade} at 150" for shade in (10, 20, 30, 40)]
+    # Each task carries the spooled path and one page number, never the bytes.
+    assert submitted == [("/tmp/upload.pdf", number) for number in range(1, 5)]
+
+
+def test_missing_ocr_packages_are_reported_without_importing_them(monkeypatch):
+    import importlib.util
+
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name: None if name == "pytesseract" else object(),
+    )
+    assert ocr_pages.missing_ocr_packages() == ["pytesseract"]
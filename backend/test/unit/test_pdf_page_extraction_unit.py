@@ -0,0 +1,239 @@
+import asyncio
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+import pytest
+
+from app.services.extraction.executors import ExtractionExecutors
+from app.services.extraction.ingest import _TextIngestor
+from app.services.extraction.orchestrator import ExtractionService
+from app.services.grading_section_filter import SectionAnchorTracker
+from app.services.extraction.pdf_pages import iter_pages_parallel, page_chunks, spooled_pdf
+
+
+def _pdf(page_texts: list[str]) -> bytes:
+    """A minimal PDF with Helvetica text; each page's lines are split on newlines."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b""]
+    kids = []
+    for text in page_texts:
+        shown = " ".join(f"({line}) Tj 0 -16 Td" for line in text.split("\n"))
+        stream = f"BT /F1 12 Tf 72 720 Td {shown} ET".encode()
+        page_id = len(objects) + 1
+        kids.append(f"{page_id} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {page_id + 1} 0 R >> >> /Contents {page_id + 2} 0 R >>".encode()
+        )
+        objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def test_page_chunks_cover_every_page_in_order():
+    chunks = page_chunks(45, workers=4)
+    assert chunks[0][0] == 0 and chunks[-1][1] == 45
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(chunks, chunks[1:]))
+    assert len(chunks) == 8
+    assert page_chunks(3, workers=4) == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_parallel_extraction_keeps_page_order_and_matches_sequential():
+    texts = [f"Week {n} Assignment {n} due" for n in range(1, 15)]
+    pdf = _pdf(texts)
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn")) as pool:
+        with spooled_pdf(pdf) as path:
+            assert list(iter_pages_parallel(path, len(texts), executor=pool, workers=2)) == texts
+
+        ingestor = _TextIngestor()
+        ingestor.page_executor = pool
+        ingestor.page_workers = 2
+        ingestor.pdf_parallel_min_pages = 10
+        in_pool = ingestor._extract_text_pdf(pdf)
+
+    sequential = _TextIngestor()._extract_text_pdf(pdf)
+    assert in_pool["text"] == sequential["text"] == "\n".join(texts)
+
+
+def test_parse_stage_splits_long_pdfs_across_its_own_pool():
+    texts = [f"Week {n} Assignment {n} due" for n in range(1, 15)]
+    pdf = _pdf(texts)
+    executors = ExtractionExecutors(parse_processes=2)
+    try:
+        # A thread coordinates; only the page tasks go to the process pool.
+        coordinator, _, _ = executors._parse_call("outline.pdf", "application/pdf", pdf)
+        assert coordinator is not executors._parse_executor()
+        result = asyncio.run(
+            executors.ingest(filename="outline.pdf", content_type="application/pdf", file_bytes=pdf)
+        )
+    finally:
+        executors.shutdown()
+
+    # Workers run ingest_text without a page executor, so they never start a pool.
+    assert _TextIngestor.page_executor is None
+    assert result["text"] == "\n".join(texts)
+
+
+def test_coordinator_parses_nothing_itself(monkeypatch):
+    from app.services.extraction import text_ingest
+
+    def _in_process(_source):
+        raise AssertionError("the coordinator opened the PDF")
+
+    monkeypatch.setattr(text_ingest, "open_pdf", _in_process)
+    texts = [f"Week {n} Assignment {n} due" for n in range(1, 15)]
+    ingestor = _TextIngestor()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ingestor.page_executor = pool
+        ingestor.page_workers = 2
+        result = ingestor._extract_text_pdf(_pdf(texts))
+
+    assert result["text"] == "\n".join(texts)
+
+
+def test_broken_pool_fails_the_read_instead_of_parsing_in_process(monkeypatch):
+    from app.services.extraction import text_ingest
+
+    class _BrokenPool(Executor):
+        def submit(self, fn, /, *args, **kwargs):
+            future = Future()
+            future.set_exception(BrokenExecutor("a worker died"))
+            return future
+
+    monkeypatch.setattr(text_ingest, "open_pdf", lambda _source: pytest.fail("parsed in process"))
+    ingestor = _TextIngestor()
+    ingestor.page_executor = _BrokenPool()
+
+    with pytest.raises(BrokenExecutor):
+        ingestor._extract_text_pdf(_pdf(["Grading\nFinal Exam 40%"]))
+
+
+def _outline_with_appendix(appendix_pages: int = 20) -> list[str]:
+    return [
+        "EECS 2311 Software Development Project\nInstructor: Example",
+        "Grading\nAssignments 30%\nMidterm 30%\nFinal Exam 40%",
+        "Course Schedule\nWeek 1 Introduction\nMidterm due October 10, 2026",
+        "Academic honesty policy",
+    ] + [f"Appendix page {n} university regulations" for n in range(appendix_pages)]
+
+
+def test_tracker_stops_after_both_sections_plus_margin():
+    tracker = SectionAnchorTracker(margin_pages=1)
+    pages = _outline_with_appendix()
+    stops = [tracker.feed(page) for page in pages[:5]]
+    assert (tracker.grading_page, tracker.schedule_page) == (1, 2)
+    assert stops == [False, False, False, True, True]
+
+    no_schedule = SectionAnchorTracker(margin_pages=0)
+    assert not any(no_schedule.feed(page) for page in pages[:2] + pages[3:])
+
+
+def test_lazy_ingestion_stops_early_and_full_text_stays_available():
+    pages = _outline_with_appendix()
+    pdf = _pdf(pages)
+    ingestor = _TextIngestor()
+    ingestor.pdf_early_stop_margin_pages = 1
+
+    lazy = ingestor._extract_text(filename="outline.pdf", content_type="application/pdf", file_bytes=pdf)
+    full = ingestor._extract_text(
+        filename="outline.pdf", content_type="application/pdf", file_bytes=pdf, early_stop=False
+    )
+
+    assert lazy["partial"] is True and full["partial"] is False
+    assert lazy["text"] == "\n".join(pages[:4])
+    assert full["text"] == "\n".join(pages)
+    assert any(warning.startswith("pdf_early_stop") for warning in lazy["parse_warnings"])
+
+
+def _outline_with_contents_page() -> list[str]:
+    return [
+        "EECS 2311 Software Development Project\nSchedule\nDeadlines",
+        "Table of Contents\nGrading\nCourse Schedule\nAcademic honesty",
+        "Contents continued\nGrading: 4\nCourse Schedule ........ 5",
+    ] + _outline_with_appendix()[1:]
+
+
+def test_contents_and_cover_pages_do_not_count_as_sections():
+    tracker = SectionAnchorTracker(margin_pages=0)
+    pages = _outline_with_contents_page()
+    stops = [tracker.feed(page) for page in pages[:5]]
+
+    assert (tracker.grading_page, tracker.schedule_page) == (3, 4)
+    assert stops == [False, False, False, False, True]
+
+
+def test_lazy_ingestion_reads_past_a_table_of_contents():
+    pages = _outline_with_contents_page()
+    ingestor = _TextIngestor()
+    ingestor.pdf_early_stop_margin_pages = 1
+
+    lazy = ingestor._extract_text(
+        filename="outline.pdf", content_type="application/pdf", file_bytes=_pdf(pages)
+    )
+
+    assert lazy["partial"] is True
+    assert lazy["text"] == "\n".join(pages[:6])
+    assert "Midterm due October 10, 2026" in lazy["text"]
+
+
+class _RecordingLlmClient:
+    model = "test-model"
+
+    def __init__(self) -> None:
+        self.inputs: list[str] = []
+
+    def extract(self, text: str) -> dict:
+        self.inputs.append(text)
+        # Too little weight, so the pipeline retries with the full text.
+        return {"assessments": [{"name": "Midterm", "weight": 30}], "deadlines": []}
+
+
+def test_full_text_retry_reads_the_pages_lazy_ingestion_skipped():
+    pages = _outline_with_appendix()
+    llm_client = _RecordingLlmClient()
+    service = ExtractionService(llm_client=llm_client)
+    service.pdf_early_stop_margin_pages = 1
+
+    service.extract(filename="outline.pdf", content_type="application/pdf", file_bytes=_pdf(pages))
+
+    assert len(llm_client.inputs) == 2
+    assert "Appendix page" not in llm_client.inputs[0]
+    assert "Appendix page 19" in llm_client.inputs[1]
+
+
+def test_full_text_reread_goes_back_through_the_parse_stage(monkeypatch):
+    pages = _outline_with_appendix()
+    llm_client = _RecordingLlmClient()
+    service = ExtractionService(llm_client=llm_client)
+
+    def _not_in_this_process(**_kwargs):
+        raise AssertionError("the API process should not extract text itself")
+
+    monkeypatch.setattr(service, "_extract_text", _not_in_this_process)
+    executors = ExtractionExecutors(parse_processes=2)
+    try:
+        asyncio.run(
+            executors.extract(
+                service,
+                filename="outline.pdf",
+                content_type="application/pdf",
+                file_bytes=_pdf(pages),
+            )
+        )
+    finally:
+        executors.shutdown()
+
+    assert len(llm_client.inputs) == 2
+    assert "Appendix page 19" not in llm_client.inputs[0]
+    assert "Appendix page 19" in llm_client.inputs[1]
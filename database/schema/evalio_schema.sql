@@ -67,6 +67,11 @@ CREATE TABLE courses (
     grade_type VARCHAR(20) DEFAULT 'numeric'
         CHECK (grade_type IN ('numeric','pass','fail','withdrawn')),
 
+    version INTEGER NOT NULL DEFAULT 1,
+
+    -- Denormalized CourseCreate aggregate; rebuildable from assessments/rules
+    snapshot JSONB,
+
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
     FOREIGN KEY (user_id)
@@ -87,6 +92,9 @@ ON courses(term);
 CREATE INDEX idx_courses_grade_type
 ON courses(grade_type);
 
+CREATE INDEX idx_courses_user_created
+ON courses(user_id, created_at, id);
+
 
 -- DEADLINES
 CREATE TABLE deadlines (
@@ -137,6 +145,9 @@ ON deadlines(due_date);
 CREATE INDEX idx_deadlines_assessment_id
 ON deadlines(assessment_id);
 
+CREATE INDEX idx_deadlines_course_due_order
+ON deadlines(course_id, due_date, created_at, id);
+
 
 
 -- DEADLINE EXPORTS
@@ -244,6 +255,14 @@ ON assessments(parent_assessment_id);
 CREATE INDEX idx_assessments_category_id
 ON assessments(category_id);
 
+CREATE INDEX idx_assessments_course_top_level_order
+ON assessments(course_id, position, created_at, id)
+WHERE parent_assessment_id IS NULL;
+
+CREATE INDEX idx_assessments_course_children_order
+ON assessments(course_id, parent_assessment_id, position, created_at, id)
+WHERE parent_assessment_id IS NOT NULL;
+
 
 
 -- RULES